@@ -9,6 +9,11 @@ import requests
 import json
 from datetime import datetime
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+import price_store
+import indicators
 
 # Config
 OPENAI_KEY = os.getenv("OPENAI_API_KEY", "")
@@ -44,26 +49,20 @@ print(f"   ✅ {company_data['name']}: ${company_data['price']}")
 
 # STEP 2: Calculate technicals
 print("\n📈 STEP 2: Calculating technical indicators...")
-hist = ticker.history(period="3mo")
-close = hist['Close']
-
-# RSI
-delta = close.diff()
-gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-rs = gain / loss
-rsi = 100 - (100 / (1 + rs))
+bars = price_store.history(TARGET_TICKER, 63)  # ~3 months of trading days, from local store
+close = bars['close']
 
-# SMAs
-sma_20 = close.rolling(window=20).mean().iloc[-1]
-sma_50 = close.rolling(window=50).mean().iloc[-1]
+# RSI + SMAs
+rsi = indicators.rsi(close, 14)[-1]
+sma_20 = indicators.sma(close, 20)[-1]
+sma_50 = indicators.sma(close, 50)[-1]
 
 technicals = {
-    "rsi": round(rsi.iloc[-1], 2),
-    "sma_20": round(sma_20, 2),
-    "sma_50": round(sma_50, 2),
-    "price_vs_sma20": round((close.iloc[-1]/sma_20 - 1) * 100, 2),
-    "price_vs_sma50": round((close.iloc[-1]/sma_50 - 1) * 100, 2),
+    "rsi": round(float(rsi), 2),
+    "sma_20": round(float(sma_20), 2),
+    "sma_50": round(float(sma_50), 2),
+    "price_vs_sma20": round(float(close[-1]/sma_20 - 1) * 100, 2),
+    "price_vs_sma50": round(float(close[-1]/sma_50 - 1) * 100, 2),
 }
 print(f"   ✅ RSI: {technicals['rsi']}, SMA20: ${technicals['sma_20']}")
 
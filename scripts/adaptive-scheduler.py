@@ -28,6 +28,9 @@ import sys
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 WORKSPACE = Path.home() / ".openclaw" / "workspace"
 SCHEDULE_FILE = WORKSPACE / "memory" / "scheduling-intelligence.json"
 FEEDBACK_FILE = WORKSPACE / "memory" / "feedback-log.jsonl"
@@ -88,30 +91,8 @@ def save_scheduler_state(state):
 
 def load_recent_engagement():
     """Load recent engagement signals from feedback log."""
-    if not FEEDBACK_FILE.exists():
-        return []
-    
-    entries = []
-    for line in FEEDBACK_FILE.read_text().strip().split('\n'):
-        if line:
-            try:
-                entries.append(json.loads(line))
-            except:
-                pass
-    
-    # Last 24 hours of entries
-    recent = []
-    cutoff = datetime.now(timezone.utc).timestamp() - 86400
-    for e in entries:
-        ts = e.get('timestamp') or e.get('ts')
-        if ts:
-            try:
-                entry_ts = datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp()
-                if entry_ts > cutoff:
-                    recent.append(e)
-            except:
-                pass
-    return recent
+    # Last 24 hours of entries (older segments are never read)
+    return EventLog(FEEDBACK_FILE).read(since=days_ago(1))
 
 def detect_burst_mode(state: dict) -> bool:
     """
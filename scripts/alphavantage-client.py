@@ -18,16 +18,21 @@ Usage:
     python3 alphavantage-client.py news NVDA
 
 Rate limit: 25 calls/day (free), 75 calls/min (premium)
+daily/sma/rsi read the local price store (scripts/price_store.py) and compute
+indicators locally, so they only spend quota on new bars. On the free tier
+those bars are unadjusted; ALPHAVANTAGE_PREMIUM=1 switches to adjusted history.
 """
 
 import os
 import sys
-import json
-import urllib.request
-import urllib.error
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import price_store
+import indicators
+
 BASE_URL = "https://www.alphavantage.co/query"
 
 def get_api_key() -> str:
@@ -54,19 +59,16 @@ def api_call(params: dict) -> dict:
         sys.exit(1)
     
     params['apikey'] = key
-    query = '&'.join(f"{k}={v}" for k, v in params.items())
-    url = f"{BASE_URL}?{query}"
     
     try:
-        with urllib.request.urlopen(url, timeout=15) as resp:
-            data = json.loads(resp.read().decode())
-            if 'Error Message' in data:
-                print(f"❌ API Error: {data['Error Message']}")
-                return None
-            if 'Note' in data:
-                print(f"⚠️ Rate limit: {data['Note']}")
-                return None
-            return data
+        data = market_http.get_json(BASE_URL, params, provider='alphavantage')
+        if 'Error Message' in data:
+            print(f"❌ API Error: {data['Error Message']}")
+            return None
+        if 'Note' in data:
+            print(f"⚠️ Rate limit: {data['Note']}")
+            return None
+        return data
     except Exception as e:
         print(f"❌ Request failed: {e}")
         return None
@@ -88,58 +90,49 @@ def quote(symbol: str):
     print(f"   Volume: {vol:,}")
 
 def daily(symbol: str, days: int = 10):
-    """Get daily price history."""
-    data = api_call({'function': 'TIME_SERIES_DAILY', 'symbol': symbol, 'outputsize': 'compact'})
-    if not data or 'Time Series (Daily)' not in data:
+    """Get daily price history (local price store, topped up from Alpha Vantage)."""
+    bars = price_store.PriceStore(source='alphavantage').history(symbol, days)
+    if not len(bars['date']):
         return
     
-    ts = data['Time Series (Daily)']
     print(f"📈 {symbol} Daily Prices (last {days} days)")
     print("-" * 50)
     
-    for i, (date, vals) in enumerate(list(ts.items())[:days]):
-        close = float(vals['4. close'])
-        vol = int(vals['5. volume'])
-        print(f"{date}: ${close:.2f} | Vol: {vol:,}")
+    for i in reversed(range(len(bars['date']))):
+        date = price_store.to_iso(bars['date'][i])
+        print(f"{date}: ${bars['close'][i]:.2f} | Vol: {int(bars['volume'][i]):,}")
+
+def local_indicator(symbol: str, fn, period: int, rows: int = 5):
+    """Latest (date, value) pairs of an indicator computed over stored daily closes."""
+    bars = price_store.PriceStore(source='alphavantage').history(symbol)
+    if len(bars['close']) <= period:
+        return []
+    values = fn(bars['close'], period)
+    return [(price_store.to_iso(bars['date'][i]), float(values[i]))
+            for i in range(len(values) - 1, max(len(values) - 1 - rows, period - 1), -1)]
 
 def sma(symbol: str, period: int = 20):
-    """Get Simple Moving Average."""
-    data = api_call({
-        'function': 'SMA',
-        'symbol': symbol,
-        'interval': 'daily',
-        'time_period': period,
-        'series_type': 'close'
-    })
-    if not data or 'Technical Analysis: SMA' not in data:
+    """Simple Moving Average (computed locally, no API call)."""
+    rows = local_indicator(symbol, indicators.sma, period)
+    if not rows:
         return
     
-    ta = data['Technical Analysis: SMA']
     print(f"📊 {symbol} SMA({period})")
     print("-" * 40)
     
-    for i, (date, vals) in enumerate(list(ta.items())[:5]):
-        sma_val = float(vals['SMA'])
+    for date, sma_val in rows:
         print(f"{date}: {sma_val:.2f}")
 
 def rsi(symbol: str, period: int = 14):
-    """Get Relative Strength Index."""
-    data = api_call({
-        'function': 'RSI',
-        'symbol': symbol,
-        'interval': 'daily',
-        'time_period': period,
-        'series_type': 'close'
-    })
-    if not data or 'Technical Analysis: RSI' not in data:
+    """Relative Strength Index (computed locally, no API call)."""
+    rows = local_indicator(symbol, indicators.rsi, period)
+    if not rows:
         return
     
-    ta = data['Technical Analysis: RSI']
     print(f"📊 {symbol} RSI({period})")
     print("-" * 40)
     
-    for i, (date, vals) in enumerate(list(ta.items())[:5]):
-        rsi_val = float(vals['RSI'])
+    for date, rsi_val in rows:
         status = '🔴 OVERBOUGHT' if rsi_val > 70 else '🟢 OVERSOLD' if rsi_val < 30 else '⚪ NEUTRAL'
         print(f"{date}: {rsi_val:.1f} {status}")
 
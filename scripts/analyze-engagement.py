@@ -17,25 +17,16 @@ from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 FEEDBACK_LOG = Path.home() / '.openclaw/workspace/memory/feedback-log.jsonl'
 SCHEDULING_FILE = Path.home() / '.openclaw/workspace/memory/scheduling-intelligence.json'
 
 
 def load_feedback():
     """Load feedback log entries."""
-    entries = []
-    if not FEEDBACK_LOG.exists():
-        return entries
-    
-    with open(FEEDBACK_LOG) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return entries
+    return EventLog(FEEDBACK_LOG).read()
 
 
 def analyze_patterns(entries):
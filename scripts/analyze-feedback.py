@@ -4,25 +4,16 @@ analyze-feedback.py - Analyze feedback patterns from feedback-log.jsonl
 Run weekly to identify what works and what doesn't.
 """
 
-import json
 from collections import Counter, defaultdict
 from datetime import datetime
 import sys
-import os
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
 
 def load_feedback(path="memory/feedback-log.jsonl"):
-    entries = []
-    if not os.path.exists(path):
-        return entries
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return entries
+    return EventLog(Path(path)).read()
 
 def analyze(entries):
     if not entries:
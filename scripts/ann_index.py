@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+ANN Index
+=========
+
+Approximate nearest-neighbour index (IVF, pure NumPy) for memory recall at scale.
+
+Vectors are clustered with spherical k-means into `nlist` cells; a query only
+scores the vectors in its `nprobe` closest cells. Exact brute force
+(vector_search.VectorIndex) stays the default for small indexes — this only
+pays off once there are tens of thousands of chunks.
+
+Supports incremental add/remove by string key (semantic-search uses the chunk
+content key), and persists to a single .npz file.
+
+Usage:
+    from ann_index import IVFIndex
+    index = IVFIndex.build(keys, matrix)              # train + add
+    index.add(new_keys, new_vectors)
+    index.remove(stale_keys)
+    hits = index.search(query_vec, top_k=5)           # [(score, key), ...]
+    index.save(path); index = IVFIndex.load(path)
+
+    python3 scripts/ann_index.py --benchmark 200000 384   # synthetic recall vs latency
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from vector_search import VectorIndex, normalize_rows, top_k_indices
+
+TRAIN_SAMPLE = 50000     # Max vectors used to fit centroids
+KMEANS_ITERS = 15
+RETRAIN_GROWTH = 4.0     # Retrain once the index is this many times its training size
+
+
+def default_nlist(n: int) -> int:
+    """Rule of thumb: ~4·sqrt(n) cells."""
+    return max(1, min(n, int(4 * np.sqrt(max(n, 1)))))
+
+
+def default_nprobe(nlist: int) -> int:
+    return max(1, min(nlist, max(8, nlist // 16)))
+
+
+def spherical_kmeans(vectors: np.ndarray, k: int, iters: int = KMEANS_ITERS, seed: int = 0) -> np.ndarray:
+    """Cluster unit vectors by cosine similarity; returns (k, dim) unit centroids."""
+    rng = np.random.default_rng(seed)
+    n = vectors.shape[0]
+    centroids = vectors[rng.choice(n, size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        counts = np.bincount(assign, minlength=k)
+        empty = counts == 0
+        if empty.any():
+            # Re-seed empty cells with random points so every cell stays usable
+            sums[empty] = vectors[rng.choice(n, size=int(empty.sum()), replace=False)]
+        centroids = normalize_rows(sums)
+    return centroids
+
+
+class IVFIndex:
+    """Inverted-file index over unit vectors, addressed by string keys."""
+
+    def __init__(self, centroids: np.ndarray, nprobe: Optional[int] = None):
+        self.centroids = normalize_rows(centroids)
+        self.nprobe = nprobe or default_nprobe(len(self.centroids))
+        dim = self.centroids.shape[1]
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.cell = np.zeros(0, dtype=np.int32)       # cell of each slot, -1 = deleted
+        self.keys: List[str] = []
+        self.key_to_slot: Dict[str, int] = {}
+        self.trained_size = 0
+        self._lists: Optional[List[np.ndarray]] = None
+
+    # === Construction ===
+
+    @classmethod
+    def build(cls, keys: Sequence[str], matrix, nlist: Optional[int] = None,
+              nprobe: Optional[int] = None) -> 'IVFIndex':
+        """Train centroids on (a sample of) matrix and add all rows."""
+        matrix = normalize_rows(matrix)
+        n = matrix.shape[0]
+        nlist = nlist or default_nlist(n)
+        if n > TRAIN_SAMPLE:
+            sample = matrix[np.random.default_rng(0).choice(n, TRAIN_SAMPLE, replace=False)]
+        else:
+            sample = matrix
+        index = cls(spherical_kmeans(sample, min(nlist, sample.shape[0])), nprobe)
+        index.add(keys, matrix)
+        index.trained_size = n
+        return index
+
+    def __len__(self) -> int:
+        return len(self.key_to_slot)
+
+    def needs_retrain(self) -> bool:
+        return len(self) > RETRAIN_GROWTH * max(self.trained_size, 1)
+
+    # === Incremental updates ===
+
+    def add(self, keys: Sequence[str], vectors) -> None:
+        """Insert (or replace) vectors under the given keys."""
+        if not len(keys):
+            return
+        vectors = normalize_rows(vectors)
+        last = {k: i for i, k in enumerate(keys)}  # Duplicate keys: last one wins
+        if len(last) < len(keys):
+            keys, vectors = list(last), vectors[list(last.values())]
+        self.remove([k for k in keys if k in self.key_to_slot])
+        cells = np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+        start = len(self.keys)
+        self.vectors = np.vstack([self.vectors, vectors])
+        self.cell = np.concatenate([self.cell, cells])
+        for i, key in enumerate(keys):
+            self.keys.append(key)
+            self.key_to_slot[key] = start + i
+        self._lists = None
+
+    def remove(self, keys: Sequence[str]) -> int:
+        """Delete keys (tombstoned until compact()). Returns number removed."""
+        removed = 0
+        for key in keys:
+            slot = self.key_to_slot.pop(key, None)
+            if slot is not None:
+                self.cell[slot] = -1
+                removed += 1
+        if removed:
+            self._lists = None
+            if (self.cell == -1).sum() > len(self.cell) // 2:
+                self.compact()
+        return removed
+
+    def compact(self) -> None:
+        """Drop tombstoned slots."""
+        alive = self.cell >= 0
+        self.vectors = self.vectors[alive]
+        self.cell = self.cell[alive]
+        self.keys = [k for k, a in zip(self.keys, alive) if a]
+        self.key_to_slot = {k: i for i, k in enumerate(self.keys)}
+        self._lists = None
+
+    # === Search ===
+
+    def _inverted_lists(self) -> List[np.ndarray]:
+        if self._lists is None:
+            alive = np.nonzero(self.cell >= 0)[0]
+            order = alive[np.argsort(self.cell[alive], kind='stable')]
+            bounds = np.searchsorted(self.cell[order], np.arange(len(self.centroids) + 1))
+            self._lists = [order[bounds[c]:bounds[c + 1]] for c in range(len(self.centroids))]
+        return self._lists
+
+    def search(self, query, top_k: int = 5, min_score: float = -1.0,
+               nprobe: Optional[int] = None) -> List[Tuple[float, str]]:
+        return self.search_batch(np.asarray(query).reshape(1, -1), top_k, min_score, nprobe)[0]
+
+    def search_batch(self, queries, top_k: int = 5, min_score: float = -1.0,
+                     nprobe: Optional[int] = None) -> List[List[Tuple[float, str]]]:
+        """Top-k (score, key) pairs per query, scoring only the nprobe nearest cells."""
+        queries = normalize_rows(queries)
+        lists = self._inverted_lists()
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        cell_scores = queries @ self.centroids.T
+
+        results = []
+        for q, cs in zip(queries, cell_scores):
+            probe = top_k_indices(cs, nprobe)
+            cand = np.concatenate([lists[c] for c in probe]) if len(probe) else np.empty(0, dtype=np.int64)
+            if not len(cand):
+                results.append([])
+                continue
+            scores = self.vectors[cand] @ q
+            hits = []
+            for i in top_k_indices(scores, top_k):
+                score = float(scores[i])
+                if score < min_score:
+                    break
+                hits.append((score, self.keys[cand[i]]))
+            results.append(hits)
+        return results
+
+    # === Persistence ===
+
+    def save(self, path: Path) -> None:
+        self.compact()
+        path = Path(path)
+        tmp = path.with_name(path.name + '.tmp.npz')
+        np.savez(tmp, centroids=self.centroids, vectors=self.vectors, cell=self.cell,
+                 keys=np.array(self.keys, dtype=str),
+                 params=np.array([self.nprobe, self.trained_size], dtype=np.int64))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'IVFIndex':
+        with np.load(path) as data:
+            nprobe, trained_size = (int(x) for x in data['params'])
+            index = cls(data['centroids'], nprobe)
+            index.vectors = data['vectors']
+            index.cell = data['cell']
+            index.keys = [str(k) for k in data['keys']]
+        index.key_to_slot = {k: i for i, k in enumerate(index.keys)}
+        index.trained_size = trained_size
+        return index
+
+
+# === Benchmark ===
+
+def benchmark(matrix, n_queries: int = 200, top_k: int = 10, nprobes: Sequence[int] = (1, 4, 8, 16, 32, 64),
+              queries=None, log=print) -> List[Dict]:
+    """Recall@k and per-query latency of IVF at several nprobe values vs exact scan."""
+    matrix = normalize_rows(matrix)
+    n = matrix.shape[0]
+    rng = np.random.default_rng(1)
+    if queries is None:
+        # Perturbed copies of stored rows, so queries have real neighbours
+        base = matrix[rng.choice(n, size=min(n_queries, n), replace=False)]
+        queries = base + 0.5 * rng.standard_normal(base.shape).astype(np.float32) / np.sqrt(matrix.shape[1])
+    queries = normalize_rows(queries)
+
+    exact = VectorIndex(matrix, normalized=True)
+    t0 = time.perf_counter()
+    truth = [[row for _, row in hits] for hits in exact.search_batch(queries, top_k)]
+    exact_ms = (time.perf_counter() - t0) * 1000 / len(queries)
+
+    t0 = time.perf_counter()
+    keys = [str(i) for i in range(n)]
+    ivf = IVFIndex.build(keys, matrix)
+    build_s = time.perf_counter() - t0
+    log(f"📐 n={n} dim={matrix.shape[1]} nlist={len(ivf.centroids)} build={build_s:.1f}s")
+    log(f"   exact scan: {exact_ms:.2f} ms/query")
+
+    rows = [{'nprobe': 0, 'recall': 1.0, 'ms_per_query': exact_ms}]
+    for nprobe in nprobes:
+        if nprobe > len(ivf.centroids):
+            break
+        t0 = time.perf_counter()
+        found = ivf.search_batch(queries, top_k, nprobe=nprobe)
+        ms = (time.perf_counter() - t0) * 1000 / len(queries)
+        recall = np.mean([len(set(int(k) for _, k in f) & set(t)) / max(len(t), 1)
+                          for f, t in zip(found, truth)])
+        rows.append({'nprobe': nprobe, 'recall': float(recall), 'ms_per_query': ms})
+        log(f"   nprobe={nprobe:<3} recall@{top_k}={recall:.3f}  {ms:.2f} ms/query  "
+            f"({exact_ms / ms:.1f}x vs exact)")
+    return rows
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == '--benchmark':
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+        dim = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+        rng = np.random.default_rng(0)
+        # Clustered synthetic data (real embeddings are far from uniform)
+        centers = rng.standard_normal((max(8, n // 500), dim)).astype(np.float32)
+        data = centers[rng.integers(0, len(centers), n)] + 0.6 * rng.standard_normal((n, dim)).astype(np.float32)
+        benchmark(data)
+    else:
+        print(__doc__)
@@ -29,6 +29,9 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 ANTIPATTERN_FILE = Path.home() / '.openclaw/workspace/ANTI-PATTERNS.md'
 REFLECTIONS_FILE = Path.home() / '.openclaw/workspace/memory/reflections.jsonl'
 PATTERN_LOG = Path.home() / '.openclaw/workspace/memory/antipattern-log.jsonl'
@@ -45,17 +48,7 @@ def load_antipatterns():
 
 def load_reflections(n=20):
     """Load recent reflections looking for failures."""
-    if not REFLECTIONS_FILE.exists():
-        return []
-    
-    reflections = []
-    with open(REFLECTIONS_FILE) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    reflections.append(json.loads(line))
-                except:
-                    pass
+    reflections = EventLog(REFLECTIONS_FILE).scan()
     
     # Filter for failures/partial outcomes
     failures = [r for r in reflections if r.get('outcome') in ('failure', 'partial')]
@@ -173,8 +166,7 @@ def add_antipattern(pattern: str, wrong: str, right: str):
         'wrong': wrong,
         'right': right
     }
-    with open(PATTERN_LOG, 'a') as f:
-        f.write(json.dumps(log_entry) + '\n')
+    EventLog(PATTERN_LOG).append(log_entry)
     
     print(f"✅ Added anti-pattern: {pattern}")
     return True
@@ -224,10 +216,9 @@ def stats():
     for p in patterns:
         print(f"  🚫 {p}")
     
-    if PATTERN_LOG.exists():
-        with open(PATTERN_LOG) as f:
-            logs = [json.loads(l) for l in f if l.strip()]
-        print(f"\nAuto-added patterns: {len(logs)}")
+    added = EventLog(PATTERN_LOG).count()
+    if added:
+        print(f"\nAuto-added patterns: {added}")
 
 def recent():
     """Show recent failures that could become anti-patterns."""
@@ -21,10 +21,13 @@ Usage:
 import json
 import sys
 import re
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 WORKSPACE = Path.home() / '.openclaw/workspace'
 CORRECTIONS_LOG = WORKSPACE / 'memory/corrections-log.jsonl'
 ANTIPATTERNS_FILE = WORKSPACE / 'ANTI-PATTERNS.md'
@@ -46,27 +49,7 @@ PATTERN_CATEGORIES = {
 
 def load_corrections(days=30):
     """Load corrections from log file."""
-    corrections = []
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    
-    if not CORRECTIONS_LOG.exists():
-        return corrections
-    
-    with open(CORRECTIONS_LOG) as f:
-        for line in f:
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                ts = entry.get('timestamp', '')
-                if ts:
-                    dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                    if dt > cutoff:
-                        corrections.append(entry)
-            except:
-                pass
-    
-    return corrections
+    return EventLog(CORRECTIONS_LOG).read(since=days_ago(days))
 
 
 def load_learned():
@@ -253,9 +236,7 @@ def log_correction(correction_type, context=''):
         'context': context,
     }
     
-    CORRECTIONS_LOG.parent.mkdir(parents=True, exist_ok=True)
-    with open(CORRECTIONS_LOG, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    EventLog(CORRECTIONS_LOG).append(entry)
     
     print(f"✅ Logged correction: {correction_type}")
     
@@ -9,6 +9,9 @@ import sys
 from pathlib import Path
 from datetime import datetime, timezone
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 WORKSPACE = Path.home() / '.openclaw' / 'workspace'
 CORRECTIONS_FILE = WORKSPACE / 'memory' / 'corrections-log.jsonl'
 PREFERENCES_FILE = WORKSPACE / 'memory' / 'preference-model.json'
@@ -90,28 +93,15 @@ def log_correction(correction_type: str, context: str):
         "type": correction_type,
         "context": context
     }
-    with open(CORRECTIONS_FILE, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    EventLog(CORRECTIONS_FILE).append(entry)
 
 def get_correction_stats(days: int = 7) -> dict:
     """Get correction statistics."""
-    if not CORRECTIONS_FILE.exists():
-        return {"total": 0, "by_type": {}, "daily_avg": 0}
-    
-    from datetime import timedelta
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    
-    corrections = []
-    for line in CORRECTIONS_FILE.read_text().strip().split('\n'):
-        if line:
-            entry = json.loads(line)
-            ts = datetime.fromisoformat(entry['ts'].replace('Z', '+00:00'))
-            if ts > cutoff:
-                corrections.append(entry)
+    corrections = EventLog(CORRECTIONS_FILE).read(since=days_ago(days))
     
     by_type = {}
     for c in corrections:
-        t = c['type']
+        t = c.get('type', 'unknown')
         by_type[t] = by_type.get(t, 0) + 1
     
     return {
@@ -127,45 +117,30 @@ def log_anticipation(anticipated: str, outcome: str = "pending"):
         "anticipated": anticipated,
         "outcome": outcome
     }
-    with open(ANTICIPATIONS_FILE, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    EventLog(ANTICIPATIONS_FILE).append(entry)
 
 def update_anticipation(anticipated: str, outcome: str):
     """Update an anticipation with its outcome."""
-    if not ANTICIPATIONS_FILE.exists():
-        return False
-    
-    lines = ANTICIPATIONS_FILE.read_text().strip().split('\n')
-    updated = False
-    new_lines = []
-    
-    for line in lines:
-        if line:
-            entry = json.loads(line)
-            if entry['anticipated'] == anticipated and entry['outcome'] == 'pending':
-                entry['outcome'] = outcome
-                entry['resolved_ts'] = datetime.now(timezone.utc).isoformat()
-                updated = True
-            new_lines.append(json.dumps(entry))
-    
-    ANTICIPATIONS_FILE.write_text('\n'.join(new_lines) + '\n')
-    return updated
+    resolved_ts = datetime.now(timezone.utc).isoformat()
+    
+    def resolve(entry):
+        if entry.get('anticipated') == anticipated and entry.get('outcome') == 'pending':
+            return dict(entry, outcome=outcome, resolved_ts=resolved_ts)
+        return entry
+    
+    # Only the segments holding a matching entry are rewritten
+    return EventLog(ANTICIPATIONS_FILE).rewrite(resolve) > 0
 
 def get_anticipation_accuracy() -> dict:
     """Calculate anticipation accuracy."""
-    if not ANTICIPATIONS_FILE.exists():
-        return {"total": 0, "correct": 0, "accuracy": 0}
-    
     total = 0
     correct = 0
     
-    for line in ANTICIPATIONS_FILE.read_text().strip().split('\n'):
-        if line:
-            entry = json.loads(line)
-            if entry['outcome'] != 'pending':
-                total += 1
-                if entry['outcome'] == 'correct':
-                    correct += 1
+    for entry in EventLog(ANTICIPATIONS_FILE).scan():
+        if entry.get('outcome', 'pending') != 'pending':
+            total += 1
+            if entry['outcome'] == 'correct':
+                correct += 1
     
     return {
         "total": total,
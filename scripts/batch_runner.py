@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Batch Runner
+============
+
+Run a per-symbol analysis over many tickers in one process.
+
+One interpreter, one key load, one market_http connection pool and one
+response-cache handle for the whole batch, instead of one process per
+ticker. Results stream to stdout as JSON lines in completion order;
+progress and the timing summary go to stderr so stdout stays machine-readable.
+
+Usage:
+    import batch_runner
+    symbols = batch_runner.parse_symbols('watchlist.txt')   # or 'NVDA,AMD,AVGO'
+    batch_runner.run_batch(symbols, analyze_fn, workers=4)
+
+    python3 scripts/stock-analyzer.py --symbols NVDA,AMD,AVGO
+    python3 scripts/deep-analyzer.py --symbols ~/watchlist.txt --workers 2
+
+Each output line:
+    {"symbol": "NVDA", "ok": true, "elapsed": 1.84, "result": {...}}
+    {"symbol": "XXXX", "ok": false, "elapsed": 0.12, "error": "..."}
+"""
+
+import re
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, TextIO
+
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+
+BATCH_WORKERS = 4   # Symbols analyzed at once; each analysis fans out its own requests
+
+
+def parse_symbols(spec: str) -> List[str]:
+    """Symbols from a file (one or more per line, # comments) or a comma/space list."""
+    path = Path(spec).expanduser()
+    if path.is_file():
+        text = '\n'.join(line.split('#', 1)[0] for line in path.read_text().splitlines())
+    else:
+        text = spec
+    symbols = [s.strip().upper() for s in re.split(r'[\s,]+', text) if s.strip()]
+    return list(dict.fromkeys(symbols))
+
+
+def option(argv: List[str], name: str, default: Optional[str] = None) -> Optional[str]:
+    """Value following a --flag in argv."""
+    if name in argv:
+        i = argv.index(name)
+        if i + 1 < len(argv):
+            return argv[i + 1]
+    return default
+
+
+def run_batch(symbols: List[str], analyze: Callable[[str], Dict], workers: int = BATCH_WORKERS,
+              out: TextIO = sys.stdout) -> List[Dict]:
+    """Run analyze(symbol) across a thread pool, streaming one JSON line per result.
+
+    A result dict containing an 'error' key counts as a failure. Returns the
+    per-symbol timing records (symbol, ok, elapsed) in completion order.
+    """
+    write_lock = threading.Lock()
+    timings: List[Dict] = []
+
+    def one(symbol: str) -> Dict:
+        t0 = time.perf_counter()
+        try:
+            result = analyze(symbol)
+            error = result.get('error') if isinstance(result, dict) else None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        record = {'symbol': symbol, 'ok': error is None, 'elapsed': round(time.perf_counter() - t0, 3)}
+        record.update({'error': error} if error else {'result': result})
+        return record
+
+    start = time.perf_counter()
+    print(f"📦 Batch: {len(symbols)} symbols, {workers} workers", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(symbols) or 1))) as pool:
+        futures = [pool.submit(one, s) for s in symbols]
+        for future in as_completed(futures):
+            record = future.result()
+            with write_lock:
+                out.write(json.dumps(record, default=str) + '\n')
+                out.flush()
+            timings.append({k: record[k] for k in ('symbol', 'ok', 'elapsed')})
+
+    print_summary(timings, time.perf_counter() - start)
+    return timings
+
+
+def print_summary(timings: List[Dict], wall: float, file: TextIO = sys.stderr) -> None:
+    """Per-symbol timing table plus batch totals."""
+    if not timings:
+        print("⚠️ No symbols", file=file)
+        return
+    print("\n⏱️ Per-symbol timing", file=file)
+    for t in sorted(timings, key=lambda t: -t['elapsed']):
+        status = '✅' if t['ok'] else '❌'
+        print(f"   {status} {t['symbol']:<8} {t['elapsed']:>7.2f}s", file=file)
+    total = sum(t['elapsed'] for t in timings)
+    failed = sum(1 for t in timings if not t['ok'])
+    http = market_http.stats()
+    print(f"   {len(timings)} symbols in {wall:.2f}s wall ({total:.2f}s summed, "
+          f"{total / wall if wall else 0:.1f}x), {failed} failed", file=file)
+    print(f"   HTTP: {http['requests']} requests, {http['connections_opened']} connections opened, "
+          f"{http['reused']} reused", file=file)
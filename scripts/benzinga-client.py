@@ -24,12 +24,14 @@ Official Python lib: pip install benzingaorg
 import os
 import sys
 import json
-import urllib.request
-import urllib.error
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from datetime import datetime, timedelta
 
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import response_cache
+
 # Base URLs for different Benzinga APIs
 BASE_URL = "https://api.benzinga.com/api/v2"
 NEWS_URL = "https://api.benzinga.com/api/v2/news"
@@ -73,21 +75,14 @@ def _request(url: str, params: dict = None) -> Any:
     if API_KEY is None:
         init()
     
-    # Build query string with token
+    # Token goes in the query string; None params are dropped
     params = params or {}
     params['token'] = API_KEY
-    query = '&'.join(f"{k}={v}" for k, v in params.items() if v is not None)
-    full_url = f"{url}?{query}" if query else url
-    
-    req = urllib.request.Request(full_url)
-    req.add_header('Accept', 'application/json')
     
     try:
-        with urllib.request.urlopen(req, timeout=15) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {e.reason}", "detail": body}
+        return response_cache.get_json(url, params, provider='benzinga')
+    except market_http.HttpError as e:
+        return {"error": f"HTTP {e.status}: {e.reason}", "detail": e.body}
     except Exception as e:
         return {"error": str(e)}
 
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+BM25 Index
+==========
+
+Persistent inverted index (Okapi BM25) over semantic-search chunks, plus
+reciprocal-rank fusion (RRF) of lexical and vector rankings.
+
+Stdlib only, so keyword recall keeps working when numpy/openai are missing
+or the embeddings API is unreachable.
+
+Docs are keyed by chunk content key (see embed_ingest.content_key), which
+makes sync() incremental: only chunks that appeared or disappeared since the
+last sync touch the postings.
+
+Usage:
+    from bm25_index import BM25Index, rrf_fuse
+    index = BM25Index.load(path)
+    index.sync(chunks)                    # chunks need 'key' + 'text'
+    index.save(path)
+    hits = index.search("tencent earnings", top_k=10)    # [(score, key), ...]
+    fused = rrf_fuse([vector_keys, lexical_keys])        # [(rrf, key), ...]
+"""
+
+import re
+import json
+import math
+import os
+from pathlib import Path
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+K1 = 1.2
+B = 0.75
+RRF_K = 60
+PREVIEW_CHARS = 200
+
+TOKEN_RE = re.compile(r"[\w$%.]+", re.UNICODE)
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'has', 'have',
+    'he', 'i', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to',
+    'was', 'we', 'were', 'what', 'when', 'which', 'who', 'will', 'with', 'you', 'about',
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, stopwords and 1-char tokens dropped."""
+    tokens = []
+    for tok in TOKEN_RE.findall(text.lower()):
+        tok = tok.strip('.')
+        if len(tok) > 1 and tok not in STOPWORDS:
+            tokens.append(tok)
+    return tokens
+
+
+def rrf_fuse(rankings: Sequence[Sequence[str]], k: int = RRF_K) -> List[Tuple[float, str]]:
+    """Reciprocal-rank fusion: sum of 1/(k + rank) across ranked key lists."""
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, 1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(((s, key) for key, s in scores.items()), reverse=True)
+
+
+class BM25Index:
+    """Inverted index: term -> {doc key: term frequency}."""
+
+    def __init__(self):
+        self.docs: Dict[str, Dict] = {}          # key -> {len, terms, file, start_line, end_line, preview}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.total_len = 0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # === Maintenance ===
+
+    def add(self, key: str, chunk: Dict) -> None:
+        if key in self.docs:
+            return
+        counts = Counter(tokenize(chunk['text']))
+        length = sum(counts.values())
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[key] = tf
+        text = chunk['text']
+        self.docs[key] = {
+            'len': length,
+            'terms': list(counts),
+            'file': chunk.get('file', ''),
+            'start_line': chunk.get('start_line'),
+            'end_line': chunk.get('end_line'),
+            'preview': text[:PREVIEW_CHARS] + '...' if len(text) > PREVIEW_CHARS else text,
+        }
+        self.total_len += length
+
+    def remove(self, key: str) -> None:
+        doc = self.docs.pop(key, None)
+        if doc is None:
+            return
+        for term in doc['terms']:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self.postings[term]
+        self.total_len -= doc['len']
+
+    def sync(self, chunks: Sequence[Dict]) -> Tuple[int, int]:
+        """Make the index cover exactly these chunks. Returns (added, removed)."""
+        wanted = {c['key']: c for c in chunks}
+        stale = [k for k in self.docs if k not in wanted]
+        for key in stale:
+            self.remove(key)
+        added = 0
+        for key, chunk in wanted.items():
+            if key not in self.docs:
+                self.add(key, chunk)
+                added += 1
+        return added, len(stale)
+
+    # === Query ===
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[float, str]]:
+        """BM25-ranked (score, key) pairs."""
+        n = len(self.docs)
+        if not n:
+            return []
+        avg_len = self.total_len / n or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for key, tf in posting.items():
+                norm = tf + K1 * (1 - B + B * self.docs[key]['len'] / avg_len)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / norm
+        return sorted(((s, k) for k, s in scores.items()), reverse=True)[:top_k]
+
+    # === Persistence ===
+
+    @classmethod
+    def load(cls, path: Path) -> 'BM25Index':
+        index = cls()
+        path = Path(path)
+        if path.exists():
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                index.docs = data['docs']
+                index.postings = data['postings']
+                index.total_len = sum(d['len'] for d in index.docs.values())
+            except (json.JSONDecodeError, KeyError):
+                return cls()
+        return index
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'docs': self.docs, 'postings': self.postings}, f, separators=(',', ':'))
+        os.replace(tmp, path)
@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 """
 Daily Cost Tracker
-Logs estimated API and infrastructure costs to Excel
+Logs API and infrastructure costs per day in the cost rollup database
+(cost_rollup). Model fees come from the rolled-up session transcripts when
+there is data for the day, else from a heuristic estimate. The Excel
+workbook is an export, written by `cost-tracker.py export`.
 """
 
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
 import os
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent))
+from cost_rollup import CostRollup, DB_FILE
+
 EXCEL_PATH = Path(__file__).parent.parent / 'data' / 'cost-tracker.xlsx'
-EXCEL_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 # Cost estimates (adjust as needed)
 COSTS = {
@@ -26,6 +29,9 @@ COSTS = {
 
 def create_workbook():
     """Create new workbook with headers"""
+    import openpyxl
+    from openpyxl.styles import Font, Alignment, PatternFill
+    
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Daily Costs"
@@ -51,11 +57,43 @@ def create_workbook():
     
     return wb
 
-def load_or_create_workbook():
-    """Load existing or create new workbook"""
-    if EXCEL_PATH.exists():
-        return openpyxl.load_workbook(EXCEL_PATH)
-    return create_workbook()
+def open_db() -> CostRollup:
+    """Rollup database, topped up from the transcripts; imports the legacy workbook once"""
+    db = CostRollup()
+    db.update()
+    if not db.ledger() and EXCEL_PATH.exists():
+        import_workbook(db)
+    return db
+
+def import_workbook(db: CostRollup):
+    """One-time import of entries from the pre-database workbook"""
+    import openpyxl
+    
+    ws = openpyxl.load_workbook(EXCEL_PATH).active
+    for row in range(2, ws.max_row + 1):
+        date = ws.cell(row=row, column=1).value
+        if not date:
+            continue
+        db.set_extra(str(date)[:10],
+                     aws=ws.cell(row=row, column=3).value or 0,
+                     other=ws.cell(row=row, column=4).value or 0,
+                     notes=ws.cell(row=row, column=6).value or "",
+                     model_fees=ws.cell(row=row, column=2).value)
+
+def export_workbook(db: CostRollup) -> Path:
+    """Write every entry to the Excel workbook in one go"""
+    wb = create_workbook()
+    ws = wb.active
+    for i, e in enumerate(db.ledger(), 2):
+        total = e["model_fees"] + e["aws"] + e["other"]
+        values = [e["day"], round(e["model_fees"], 2), e["aws"], e["other"], round(total, 2), e["notes"]]
+        for col, value in enumerate(values, 1):
+            ws.cell(row=i, column=col, value=value)
+        for col in [2, 3, 4, 5]:
+            ws.cell(row=i, column=col).number_format = '#,##0.00'
+    EXCEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(EXCEL_PATH)
+    return EXCEL_PATH
 
 def estimate_model_costs(date_str: str = None) -> tuple:
     """
@@ -103,54 +141,44 @@ def estimate_model_costs(date_str: str = None) -> tuple:
 def add_entry(date_str: str, model_fees: float = None, aws: float = None, 
               other: float = 0, notes: str = ""):
     """Add a cost entry for a date"""
-    wb = load_or_create_workbook()
-    ws = wb.active
-    
-    # Find next row
-    next_row = ws.max_row + 1
+    db = open_db()
     
     # Check if date already exists
-    for row in range(2, ws.max_row + 1):
-        if ws.cell(row=row, column=1).value == date_str:
-            print(f"Entry for {date_str} already exists (row {row})")
-            return False
+    if db.extra(date_str):
+        print(f"Entry for {date_str} already exists")
+        return False
     
-    # Estimate costs if not provided
-    if model_fees is None:
+    # Actual model cost from the rollup; estimate only when there is no data
+    live = model_fees is None and db.model_cost(date_str) is not None
+    if live:
+        fees = db.model_cost(date_str)
+        if not notes:
+            notes = "Actual (session transcripts)"
+    elif model_fees is None:
         model_fees, auto_notes = estimate_model_costs(date_str)
+        fees = model_fees
         if not notes:
             notes = auto_notes
+    else:
+        fees = model_fees
     
     if aws is None:
         aws = COSTS["aws_ec2_daily"]
     
-    total = model_fees + aws + other
-    
-    # Add row
-    ws.cell(row=next_row, column=1, value=date_str)
-    ws.cell(row=next_row, column=2, value=model_fees)
-    ws.cell(row=next_row, column=3, value=aws)
-    ws.cell(row=next_row, column=4, value=other)
-    ws.cell(row=next_row, column=5, value=round(total, 2))
-    ws.cell(row=next_row, column=6, value=notes)
+    total = fees + aws + other
     
-    # Format numbers
-    for col in [2, 3, 4, 5]:
-        ws.cell(row=next_row, column=col).number_format = '#,##0.00'
-    
-    wb.save(EXCEL_PATH)
-    print(f"Added entry: {date_str} | Models: ${model_fees:.2f} | AWS: ${aws:.2f} | Total: ${total:.2f}")
+    db.set_extra(date_str, aws=aws, other=other, notes=notes,
+                 model_fees=None if live else model_fees)
+    print(f"Added entry: {date_str} | Models: ${fees:.2f} | AWS: ${aws:.2f} | Total: ${total:.2f}")
     return True
 
 def show_summary():
     """Show cost summary"""
-    if not EXCEL_PATH.exists():
+    entries = open_db().ledger()
+    if not entries:
         print("No cost data yet")
         return
     
-    wb = openpyxl.load_workbook(EXCEL_PATH)
-    ws = wb.active
-    
     total_model = 0
     total_aws = 0
     total_other = 0
@@ -160,19 +188,13 @@ def show_summary():
     print("COST TRACKER SUMMARY")
     print("=" * 60)
     
-    for row in range(2, ws.max_row + 1):
-        date = ws.cell(row=row, column=1).value
-        model = ws.cell(row=row, column=2).value or 0
-        aws = ws.cell(row=row, column=3).value or 0
-        other = ws.cell(row=row, column=4).value or 0
-        total = ws.cell(row=row, column=5).value or 0
-        notes = ws.cell(row=row, column=6).value or ""
+    for e in entries:
+        total = e["model_fees"] + e["aws"] + e["other"]
+        print(f"{e['day']}: ${total:.2f} ({e['notes'][:30]})")
         
-        print(f"{date}: ${total:.2f} ({notes[:30]})")
-        
-        total_model += model
-        total_aws += aws
-        total_other += other
+        total_model += e["model_fees"]
+        total_aws += e["aws"]
+        total_other += e["other"]
         count += 1
     
     print("-" * 60)
@@ -189,7 +211,8 @@ def main():
         print("  cost-tracker.py yesterday       # Add yesterday's entry")
         print("  cost-tracker.py today           # Add today's entry")
         print("  cost-tracker.py summary         # Show summary")
-        print("  cost-tracker.py path            # Show Excel path")
+        print("  cost-tracker.py export          # Write the Excel workbook")
+        print("  cost-tracker.py path            # Show database and Excel paths")
         sys.exit(1)
     
     cmd = sys.argv[1].lower()
@@ -205,7 +228,11 @@ def main():
     elif cmd == "summary":
         show_summary()
     
+    elif cmd == "export":
+        print(f"Exported to {export_workbook(open_db())}")
+    
     elif cmd == "path":
+        print(DB_FILE)
         print(EXCEL_PATH)
     
     elif cmd == "add":
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Cost Rollup
+===========
+
+Embedded (SQLite) store of model usage and cost aggregates, updated
+incrementally from the OpenClaw session transcripts. Shared by
+real-cost-tracker, cost-tracker, turn-cost and daily-status-report, so a
+90-day trend is one indexed query instead of a re-scan of every session.
+
+Tables:
+- hourly:   (hour, session, model) -> cost, turns, tokens by type
+- daily:    (SGT day, model)       -> cost, turns, tokens by type
+- models:   model                  -> lifetime totals
+- sessions: session                -> totals, first/last turn, min/max turn
+                                      cost, turn cost distribution
+- cursors:  per transcript inode + byte offset already rolled up
+- daily_extra: manual per-day AWS / other costs, notes and optional model
+               fee override (cost-tracker)
+
+Transcripts are append-only; update() reads only lines past each cursor
+(session_tail helpers). A replaced or truncated transcript has its previous
+contribution subtracted and is rolled up again from byte 0.
+
+Usage:
+    import cost_rollup
+    db = cost_rollup.CostRollup()
+    db.update()
+    db.daily(days=90)             # [{'day', 'cost', 'turns', ...}] oldest first
+    db.by_model(since=ts)         # [{'model', 'cost', ...}] biggest first
+    db.sessions(since=ts)         # per-session cost inside the window
+
+    python3 scripts/cost_rollup.py --update | --rebuild
+    python3 scripts/cost_rollup.py trend [DAYS]
+    python3 scripts/cost_rollup.py models [DAYS]
+"""
+
+import sys
+import time
+import sqlite3
+from pathlib import Path
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from session_tail import SESSIONS_DIR, COST_BUCKETS, read_lines, parse_usage, start_offset
+from session_index import to_epoch
+
+DB_FILE = Path.home() / '.openclaw/workspace/memory/.cost-rollup.db'
+SGT = ZoneInfo("Asia/Singapore")
+
+TOKENS = ('input', 'output', 'cache_read', 'cache_write')
+MEASURES = ('cost', 'turns') + TOKENS
+BUCKET_COLS = tuple(f'bucket{i}' for i in range(len(COST_BUCKETS)))
+
+
+def sgt_day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, SGT).strftime('%Y-%m-%d')
+
+
+def day_start(days_ago: int) -> float:
+    """Epoch of SGT midnight days_ago days before today."""
+    today = datetime.now(SGT).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (today - timedelta(days=days_ago)).timestamp()
+
+
+def _bucket(cost: float) -> str:
+    return BUCKET_COLS[[i for i, (_, lower) in enumerate(COST_BUCKETS) if cost >= lower][-1]]
+
+
+def _upsert(conn: sqlite3.Connection, table: str, keys: Dict, values: Dict,
+            extremes: Optional[Dict[str, Tuple[str, float]]] = None) -> None:
+    """INSERT a row or add values onto the existing row with the same keys.
+
+    extremes: column -> ('MIN' | 'MAX', value), kept as a running min/max instead of a sum.
+    """
+    extremes = extremes or {}
+    cols = list(keys) + list(values) + list(extremes)
+    sets = [f'{c} = {c} + excluded.{c}' for c in values]
+    sets += [f'{c} = {fn}({c}, excluded.{c})' for c, (fn, _) in extremes.items()]
+    conn.execute(
+        f'INSERT INTO {table} ({", ".join(cols)}) VALUES ({", ".join("?" for _ in cols)}) '
+        f'ON CONFLICT ({", ".join(keys)}) DO UPDATE SET {", ".join(sets)}',
+        list(keys.values()) + list(values.values()) + [v for _, v in extremes.values()])
+
+
+class CostRollup:
+    """Incrementally maintained cost aggregates."""
+
+    def __init__(self, db_path: Path = DB_FILE, sessions_dir: Path = SESSIONS_DIR):
+        self.sessions_dir = Path(sessions_dir)
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        measures = ', '.join(f'{m} {"REAL" if m == "cost" else "INTEGER"} NOT NULL DEFAULT 0' for m in MEASURES)
+        buckets = ', '.join(f'{b} INTEGER NOT NULL DEFAULT 0' for b in BUCKET_COLS)
+        self.conn.executescript(f'''
+            CREATE TABLE IF NOT EXISTS hourly (
+                hour INTEGER NOT NULL, session TEXT NOT NULL, model TEXT NOT NULL, {measures},
+                PRIMARY KEY (hour, session, model)
+            );
+            CREATE INDEX IF NOT EXISTS idx_hourly_session ON hourly(session);
+            CREATE TABLE IF NOT EXISTS daily (
+                day TEXT NOT NULL, model TEXT NOT NULL, {measures},
+                PRIMARY KEY (day, model)
+            );
+            CREATE TABLE IF NOT EXISTS models (
+                model TEXT PRIMARY KEY, {measures}
+            );
+            CREATE TABLE IF NOT EXISTS sessions (
+                session TEXT PRIMARY KEY, {measures}, {buckets},
+                first_ts REAL, last_ts REAL, min_cost REAL, max_cost REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_last ON sessions(last_ts);
+            CREATE TABLE IF NOT EXISTS cursors (
+                file TEXT PRIMARY KEY, inode INTEGER NOT NULL, offset INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS daily_extra (
+                day TEXT PRIMARY KEY, model_fees REAL, aws REAL NOT NULL DEFAULT 0,
+                other REAL NOT NULL DEFAULT 0, notes TEXT NOT NULL DEFAULT ''
+            );
+        ''')
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # === Maintenance ===
+
+    def _add_turn(self, session: str, turn: Dict, ts: float) -> None:
+        model = turn['model']
+        values = {'cost': turn['cost'], 'turns': 1, **{k: turn[k] or 0 for k in TOKENS}}
+        hour = int(ts // 3600 * 3600)
+        _upsert(self.conn, 'hourly', {'hour': hour, 'session': session, 'model': model}, values)
+        _upsert(self.conn, 'daily', {'day': sgt_day(ts), 'model': model}, values)
+        _upsert(self.conn, 'models', {'model': model}, values)
+        _upsert(self.conn, 'sessions', {'session': session}, dict(values, **{_bucket(turn['cost']): 1}),
+                extremes={'first_ts': ('MIN', ts), 'last_ts': ('MAX', ts),
+                          'min_cost': ('MIN', turn['cost']), 'max_cost': ('MAX', turn['cost'])})
+
+    def _drop_session(self, session: str) -> None:
+        """Subtract a session's rolled-up turns from every aggregate."""
+        for row in self.conn.execute('SELECT * FROM hourly WHERE session = ?', (session,)).fetchall():
+            negated = {m: -row[m] for m in MEASURES}
+            _upsert(self.conn, 'daily', {'day': sgt_day(row['hour']), 'model': row['model']}, negated)
+            _upsert(self.conn, 'models', {'model': row['model']}, negated)
+        self.conn.execute('DELETE FROM daily WHERE turns <= 0')
+        self.conn.execute('DELETE FROM hourly WHERE session = ?', (session,))
+        self.conn.execute('DELETE FROM sessions WHERE session = ?', (session,))
+        self.conn.execute('DELETE FROM cursors WHERE file = ?', (session,))
+
+    def update(self) -> Dict[str, int]:
+        """Roll up whatever was appended to the transcripts since the last update."""
+        stats = {'files': 0, 'turns': 0, 'reset': 0}
+        cursors = {r['file']: dict(r) for r in self.conn.execute('SELECT * FROM cursors')}
+        paths = sorted(self.sessions_dir.glob('*.jsonl')) if self.sessions_dir.exists() else []
+        for path in paths:
+            session = path.stem
+            offset, reset = start_offset(path, cursors.get(session))
+            if session in cursors and not reset and path.stat().st_size == offset:
+                continue
+            with self.conn:
+                # Re-read the cursor under the write lock: an overlapping update()
+                # may already have rolled these lines up
+                self.conn.execute('BEGIN IMMEDIATE')
+                row = self.conn.execute('SELECT * FROM cursors WHERE file = ?', (session,)).fetchone()
+                cursor = dict(row) if row else None
+                st = path.stat()
+                offset, reset = start_offset(path, cursor)
+                if cursor and not reset and st.st_size == offset:
+                    continue
+                if reset:
+                    self._drop_session(session)
+                    stats['reset'] += 1
+                for line_offset, line in read_lines(path, offset):
+                    offset = line_offset + len(line)
+                    turn = parse_usage(line)
+                    if turn:
+                        self._add_turn(session, turn, to_epoch(turn['timestamp']) or st.st_mtime)
+                        stats['turns'] += 1
+                self.conn.execute('INSERT OR REPLACE INTO cursors (file, inode, offset) VALUES (?, ?, ?)',
+                                  (session, st.st_ino, offset))
+            stats['files'] += 1
+        return stats
+
+    def rebuild(self) -> Dict[str, int]:
+        with self.conn:
+            self.conn.executescript('DELETE FROM hourly; DELETE FROM daily; DELETE FROM models; '
+                                    'DELETE FROM sessions; DELETE FROM cursors;')
+        return self.update()
+
+    # === Queries ===
+
+    def daily(self, days: int = 30, model: Optional[str] = None) -> List[Dict]:
+        """Per-day totals for the last `days` SGT days (today included), oldest first."""
+        sql = (f'SELECT day, {", ".join(f"SUM({m}) AS {m}" for m in MEASURES)} FROM daily '
+               'WHERE day >= ?' + (' AND model = ?' if model else '') + ' GROUP BY day ORDER BY day')
+        params = [sgt_day(day_start(days - 1))] + ([model] if model else [])
+        return [dict(r) for r in self.conn.execute(sql, params)]
+
+    def by_model(self, since: Optional[float] = None) -> List[Dict]:
+        """Per-model totals since an epoch (hourly grain), or lifetime; biggest first."""
+        if since is None:
+            rows = self.conn.execute('SELECT * FROM models WHERE turns > 0 ORDER BY cost DESC')
+        else:
+            rows = self.conn.execute(
+                f'SELECT model, {", ".join(f"SUM({m}) AS {m}" for m in MEASURES)} FROM hourly '
+                'WHERE hour >= ? GROUP BY model ORDER BY cost DESC', (int(since // 3600 * 3600),))
+        return [dict(r) for r in rows]
+
+    def sessions(self, since: float) -> List[Dict]:
+        """Per-session totals for turns since an epoch (hourly grain), most recent first."""
+        rows = self.conn.execute(
+            f'SELECT h.session, {", ".join(f"SUM(h.{m}) AS {m}" for m in MEASURES)}, s.last_ts '
+            'FROM hourly h JOIN sessions s ON s.session = h.session '
+            'WHERE h.hour >= ? GROUP BY h.session ORDER BY s.last_ts DESC', (int(since // 3600 * 3600),))
+        return [dict(r) for r in rows]
+
+    def session(self, session: str) -> Optional[Dict]:
+        row = self.conn.execute('SELECT * FROM sessions WHERE session = ?', (session,)).fetchone()
+        return dict(row) if row else None
+
+    def total(self, since: float) -> float:
+        row = self.conn.execute('SELECT COALESCE(SUM(cost), 0) FROM hourly WHERE hour >= ?',
+                                (int(since // 3600 * 3600),)).fetchone()
+        return row[0]
+
+    # === Manual daily costs (cost-tracker) ===
+
+    def extra(self, day: str) -> Optional[Dict]:
+        row = self.conn.execute('SELECT * FROM daily_extra WHERE day = ?', (day,)).fetchone()
+        return dict(row) if row else None
+
+    def set_extra(self, day: str, aws: float = 0, other: float = 0, notes: str = '',
+                  model_fees: Optional[float] = None) -> None:
+        """Manual entry for a day; model_fees=None means use the rolled-up model cost."""
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO daily_extra (day, model_fees, aws, other, notes) '
+                              'VALUES (?, ?, ?, ?, ?)', (day, model_fees, aws, other, notes))
+
+    def model_cost(self, day: str) -> Optional[float]:
+        """Rolled-up model cost for an SGT day, None if no turns were recorded."""
+        row = self.conn.execute('SELECT SUM(cost), SUM(turns) FROM daily WHERE day = ?', (day,)).fetchone()
+        return row[0] if row[1] else None
+
+    def ledger(self) -> List[Dict]:
+        """Every day with a manual entry plus its model fees (override, else rolled up), oldest first."""
+        rows = self.conn.execute(
+            'SELECT e.day, e.aws, e.other, e.notes, e.model_fees IS NULL AS live, '
+            'COALESCE(e.model_fees, (SELECT SUM(cost) FROM daily d WHERE d.day = e.day), 0) AS model_fees '
+            'FROM daily_extra e ORDER BY e.day')
+        return [dict(r) for r in rows]
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    db = CostRollup()
+    t0 = time.perf_counter()
+    if args[0] in ('--update', '--rebuild'):
+        stats = db.update() if args[0] == '--update' else db.rebuild()
+        print(f"💾 {stats['turns']:,} turns from {stats['files']} transcripts "
+              f"({stats['reset']} reset) in {time.perf_counter() - t0:.2f}s")
+    elif args[0] == 'trend':
+        days = int(args[1]) if len(args) > 1 else 30
+        db.update()
+        rows = db.daily(days)
+        peak = max((r['cost'] for r in rows), default=0) or 1
+        print(f"💸 Daily model cost, last {days} days (SGT)\n")
+        for r in rows:
+            print(f"{r['day']}  ${r['cost']:>8.2f}  {r['turns']:>5} turns  {'█' * int(r['cost'] / peak * 30)}")
+        total = sum(r['cost'] for r in rows)
+        print(f"\nTotal: ${total:.2f} | Daily avg: ${total / max(len(rows), 1):.2f}")
+    elif args[0] == 'models':
+        days = int(args[1]) if len(args) > 1 else 30
+        db.update()
+        for r in db.by_model(day_start(days - 1)):
+            print(f"{r['model']:<40} ${r['cost']:>9.2f}  {r['turns']:>6} turns  out={r['output']:,}")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ Rules:
 - Auto-logs all modifications to memory/self-improvement-log.md
 """
 
+import sys
 import json
 import subprocess
 from datetime import datetime
@@ -18,6 +19,9 @@ from pathlib import Path
 from collections import defaultdict
 from zoneinfo import ZoneInfo
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 SGT = ZoneInfo("Asia/Singapore")
 FEEDBACK_LOG = Path(__file__).parent.parent / "memory" / "feedback-log.jsonl"
 IMPROVEMENT_LOG = Path(__file__).parent.parent / "memory" / "self-improvement-log.md"
@@ -27,27 +31,19 @@ BOOST_THRESHOLD = 50   # 50%+ engagement
 
 def load_feedback():
     """Load feedback log and aggregate by topic."""
-    if not FEEDBACK_LOG.exists():
-        return {}
-    
     topics = defaultdict(lambda: {"runs": 0, "engaged": 0})
     
-    with open(FEEDBACK_LOG) as f:
-        for line in f:
-            try:
-                entry = json.loads(line)
-                topic = entry.get("topic", "unknown")
-                topics[topic]["runs"] += 1
-                # Check for EXPLICIT signals only
-                # Positive: reply, 👍, engaged=true
-                # Negative: 👎, "stop", "less" 
-                # Silence = neutral (not counted either way)
-                if entry.get("engaged") or entry.get("replied") or entry.get("reaction") == "👍":
-                    topics[topic]["engaged"] += 1
-                if entry.get("negative") or entry.get("reaction") == "👎":
-                    topics[topic]["negative"] = topics[topic].get("negative", 0) + 1
-            except:
-                continue
+    for entry in EventLog(FEEDBACK_LOG).scan():
+        topic = entry.get("topic", "unknown")
+        topics[topic]["runs"] += 1
+        # Check for EXPLICIT signals only
+        # Positive: reply, 👍, engaged=true
+        # Negative: 👎, "stop", "less" 
+        # Silence = neutral (not counted either way)
+        if entry.get("engaged") or entry.get("replied") or entry.get("reaction") == "👍":
+            topics[topic]["engaged"] += 1
+        if entry.get("negative") or entry.get("reaction") == "👎":
+            topics[topic]["negative"] = topics[topic].get("negative", 0) + 1
     
     return dict(topics)
 
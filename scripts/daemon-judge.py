@@ -19,10 +19,13 @@ Usage:
 
 import json
 import sys
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 WORKSPACE = Path.home() / '.openclaw/workspace'
 FEEDBACK_LOG = WORKSPACE / 'memory/feedback-log.jsonl'
 REFLECTIONS = WORKSPACE / 'memory/reflections.jsonl'
@@ -32,34 +35,8 @@ JUDGE_LOG = WORKSPACE / 'memory/daemon-judge-log.jsonl'
 
 
 def load_jsonl(path, days=7):
-    """Load JSONL entries from last N days."""
-    entries = []
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    
-    if not path.exists():
-        return entries
-    
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                # Parse timestamp
-                ts = entry.get('timestamp', entry.get('ts', ''))
-                if ts:
-                    if 'Z' in ts:
-                        ts = ts.replace('Z', '+00:00')
-                    dt = datetime.fromisoformat(ts)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    if dt > cutoff:
-                        entries.append(entry)
-            except (json.JSONDecodeError, ValueError):
-                continue
-    
-    return entries
+    """Load JSONL entries from last N days (older segments are skipped)."""
+    return EventLog(path).read(since=days_ago(days))
 
 
 def load_json(path):
@@ -73,8 +50,7 @@ def load_json(path):
 def save_judge_entry(entry):
     """Save a judge log entry."""
     entry['timestamp'] = datetime.now(timezone.utc).isoformat()
-    with open(JUDGE_LOG, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    EventLog(JUDGE_LOG).append(entry)
 
 
 def review_performance(days=1):
@@ -4,23 +4,21 @@ Generate daily daemon status report for email.
 Matches the full format shown in Telegram.
 """
 
+import sys
 import json
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+import cost_rollup
+from event_store import EventLog
+
 WORKSPACE = Path("/home/ubuntu/.openclaw/workspace")
 
 def get_sgt_now():
     return datetime.now(timezone.utc) + timedelta(hours=8)
 
-def count_lines(filepath):
-    try:
-        with open(filepath) as f:
-            return sum(1 for _ in f)
-    except:
-        return 0
-
 def count_files(pattern):
     return len(list(WORKSPACE.glob(pattern)))
 
@@ -41,21 +39,37 @@ def load_json(path):
     except:
         return {}
 
-def load_jsonl(path):
-    entries = []
+def get_cost_summary():
+    """Model spend from the cost rollup database (one indexed query per figure)"""
     try:
-        with open(path) as f:
-            for line in f:
-                if line.strip():
-                    entries.append(json.loads(line))
-    except:
-        pass
-    return entries
+        db = cost_rollup.CostRollup()
+        db.update()
+        days = db.daily(30)
+        yesterday = cost_rollup.sgt_day(cost_rollup.day_start(1))
+        models = db.by_model(cost_rollup.day_start(6))
+        db.close()
+    except Exception:
+        return None
+    week = [d for d in days if d['day'] >= cost_rollup.sgt_day(cost_rollup.day_start(6))]
+    return {
+        "yesterday": next((d['cost'] for d in days if d['day'] == yesterday), 0),
+        "week": sum(d['cost'] for d in week),
+        "month_avg": sum(d["cost"] for d in days) / 30,
+        "top_model": models[0]['model'] if models else "n/a",
+    }
 
 def get_cron_count():
     # Hardcoded for now, could query gateway
     return {"total": 18, "delivers": 13, "silent": 5}
 
+def cost_lines(costs):
+    if not costs:
+        return "• No cost data"
+    return (f"• Yesterday: ${costs['yesterday']:.2f}\n"
+            f"• Last 7 days: ${costs['week']:.2f}\n"
+            f"• 30-day daily avg: ${costs['month_avg']:.2f}\n"
+            f"• Top model (7d): {costs['top_model']}")
+
 def generate_report():
     now = get_sgt_now()
     date_str = now.strftime("%Y-%m-%d")
@@ -63,8 +77,9 @@ def generate_report():
     
     # Gather metrics
     commits = git_commits_today()
-    feedback_entries = count_lines(WORKSPACE / "memory/feedback-log.jsonl")
-    reflections = count_lines(WORKSPACE / "memory/reflections.jsonl")
+    reflections_log = EventLog(WORKSPACE / "memory/reflections.jsonl")
+    feedback_entries = EventLog(WORKSPACE / "memory/feedback-log.jsonl").count()
+    reflections = reflections_log.count()
     scripts = count_files("scripts/*.py") + count_files("scripts/*.sh")
     reports_count = count_files("reports/*.md")
     memory_files = count_files("memory/*.json") + count_files("memory/*.jsonl")
@@ -86,10 +101,10 @@ def generate_report():
         lesson_count = content.count("**") // 2  # rough estimate
     
     # Load recent reflections
-    reflections_data = load_jsonl(WORKSPACE / "memory/reflections.jsonl")
-    recent_reflections = reflections_data[-3:] if reflections_data else []
+    recent_reflections = reflections_log.tail(3)
     
     cron = get_cron_count()
+    costs = get_cost_summary()
     
     report = f"""CURIOSITY DAEMON STATUS REPORT
 {date_str} ({day_name}) | Generated 07:00 SGT
@@ -138,6 +153,12 @@ def generate_report():
 
 {'='*50}
 
+💸 MODEL COSTS
+{'─'*50}
+{cost_lines(costs)}
+
+{'='*50}
+
 ⚙️ DAEMON CONFIG
 {'─'*50}
 • Fatigue threshold: {fatigue.get('maxUnrepliedSurfaces', 3)} surfaces / {fatigue.get('windowCycles', 7)} cycles
@@ -36,13 +36,13 @@ Docs: https://danelfin.com/docs/api
 
 import os
 import sys
-import json
-import urllib.request
-import urllib.parse
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+
 BASE_URL = "https://apirest.danelfin.com"
 API_KEY = None
 
@@ -77,24 +77,16 @@ def api_request(endpoint: str, params: Dict = None) -> Dict:
             print("ERROR: No API key found. Set DANELFIN_API_KEY or create ~/.secure/danelfin.env")
             sys.exit(1)
     
-    url = f"{BASE_URL}/{endpoint}"
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-    
-    req = urllib.request.Request(url)
-    req.add_header('x-api-key', API_KEY)
-    req.add_header('Accept', 'application/json')
-    
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        if e.code == 403:
+        return market_http.get_json(f"{BASE_URL}/{endpoint}", params,
+                                    headers={'x-api-key': API_KEY}, provider='danelfin')
+    except market_http.HttpError as e:
+        if e.status == 403:
             print("ERROR: Invalid API key or insufficient permissions")
-        elif e.code == 400:
-            print(f"ERROR: Bad request - {e.read().decode()}")
+        elif e.status == 400:
+            print(f"ERROR: Bad request - {e.body}")
         else:
-            print(f"ERROR: HTTP {e.code}")
+            print(f"ERROR: HTTP {e.status}")
         sys.exit(1)
     except Exception as e:
         print(f"ERROR: {e}")
@@ -13,6 +13,7 @@ Usage:
     python3 deep-analyzer.py NVDA --industry         # Industry analysis
     python3 deep-analyzer.py NVDA --management       # Management red flags
     python3 deep-analyzer.py NVDA --output report    # Save to file
+    python3 deep-analyzer.py --symbols NVDA,AMD [--workers 4] [--mode]  # Batch, JSON lines
 
 Outputs actionable qualitative insights, not just numbers.
 """
@@ -21,8 +22,8 @@ import os
 import sys
 import json
 import re
-import urllib.request
 import urllib.parse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import Counter
@@ -30,8 +31,13 @@ from typing import Dict, List, Optional, Tuple
 
 # === Configuration ===
 
-CACHE_DIR = Path.home() / '.openclaw/workspace/memory/research/cache'
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import response_cache
+import batch_runner
+import transcript_corpus
+import phrase_scanner
+from phrase_scanner import PhraseScanner, ScanResult
 
 # === Word Lists (Enhanced) ===
 
@@ -76,7 +82,26 @@ VAGUE_GUIDANCE_MARKERS = [
     'significant', 'substantial', 'consistent with', 'in line with'
 ]
 
+# Accountability signals
+OWNERSHIP_PHRASES = [
+    'we could have', 'we should have', 'we made mistakes',
+    'our execution', 'we take responsibility'
+]
+
+# Every lexicon compiled once; a transcript is scanned in a single pass
+LEXICONS = {
+    'hedging': HEDGING_PHRASES,
+    'excuse': EXCUSE_PHRASES,
+    'conviction': CONVICTION_PHRASES,
+    'deflection': DEFLECTION_PHRASES,
+    'specific_guidance': SPECIFIC_GUIDANCE_MARKERS,
+    'vague_guidance': VAGUE_GUIDANCE_MARKERS,
+    'ownership': OWNERSHIP_PHRASES,
+}
+SCANNER = PhraseScanner(LEXICONS)
+
 
+@lru_cache(maxsize=None)
 def get_api_key(name: str = 'FMP') -> str:
     """Load API key from secure storage"""
     env_key = f'{name}_API_KEY'
@@ -98,23 +123,12 @@ def get_api_key(name: str = 'FMP') -> str:
 
 
 def fetch_json(url: str, cache_key: str = None, cache_hours: int = 24) -> Optional[Dict]:
-    """Fetch JSON with caching"""
-    if cache_key:
-        cache_file = CACHE_DIR / f"{cache_key}.json"
-        if cache_file.exists():
-            age = datetime.now().timestamp() - cache_file.stat().st_mtime
-            if age < cache_hours * 3600:
-                with open(cache_file) as f:
-                    return json.load(f)
-    
+    """Fetch JSON, cached in the shared market response cache when cache_key is set."""
+    provider = 'fmp' if 'financialmodelingprep.com' in url else None
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
-            if cache_key and data:
-                with open(cache_file, 'w') as f:
-                    json.dump(data, f)
-            return data
+        if cache_key:
+            return response_cache.get_json(url, provider=provider, ttl=cache_hours * 3600, timeout=30)
+        return market_http.get_json(url, provider=provider, timeout=30)
     except Exception as e:
         print(f"Fetch error: {e}", file=sys.stderr)
         return None
@@ -123,34 +137,17 @@ def fetch_json(url: str, cache_key: str = None, cache_hours: int = 24) -> Option
 # === Transcript Analysis ===
 
 def fetch_transcript(symbol: str, year: int = None, quarter: int = None) -> Optional[Dict]:
-    """Fetch latest or specific transcript"""
-    api_key = get_api_key('FMP')
+    """Fetch latest or specific transcript (local corpus, fetched from FMP once)"""
+    if year and quarter:
+        return transcript_corpus.get(symbol, year, quarter)
     
-    # FMP requires year and quarter - default to recent quarters
-    if not year or not quarter:
-        from datetime import datetime
-        now = datetime.now()
-        # Try last few quarters
-        for q_offset in range(4):
-            test_q = ((now.month - 1) // 3) - q_offset
-            test_y = now.year
-            while test_q <= 0:
-                test_q += 4
-                test_y -= 1
-            
-            url = f"https://financialmodelingprep.com/stable/earning-call-transcript?symbol={symbol}&year={test_y}&quarter={test_q}&apikey={api_key}"
-            data = fetch_json(url, None, 1)  # Don't cache when searching
-            if data and len(data) > 0:
-                return data[0]
-        return None
-    
-    url = f"https://financialmodelingprep.com/stable/earning-call-transcript?symbol={symbol}&year={year}&quarter={quarter}&apikey={api_key}"
-    data = fetch_json(url, f"transcript_{symbol}_{year}_{quarter}", 168)
-    return data[0] if data else None
+    # FMP requires year and quarter - try the last few quarters concurrently
+    found = transcript_corpus.latest(symbol, 1, lookback=4)
+    return found[0][1] if found else None
 
 
-def extract_sections(content: str) -> Dict[str, str]:
-    """Split transcript into prepared remarks vs Q&A"""
+def find_qa_start(content: str) -> int:
+    """Offset where Q&A begins (prepared remarks come before it)"""
     qa_markers = [
         r'question.and.answer',
         r'q\s*&\s*a\s+session',
@@ -163,29 +160,41 @@ def extract_sections(content: str) -> Dict[str, str]:
     for marker in qa_markers:
         match = re.search(marker, content, re.IGNORECASE)
         if match:
-            return {
-                'prepared': content[:match.start()],
-                'qa': content[match.start():]
-            }
+            return match.start()
     
     # Fallback: estimate split
-    midpoint = len(content) // 2
+    return len(content) // 2
+
+
+def extract_sections(content: str) -> Dict[str, str]:
+    """Split transcript into prepared remarks vs Q&A"""
+    qa_start = find_qa_start(content)
     return {
-        'prepared': content[:midpoint],
-        'qa': content[midpoint:]
+        'prepared': content[:qa_start],
+        'qa': content[qa_start:]
     }
 
 
+def scan_transcript(content: str, qa_start: int = None) -> ScanResult:
+    """All lexicons over the transcript in one pass, split into prepared/qa sections"""
+    if qa_start is None:
+        qa_start = find_qa_start(content)
+    return SCANNER.scan(content, sections={
+        'prepared': (0, qa_start),
+        'qa': (qa_start, len(content)),
+    })
+
+
 def count_phrase_occurrences(text: str, phrases: List[str]) -> int:
     """Count how many times any phrase appears"""
-    text_lower = text.lower()
-    return sum(text_lower.count(phrase) for phrase in phrases)
+    return phrase_scanner.count_phrases(text, phrases)
 
 
-def analyze_guidance_quality(text: str) -> Dict:
-    """Is guidance specific or vague?"""
-    specific = count_phrase_occurrences(text, SPECIFIC_GUIDANCE_MARKERS)
-    vague = count_phrase_occurrences(text, VAGUE_GUIDANCE_MARKERS)
+def analyze_guidance_quality(text: str, counts: Dict[str, int] = None) -> Dict:
+    """Is guidance specific or vague? counts: precomputed SCANNER counts for text"""
+    counts = counts or SCANNER.count(text)
+    specific = counts['specific_guidance']
+    vague = counts['vague_guidance']
     
     total = specific + vague
     if total == 0:
@@ -202,11 +211,11 @@ def analyze_guidance_quality(text: str) -> Dict:
     }
 
 
-def analyze_deflection(qa_text: str) -> Dict:
+def analyze_deflection(qa_text: str, counts: Dict[str, int] = None) -> Dict:
     """How much is management deflecting in Q&A?"""
     # Count analyst questions (approximation)
     question_marks = qa_text.count('?')
-    deflections = count_phrase_occurrences(qa_text, DEFLECTION_PHRASES)
+    deflections = (counts or SCANNER.count(qa_text))['deflection']
     
     if question_marks == 0:
         return {'deflection_rate': 0, 'interpretation': 'no Q&A parsed'}
@@ -223,16 +232,15 @@ def analyze_deflection(qa_text: str) -> Dict:
     }
 
 
-def analyze_blame_patterns(text: str) -> Dict:
+def analyze_blame_patterns(text: str, counts: Dict[str, int] = None) -> Dict:
     """Is management externalizing blame?"""
-    excuses = count_phrase_occurrences(text, EXCUSE_PHRASES)
+    counts = counts or SCANNER.count(text)
+    excuses = counts['excuse']
     words = len(text.split())
     rate = (excuses / words) * 1000 if words > 0 else 0
     
     # Also look for ownership language
-    ownership_phrases = ['we could have', 'we should have', 'we made mistakes', 
-                        'our execution', 'we take responsibility']
-    ownership = count_phrase_occurrences(text, ownership_phrases)
+    ownership = counts['ownership']
     
     if excuses > 0 and ownership == 0:
         pattern = 'externalizing'
@@ -257,24 +265,26 @@ def transcript_deep_analysis(symbol: str, year: int = None, quarter: int = None)
         return {'error': f'No transcript found for {symbol}'}
     
     content = transcript.get('content', '')
-    sections = extract_sections(content)
+    qa_start = find_qa_start(content)
+    scan = scan_transcript(content, qa_start)
+    prepared, qa = scan.section('prepared'), scan.section('qa')
     
     # Prepared remarks analysis
-    prepared_hedging = count_phrase_occurrences(sections['prepared'], HEDGING_PHRASES)
-    prepared_conviction = count_phrase_occurrences(sections['prepared'], CONVICTION_PHRASES)
+    prepared_hedging = prepared['hedging']
+    prepared_conviction = prepared['conviction']
     
     # Q&A analysis
-    qa_hedging = count_phrase_occurrences(sections['qa'], HEDGING_PHRASES)
-    qa_conviction = count_phrase_occurrences(sections['qa'], CONVICTION_PHRASES)
+    qa_hedging = qa['hedging']
+    qa_conviction = qa['conviction']
     
     # Tone shift (Q&A typically more revealing)
     prepared_ratio = prepared_conviction / max(prepared_hedging, 1)
     qa_ratio = qa_conviction / max(qa_hedging, 1)
     tone_shift = prepared_ratio - qa_ratio
     
-    deflection = analyze_deflection(sections['qa'])
-    blame = analyze_blame_patterns(content)
-    guidance = analyze_guidance_quality(content)
+    deflection = analyze_deflection(content[qa_start:], qa)
+    blame = analyze_blame_patterns(content, scan.counts)
+    guidance = analyze_guidance_quality(content, scan.counts)
     
     # Generate signals
     signals = []
@@ -315,6 +325,35 @@ def transcript_deep_analysis(symbol: str, year: int = None, quarter: int = None)
     }
 
 
+def transcript_metrics(content: str) -> Dict[str, float]:
+    """Flat numeric lexicon metrics for one transcript (corpus-wide tables)"""
+    qa_start = find_qa_start(content)
+    scan = scan_transcript(content, qa_start)
+    counts, prepared, qa = scan.counts, scan.section('prepared'), scan.section('qa')
+    words = len(content.split())
+
+    def per_1k(n: int) -> float:
+        return round(n / words * 1000, 2) if words else 0
+
+    prepared_ratio = prepared['conviction'] / max(prepared['hedging'], 1)
+    qa_ratio = qa['conviction'] / max(qa['hedging'], 1)
+    deflection = analyze_deflection(content[qa_start:], qa)
+    guidance = analyze_guidance_quality(content, counts)
+
+    return {
+        'words': words,
+        'hedging_per_1k': per_1k(counts['hedging']),
+        'qa_hedging_per_1k': per_1k(qa['hedging']),
+        'conviction_per_1k': per_1k(counts['conviction']),
+        'excuse_per_1k': per_1k(counts['excuse']),
+        'ownership_per_1k': per_1k(counts['ownership']),
+        'confidence_ratio': round(counts['conviction'] / max(counts['hedging'], 1), 2),
+        'tone_shift': round(prepared_ratio - qa_ratio, 2),
+        'deflection_rate': deflection['deflection_rate'],
+        'specific_guidance_ratio': guidance['specific_ratio'],
+    }
+
+
 # === Scuttlebutt / Alternative Data ===
 
 def fetch_glassdoor_signal(company: str) -> Dict:
@@ -548,7 +587,7 @@ def management_red_flag_check(symbol: str) -> Dict:
 
 def full_analysis(symbol: str) -> Dict:
     """Run complete deep analysis"""
-    print(f"🔍 Deep analysis: {symbol}")
+    print(f"🔍 Deep analysis: {symbol}", file=sys.stderr)
     
     # Get company name first
     api_key = get_api_key('FMP')
@@ -569,19 +608,31 @@ def full_analysis(symbol: str) -> Dict:
     return results
 
 
+def run_mode(symbol: str, mode: str = 'full') -> Dict:
+    """Run one analysis mode for a symbol"""
+    if mode == 'transcript':
+        return transcript_deep_analysis(symbol)
+    elif mode == 'scuttlebutt':
+        return scuttlebutt_sources(symbol, symbol)
+    elif mode == 'industry':
+        return industry_analysis_template(symbol)
+    elif mode == 'management':
+        return management_red_flag_check(symbol)
+    return full_analysis(symbol)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python3 deep-analyzer.py SYMBOL [--mode] [--output file]")
+        print("       python3 deep-analyzer.py --symbols FILE|SYM,SYM [--workers N] [--mode]")
         print("Modes: --transcript, --scuttlebutt, --industry, --management")
         sys.exit(1)
     
-    symbol = sys.argv[1].upper()
-    
     # Parse args
     mode = 'full'
     output_file = None
     
-    for i, arg in enumerate(sys.argv[2:], 2):
+    for i, arg in enumerate(sys.argv[1:], 1):
         if arg == '--transcript':
             mode = 'transcript'
         elif arg == '--scuttlebutt':
@@ -593,17 +644,16 @@ def main():
         elif arg == '--output' and i + 1 < len(sys.argv):
             output_file = sys.argv[i + 1]
     
+    if sys.argv[1] == '--symbols':
+        symbols = batch_runner.parse_symbols(batch_runner.option(sys.argv, '--symbols', ''))
+        workers = int(batch_runner.option(sys.argv, '--workers', batch_runner.BATCH_WORKERS))
+        batch_runner.run_batch(symbols, lambda s: run_mode(s, mode), workers)
+        return
+    
+    symbol = sys.argv[1].upper()
+    
     # Run analysis
-    if mode == 'transcript':
-        result = transcript_deep_analysis(symbol)
-    elif mode == 'scuttlebutt':
-        result = scuttlebutt_sources(symbol, symbol)
-    elif mode == 'industry':
-        result = industry_analysis_template(symbol)
-    elif mode == 'management':
-        result = management_red_flag_check(symbol)
-    else:
-        result = full_analysis(symbol)
+    result = run_mode(symbol, mode)
     
     output = json.dumps(result, indent=2)
     print(output)
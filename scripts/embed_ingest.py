@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Embedding Ingestion
+===================
+
+Batched, concurrent embedding of text chunks for semantic-search --update.
+
+- Many chunks per embeddings request (BATCH_SIZE)
+- A bounded number of requests in flight (MAX_WORKERS)
+- Retry with exponential backoff + jitter
+- Append-only checkpoint: every finished batch is written to disk, so an
+  interrupted rebuild resumes from where it stopped instead of starting over
+
+Offline testing:
+    python3 scripts/embed_ingest.py --fake-server 8765 &
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=test \\
+        python3 scripts/semantic-search.py --rebuild
+
+The fake server returns deterministic vectors derived from a hash of each input.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+BATCH_SIZE = 64        # Inputs per embeddings request
+MAX_WORKERS = 4        # Concurrent requests
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0     # Seconds; doubles per attempt
+BACKOFF_MAX = 30.0
+MAX_INPUT_CHARS = 8000
+
+
+def content_key(text: str, model: str) -> str:
+    """Stable key for a chunk's embedding: model + exact text."""
+    return hashlib.sha1(f"{model}\0{text}".encode()).hexdigest()
+
+
+class Checkpoint:
+    """Append-only JSONL of {key, embedding} for finished batches."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, List[float]]:
+        done = {}
+        if not self.path.exists():
+            return done
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                    done[rec['key']] = rec['embedding']
+                except (json.JSONDecodeError, KeyError):
+                    continue  # Torn last line from an interrupted write
+        return done
+
+    def append(self, items: Dict[str, List[float]]) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                for key, emb in items.items():
+                    f.write(json.dumps({'key': key, 'embedding': emb}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
+
+
+class EmbeddingIngestor:
+    """Embeds texts in batches across a small thread pool."""
+
+    def __init__(self, client, model: str, checkpoint_path: Optional[Path] = None,
+                 batch_size: int = BATCH_SIZE, max_workers: int = MAX_WORKERS,
+                 max_retries: int = MAX_RETRIES, log: Callable[[str], None] = print):
+        self.client = client
+        self.model = model
+        self.checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.log = log
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        """One embeddings call with retry + jittered exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.embeddings.create(
+                    model=self.model,
+                    input=[t[:MAX_INPUT_CHARS] for t in texts]
+                )
+                data = sorted(response.data, key=lambda d: d.index)
+                if len(data) != len(texts):
+                    raise ValueError(f"expected {len(texts)} embeddings, got {len(data)}")
+                return [d.embedding for d in data]
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * (0.5 + random.random() / 2)
+                self.log(f"    ↻ Embedding batch failed ({e}); retry {attempt + 1} in {delay:.1f}s")
+                time.sleep(delay)
+
+    def embed(self, texts: List[str]) -> Dict[str, List[float]]:
+        """Embed texts, returning {content_key: embedding}.
+
+        Texts already in the checkpoint are not re-sent. Batches that still fail
+        after all retries are skipped (and reported) rather than aborting the run.
+        """
+        done = self.checkpoint.load() if self.checkpoint else {}
+        resumed = 0
+
+        pending = {}
+        for text in texts:
+            key = content_key(text, self.model)
+            if key in done:
+                resumed += 1
+            elif key not in pending:
+                pending[key] = text
+        if resumed:
+            self.log(f"  ↺ Resuming: {resumed} chunks already embedded in checkpoint")
+
+        keys = list(pending)
+        batches = [keys[i:i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+        if not batches:
+            return done
+
+        self.log(f"  → Embedding {len(keys)} chunks in {len(batches)} batches "
+                 f"({self.max_workers} concurrent)")
+        failed = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._request, [pending[k] for k in batch]): batch
+                       for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    embeddings = future.result()
+                except Exception as e:
+                    failed += len(batch)
+                    self.log(f"    ⚠️ Batch of {len(batch)} failed: {e}")
+                    continue
+                result = dict(zip(batch, embeddings))
+                if self.checkpoint:
+                    self.checkpoint.append(result)
+                done.update(result)
+
+        if failed:
+            self.log(f"  ⚠️ {failed} chunks not embedded (will retry on next --update)")
+        return done
+
+
+# === Fake server for offline testing ===
+
+def fake_embedding(text: str, dim: int) -> List[float]:
+    """Deterministic pseudo-embedding from a hash of the text."""
+    rng = random.Random(hashlib.sha256(text.encode()).digest())
+    return [rng.gauss(0, 1) for _ in range(dim)]
+
+
+def serve_fake(port: int = 8765, dim: int = 256) -> None:
+    """Minimal OpenAI-compatible POST /v1/embeddings endpoint."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if not self.path.rstrip('/').endswith('/embeddings'):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            inputs = body.get('input', [])
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            payload = json.dumps({
+                'object': 'list',
+                'model': body.get('model', 'fake'),
+                'data': [{'object': 'embedding', 'index': i, 'embedding': fake_embedding(t, dim)}
+                         for i, t in enumerate(inputs)],
+                'usage': {'prompt_tokens': 0, 'total_tokens': 0},
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    print(f"Fake embeddings server on http://127.0.0.1:{port}/v1 (dim={dim})")
+    ThreadingHTTPServer(('127.0.0.1', port), Handler).serve_forever()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == '--fake-server':
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+        dim = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+        serve_fake(port, dim)
+    else:
+        print(__doc__)
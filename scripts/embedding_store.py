@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Embedding Store
+===============
+
+Binary on-disk format for the semantic-search index.
+
+Layout (next to each other in memory/):
+    .embeddings.npy        float32 matrix, one row per chunk (memory-mapped on load)
+    .embeddings-meta.json  chunk metadata sidecar (files, chunks, model, dim, updated)
+
+The matrix is opened with mmap, so query startup only parses the small
+metadata sidecar — the vectors are paged in by the OS as they are touched.
+A float32 row is 4 bytes per dimension versus ~20 bytes of JSON text.
+
+Usage:
+    from embedding_store import EmbeddingStore
+    store = EmbeddingStore(MEMORY_DIR)
+    meta, matrix = store.load()
+    store.save(meta, matrix)
+    store.migrate_json(MEMORY_DIR / '.embeddings-cache.json')
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DTYPE = np.float32
+FORMAT_VERSION = 1
+
+
+def empty_meta() -> Dict:
+    """Metadata for an empty index."""
+    return {'version': FORMAT_VERSION, 'files': {}, 'chunks': [], 'dim': 0}
+
+
+class EmbeddingStore:
+    """Float32 matrix file + JSON chunk-metadata sidecar."""
+
+    def __init__(self, directory: Path, name: str = '.embeddings'):
+        self.directory = Path(directory)
+        self.matrix_path = self.directory / f'{name}.npy'
+        self.meta_path = self.directory / f'{name}-meta.json'
+
+    def exists(self) -> bool:
+        return self.meta_path.exists() and self.matrix_path.exists()
+
+    def size_bytes(self) -> int:
+        """Total on-disk size of matrix + sidecar."""
+        return sum(p.stat().st_size for p in (self.matrix_path, self.meta_path) if p.exists())
+
+    def load(self, mmap: bool = True) -> Tuple[Dict, np.ndarray]:
+        """Load (meta, matrix). Matrix is a read-only memmap unless mmap=False."""
+        if not self.exists():
+            return empty_meta(), np.zeros((0, 0), dtype=DTYPE)
+
+        with open(self.meta_path) as f:
+            meta = json.load(f)
+
+        matrix = np.load(self.matrix_path, mmap_mode='r' if mmap else None)
+        if matrix.shape[0] != len(meta.get('chunks', [])):
+            raise ValueError(
+                f"Embedding store mismatch: {matrix.shape[0]} rows vs "
+                f"{len(meta.get('chunks', []))} chunks — run --rebuild"
+            )
+        return meta, matrix
+
+    def save(self, meta: Dict, embeddings, normalize: bool = True) -> None:
+        """Atomically write matrix + sidecar. Embeddings may be a list of lists or an array.
+
+        Rows are L2-normalized before writing (unless normalize=False) so search
+        can score with a plain dot product and never recompute norms.
+        """
+        matrix = np.asarray(embeddings, dtype=DTYPE)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(0, 0) if matrix.size == 0 else matrix.reshape(1, -1)
+        if normalize and matrix.size:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+
+        meta = dict(meta)
+        meta['version'] = FORMAT_VERSION
+        meta['dim'] = int(matrix.shape[1]) if matrix.ndim == 2 else 0
+        meta['count'] = int(matrix.shape[0])
+        meta['normalized'] = bool(normalize or meta.get('normalized'))
+        meta.pop('embeddings', None)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to temp files then rename, so a reader never sees a half-written pair
+        tmp_matrix = self.matrix_path.with_suffix('.tmp.npy')
+        tmp_meta = self.meta_path.with_suffix('.tmp')
+        np.save(tmp_matrix, matrix)
+        with open(tmp_meta, 'w') as f:
+            json.dump(meta, f, separators=(',', ':'))
+        os.replace(tmp_matrix, self.matrix_path)
+        os.replace(tmp_meta, self.meta_path)
+
+    def migrate_json(self, json_path: Path, remove: bool = False) -> Optional[Dict]:
+        """Convert a legacy .embeddings-cache.json into the binary store.
+
+        Returns summary dict, or None if there was nothing to migrate.
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return None
+
+        with open(json_path) as f:
+            legacy = json.load(f)
+
+        embeddings: List = legacy.pop('embeddings', [])
+        chunks = legacy.get('chunks', [])
+        if len(embeddings) != len(chunks):
+            # Legacy rebuild could drop an embedding without dropping its chunk
+            n = min(len(embeddings), len(chunks))
+            embeddings, legacy['chunks'] = embeddings[:n], chunks[:n]
+
+        self.save(legacy, embeddings)
+
+        summary = {
+            'chunks': len(legacy['chunks']),
+            'json_bytes': json_path.stat().st_size,
+            'store_bytes': self.size_bytes(),
+        }
+        if remove:
+            json_path.unlink()
+        return summary
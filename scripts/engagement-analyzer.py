@@ -3,25 +3,18 @@
 Engagement Analyzer - Track what surfaces get engagement
 Run: python3 scripts/engagement-analyzer.py [report|topics|timing]
 """
-import json
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 FEEDBACK_LOG = Path("memory/feedback-log.jsonl")
 
 def load_feedback():
-    if not FEEDBACK_LOG.exists():
-        return []
-    entries = []
-    for line in FEEDBACK_LOG.read_text().splitlines():
-        if line.strip():
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return entries
+    return EventLog(FEEDBACK_LOG).read()
 
 def analyze_by_topic(entries):
     """Which topics get engagement?"""
@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Event Store
+===========
+
+Append-only JSONL event logs (feedback-log, reflections, failures,
+corrections-log, anticipations, daemon-judge-log, trade-journal, ...) with
+rotated segments and a sparse timestamp index, shared by the scripts that
+used to open + json.loads + filter these files by hand.
+
+Layout for memory/feedback-log.jsonl:
+    memory/feedback-log.jsonl                       active segment (plain JSONL,
+                                                    so `echo ... >>` keeps working)
+    memory/.segments/feedback-log/000001.jsonl      sealed segments, oldest first
+    memory/.segments/feedback-log/000002.jz         (or compact zlib blocks)
+    memory/.segments/feedback-log/index.json        per-segment sparse index
+
+- The active segment is sealed once it passes SEGMENT_BYTES
+- Every SPARSE_EVERY records the index stores (offset, newest ts so far),
+  so a since= scan skips whole segments and seeks past old blocks; out-of-
+  order timestamps are still handled correctly
+- The active segment's index is caught up incrementally (session_tail cursors)
+- rewrite() only rewrites segments whose records actually changed
+- follow() tails the log across rotations
+
+Usage:
+    from event_store import EventLog, days_ago
+    log = EventLog(Path.home() / '.openclaw/workspace/memory/feedback-log.jsonl')
+    log.append({'ts': ..., 'type': 'reaction'})
+    recent = log.read(since=days_ago(7))
+    last = log.tail(20)
+    for event in log.follow(): ...
+
+    python3 scripts/event_store.py stats memory/feedback-log.jsonl
+    python3 scripts/event_store.py tail memory/reflections.jsonl [N]
+    python3 scripts/event_store.py follow memory/daemon-judge-log.jsonl
+    python3 scripts/event_store.py rotate memory/signals.jsonl [--zlib]
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import bisect
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent))
+from session_tail import read_lines, start_offset
+
+SEGMENT_BYTES = 1 << 20     # Seal the active segment past this size
+SPARSE_EVERY = 64           # Records per sparse index point (and per zlib block)
+TS_FIELDS = ('ts', 'timestamp', 'time', 'opened', 'date')
+FRAME = struct.Struct('>I')
+INDEX_VERSION = 1
+
+Since = Union[None, int, float, str, datetime]
+
+
+def days_ago(days: float) -> float:
+    return time.time() - days * 86400
+
+
+def as_epoch(value: Since) -> Optional[float]:
+    """Epoch seconds from an ISO string, datetime or epoch s/ms; naive times are UTC. None if unknown."""
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    if isinstance(value, str) and value:
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+    return None
+
+
+def event_time(event: Dict, ts_field: Optional[str] = None) -> Optional[float]:
+    """Epoch seconds of an event (ts_field, else the first of TS_FIELDS present); None if unknown."""
+    for field in ((ts_field,) if ts_field else TS_FIELDS):
+        if event.get(field):
+            return as_epoch(event[field])
+    return None
+
+
+def dumps(event: Dict) -> str:
+    return json.dumps(event)
+
+
+def parse(line: bytes) -> Optional[Dict]:
+    try:
+        event = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return event if isinstance(event, dict) else None
+
+
+# === Segment index ===
+
+def empty_segment(name: str) -> Dict:
+    return {'name': name, 'count': 0, 'min': None, 'max': None, 'sparse': [], 'size': 0}
+
+
+def index_record(seg: Dict, offset: int, ts: Optional[float]) -> None:
+    """Account one record at byte offset (frame offset for zlib segments)."""
+    if seg['count'] % SPARSE_EVERY == 0:
+        seg['sparse'].append([offset, seg['max']])
+    seg['count'] += 1
+    if ts is not None:
+        seg['min'] = ts if seg['min'] is None else min(seg['min'], ts)
+        seg['max'] = ts if seg['max'] is None else max(seg['max'], ts)
+
+
+def seek_point(seg: Dict, since: Optional[float]) -> int:
+    """Byte offset to start a since= scan of a segment from.
+
+    Each sparse point carries the newest ts of every record before it, so the
+    last point whose running max is older than `since` is a safe start.
+    """
+    if since is None or not seg['sparse']:
+        return 0
+    maxes = [m if m is not None else float('-inf') for _, m in seg['sparse']]
+    point = max(bisect.bisect_left(maxes, since) - 1, 0)
+    return seg['sparse'][point][0]
+
+
+def in_range(seg: Dict, since: Optional[float], until: Optional[float]) -> bool:
+    if seg['count'] == 0:
+        return False
+    if since is not None and (seg['max'] is None or seg['max'] < since):
+        return False
+    if until is not None and (seg['min'] is None or seg['min'] >= until):
+        return False
+    return True
+
+
+# === Segment files ===
+
+def read_records(path: Path, start: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """(offset, line) from byte start. Unlike a transcript, a final line without its
+    newline is a record too (hand-appended), once it parses; until then it is a write
+    in progress and is left for later."""
+    end = start
+    for offset, line in read_lines(path, start):
+        end = offset + len(line)
+        yield offset, line
+    with open(path, 'rb') as f:
+        f.seek(end)
+        rest = f.read()
+    if rest.strip() and parse(rest) is not None:
+        yield end, rest
+
+
+def read_jsonl(path: Path, start: int = 0) -> Iterator[Tuple[int, Dict]]:
+    for offset, line in read_records(path, start):
+        event = parse(line)
+        if event is not None:
+            yield offset, event
+
+
+def read_frames(path: Path, start: int = 0) -> Iterator[Tuple[int, Dict]]:
+    """(frame offset, event) from a zlib segment: [u32 length][zlib(JSONL block)] ..."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        while True:
+            header = f.read(FRAME.size)
+            if len(header) < FRAME.size:
+                return
+            (length,) = FRAME.unpack(header)
+            block = zlib.decompress(f.read(length))
+            for line in block.splitlines():
+                event = parse(line)
+                if event is not None:
+                    yield offset, event
+            offset += FRAME.size + length
+
+
+def write_segment(path: Path, events: Iterable[Dict], ts_field: Optional[str]) -> Dict:
+    """Write events as a JSONL or zlib segment (by suffix), returning its index entry."""
+    seg = empty_segment(path.name)
+    tmp = path.with_suffix(f'.tmp{os.getpid()}')
+    with open(tmp, 'wb') as f:
+        if path.suffix == '.jz':
+            block: List[str] = []
+
+            def flush():
+                data = zlib.compress('\n'.join(block).encode(), 9)
+                f.write(FRAME.pack(len(data)) + data)
+                block.clear()
+
+            for event in events:
+                index_record(seg, f.tell(), event_time(event, ts_field))
+                block.append(json.dumps(event, separators=(',', ':')))
+                if len(block) == SPARSE_EVERY:
+                    flush()
+            if block:
+                flush()
+        else:
+            for event in events:
+                index_record(seg, f.tell(), event_time(event, ts_field))
+                f.write((dumps(event) + '\n').encode())
+        seg['size'] = f.tell()
+    os.replace(tmp, path)
+    return seg
+
+
+class EventLog:
+    """One append-only event log: sealed segments plus the active JSONL file."""
+
+    def __init__(self, path: Path, ts_field: Optional[str] = None, encoding: str = 'jsonl',
+                 segment_bytes: int = SEGMENT_BYTES):
+        self.path = Path(path)
+        self.ts_field = ts_field
+        self.suffix = '.jz' if encoding == 'zlib' else '.jsonl'
+        self.segment_bytes = segment_bytes
+        self.segment_dir = self.path.parent / '.segments' / self.path.stem
+        self.index_file = self.segment_dir / 'index.json'
+        self._index: Optional[Dict] = None
+
+    # --- index state ---
+
+    def _load_index(self) -> Dict:
+        if self._index is None:
+            try:
+                self._index = json.loads(self.index_file.read_text())
+                if self._index.get('version') != INDEX_VERSION:
+                    raise ValueError('index version')
+            except (OSError, ValueError):
+                self._index = {'version': INDEX_VERSION, 'segments': [], 'next': 1, 'active': None}
+        return self._index
+
+    def _save_index(self) -> None:
+        try:
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_suffix(f'.tmp{os.getpid()}')
+            tmp.write_text(json.dumps(self._index, separators=(',', ':')))
+            os.replace(tmp, self.index_file)
+        except OSError:
+            pass                    # Read-only location: the index is rebuilt on the next read
+
+    def _sync_active(self) -> Dict:
+        """Catch the active segment's index up with lines appended since the last call."""
+        index = self._load_index()
+        active = index.get('active')
+        if not self.path.exists():
+            if active and active['count']:
+                index['active'] = None
+                self._save_index()
+            return empty_segment(self.path.name)
+        start, reset = start_offset(self.path, active)
+        if active is None or reset:
+            active = dict(empty_segment(self.path.name), inode=self.path.stat().st_ino, offset=0)
+            index['active'] = active
+            start = 0
+        offset = start
+        for line_offset, line in read_records(self.path, start):
+            offset = line_offset + len(line)
+            event = parse(line)
+            if event is not None:
+                index_record(active, line_offset, event_time(event, self.ts_field))
+        if offset != active['offset'] or reset or not self.index_file.exists():
+            active.update(offset=offset, size=offset, inode=self.path.stat().st_ino)
+            self._save_index()
+        return active
+
+    def _files(self) -> List[Tuple[Path, Dict]]:
+        """(path, index entry) for every existing segment file, oldest first."""
+        segments = self.segments()
+        files = [(self.segment_dir / seg['name'], seg) for seg in segments[:-1]] + [(self.path, segments[-1])]
+        return [(path, seg) for path, seg in files if path.exists()]
+
+    def segments(self) -> List[Dict]:
+        """Index entries for every segment, oldest first (the active file last)."""
+        active = self._sync_active()
+        return list(self._load_index()['segments']) + [active]
+
+    # --- writing ---
+
+    def append(self, event: Dict) -> None:
+        self.extend([event])
+
+    def extend(self, events: Iterable[Dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+b') as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')         # Terminate a hand-appended last record first
+            for event in events:
+                f.write((dumps(event) + '\n').encode())
+        if self.path.stat().st_size >= self.segment_bytes:
+            self.rotate()
+
+    def rotate(self) -> bool:
+        """Seal the active segment (re-encoding it when the log uses zlib)."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return False
+        index = self._load_index()
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{index['next']:06d}"
+        staged = self.segment_dir / f'{name}.jsonl'
+        os.replace(self.path, staged)           # Appenders reopen the path and start a fresh file
+        self.path.touch()                       # Readers still see the log right after rotation
+        active = self._sync_staged(staged, index.get('active'))
+        if self.suffix == '.jz':
+            seg = write_segment(self.segment_dir / f'{name}.jz',
+                                (e for _, e in read_jsonl(staged)), self.ts_field)
+            staged.unlink()
+        else:
+            seg = {k: active[k] for k in ('count', 'min', 'max', 'sparse')}
+            seg.update(name=staged.name, size=staged.stat().st_size)
+        index['segments'].append(seg)
+        index['next'] += 1
+        index['active'] = None
+        self._save_index()
+        return True
+
+    def _sync_staged(self, staged: Path, active: Optional[Dict]) -> Dict:
+        """Finish indexing a just-renamed active file (same inode, so the cursor still applies)."""
+        start, reset = start_offset(staged, active)
+        if active is None or reset:
+            active, start = empty_segment(staged.name), 0
+        for line_offset, line in read_records(staged, start):
+            event = parse(line)
+            if event is not None:
+                index_record(active, line_offset, event_time(event, self.ts_field))
+        return active
+
+    def rewrite(self, change: Callable[[Dict], Optional[Dict]]) -> int:
+        """Apply change() to every event (return the event, edited or not, or None to drop it).
+
+        Only segments with a changed or dropped event are rewritten. Returns the
+        number of events changed or dropped.
+        """
+        touched = 0
+        index = self._load_index()
+        self._sync_active()
+        for i, seg in enumerate(index['segments']):
+            path = self.segment_dir / seg['name']
+            events, n = self._changed(self._read_file(path), change)
+            if n:
+                index['segments'][i] = write_segment(path, events, self.ts_field)
+                touched += n
+        if self.path.exists():
+            events, n = self._changed(self._read_file(self.path), change)
+            if n:
+                write_segment(self.path, events, self.ts_field)
+                index['active'] = None
+                touched += n
+        if touched:
+            self._save_index()
+        return touched
+
+    @staticmethod
+    def _changed(events: Iterable[Dict], change: Callable[[Dict], Optional[Dict]]) -> Tuple[List[Dict], int]:
+        out, n = [], 0
+        for event in events:
+            before = dumps(event)
+            after = change(event)
+            if after is None or dumps(after) != before:
+                n += 1
+            if after is not None:
+                out.append(after)
+        return out, n
+
+    # --- reading ---
+
+    def _read_file(self, path: Path, start: int = 0) -> Iterator[Dict]:
+        reader = read_frames if path.suffix == '.jz' else read_jsonl
+        for _, event in reader(path, start):
+            yield event
+
+    def scan(self, since: Since = None, until: Since = None) -> Iterator[Dict]:
+        """Events in log order, limited to [since, until) when given.
+
+        With a range, events without a readable timestamp are left out;
+        segments entirely outside the range are never opened.
+        """
+        lo, hi = as_epoch(since), as_epoch(until)
+        for path, seg in self._files():
+            if lo is None and hi is None:
+                yield from self._read_file(path)
+                continue
+            if not in_range(seg, lo, hi):
+                continue
+            start = seek_point(seg, lo)
+            for event in self._read_file(path, start):
+                ts = event_time(event, self.ts_field)
+                if ts is None or (lo is not None and ts < lo) or (hi is not None and ts >= hi):
+                    continue
+                yield event
+
+    def read(self, since: Since = None, until: Since = None) -> List[Dict]:
+        return list(self.scan(since, until))
+
+    def tail(self, n: int) -> List[Dict]:
+        """The last n events in log order, reading only the newest segments needed."""
+        if n <= 0:
+            return []
+        picked: List[Dict] = []
+        for path, _ in reversed(self._files()):
+            events = list(self._read_file(path))
+            picked = events[-(n - len(picked)):] + picked
+            if len(picked) >= n:
+                break
+        return picked
+
+    def count(self) -> int:
+        return sum(seg['count'] for seg in self.segments())
+
+    def follow(self, from_start: bool = False, poll: float = 1.0,
+               idle_timeout: Optional[float] = None) -> Iterator[Dict]:
+        """Yield events as they are appended, across rotations (tail -F).
+
+        Starts at the current end of the active segment unless from_start.
+        Stops after idle_timeout seconds without a new event, if given.
+        """
+        fh, inode, idle = None, None, 0.0
+        pending = b''
+        try:
+            while True:
+                if fh is None and self.path.exists():
+                    fh = open(self.path, 'rb')
+                    inode = os.fstat(fh.fileno()).st_ino
+                    if not from_start:
+                        fh.seek(0, os.SEEK_END)
+                    from_start = True           # Files created after a rotation are read whole
+                got = False
+                if fh is not None:
+                    for line in fh:
+                        if not line.endswith(b'\n'):
+                            pending += line
+                            break
+                        line, pending = pending + line, b''
+                        event = parse(line)
+                        if event is not None:
+                            got = True
+                            yield event
+                    try:
+                        replaced = os.stat(self.path).st_ino != inode
+                    except FileNotFoundError:
+                        replaced = True
+                    if replaced:
+                        fh.close()
+                        fh, pending = None, b''
+                        continue
+                idle = 0.0 if got else idle + poll
+                if idle_timeout is not None and idle >= idle_timeout:
+                    return
+                time.sleep(poll)
+        finally:
+            if fh is not None:
+                fh.close()
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2:
+        print(__doc__)
+        return
+    cmd, log = args[0], EventLog(Path(args[1]).expanduser(),
+                                 encoding='zlib' if '--zlib' in args else 'jsonl')
+
+    if cmd == 'stats':
+        t0 = time.perf_counter()
+        segments = log.segments()
+        for seg in segments:
+            span = ''
+            if seg['min'] is not None:
+                span = (f"{datetime.fromtimestamp(seg['min'], timezone.utc):%Y-%m-%d} → "
+                        f"{datetime.fromtimestamp(seg['max'], timezone.utc):%Y-%m-%d}")
+            print(f"  {seg['name']:<28} {seg['count']:>7,} events {seg.get('size', 0):>10,} B  {span}")
+        print(f"🗂️ {sum(s['count'] for s in segments):,} events in {len(segments)} segments "
+              f"({time.perf_counter() - t0:.2f}s)")
+
+    elif cmd == 'tail':
+        n = int(args[2]) if len(args) > 2 and args[2].isdigit() else 10
+        for event in log.tail(n):
+            print(dumps(event))
+
+    elif cmd == 'follow':
+        try:
+            for event in log.follow():
+                print(dumps(event), flush=True)
+        except KeyboardInterrupt:
+            pass
+
+    elif cmd == 'rotate':
+        print("✅ Sealed active segment" if log.rotate() else "Nothing to rotate")
+
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
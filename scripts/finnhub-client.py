@@ -27,11 +27,15 @@ Docs: https://finnhub.io/docs/api
 import os
 import sys
 import json
-import urllib.request
-import urllib.parse
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import response_cache
+import quote_engine
 
 BASE_URL = "https://finnhub.io/api/v1"
 API_KEY = None
@@ -76,15 +80,10 @@ def _request(endpoint: str, params: dict = None) -> Any:
     params = params or {}
     params['token'] = API_KEY
     
-    query = urllib.parse.urlencode(params)
-    url = f"{BASE_URL}/{endpoint}?{query}"
-    
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"HTTP Error {e.code}: {e.reason}", file=sys.stderr)
+        return response_cache.get_json(f"{BASE_URL}/{endpoint}", params, provider='finnhub')
+    except market_http.HttpError as e:
+        print(f"HTTP Error {e.status}: {e.reason}", file=sys.stderr)
         return None
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -258,15 +257,21 @@ def get_peers(symbol: str) -> Dict:
 
 def watchlist(symbols: List[str]) -> List[Dict]:
     """Quick overview for multiple symbols"""
+    if API_KEY is None:
+        init()
+    quotes = quote_engine.get_quotes(symbols, provider='finnhub', api_key=API_KEY)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sentiments = dict(zip(symbols, pool.map(get_sentiment, symbols)))
+    
     results = []
     for sym in symbols:
-        quote = get_quote(sym)
-        sentiment = get_sentiment(sym)
+        quote = quotes.get(sym.upper())
+        sentiment = sentiments[sym]
         
         results.append({
             'symbol': sym,
-            'price': quote.get('price'),
-            'change_pct': quote.get('change_pct'),
+            'price': quote.price if quote else None,
+            'change_pct': quote.change_pct if quote else None,
             'sentiment_score': sentiment.get('sentiment', {}).get('score'),
             'buzz': sentiment.get('buzz', {}).get('buzz_ratio')
         })
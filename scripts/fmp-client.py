@@ -29,12 +29,15 @@ API Docs: https://site.financialmodelingprep.com/developer/docs
 import os
 import sys
 import json
-import urllib.request
-import urllib.error
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from datetime import datetime, timedelta
 
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import response_cache
+import quote_engine
+
 # Load API key
 def get_api_key() -> str:
     """Load FMP API key from environment or .secure/fmp.env"""
@@ -76,15 +79,10 @@ def _request(endpoint: str, params: dict = None, base: str = None) -> Any:
     params = params or {}
     params['apikey'] = API_KEY
     
-    query = '&'.join(f"{k}={v}" for k, v in params.items())
-    url = f"{base}/{endpoint}?{query}"
-    
     try:
-        with urllib.request.urlopen(url, timeout=15) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {e.reason}", "detail": body}
+        return response_cache.get_json(f"{base}/{endpoint}", params, provider='fmp')
+    except market_http.HttpError as e:
+        return {"error": f"HTTP {e.status}: {e.reason}", "detail": e.body}
     except Exception as e:
         return {"error": str(e)}
 
@@ -93,15 +91,11 @@ def _request(endpoint: str, params: dict = None, base: str = None) -> Any:
 # ============================================================
 
 def quote(symbols: List[str]) -> List[Dict]:
-    """Get real-time quotes for multiple symbols."""
-    results = []
-    for symbol in symbols:
-        result = _request('quote', {'symbol': symbol})
-        if result and isinstance(result, list):
-            results.extend(result)
-        elif result and isinstance(result, dict) and 'error' not in result:
-            results.append(result)
-    return results
+    """Get real-time quotes for multiple symbols (batched via quote_engine)."""
+    if API_KEY is None:
+        init()
+    quotes = quote_engine.get_quotes(symbols, api_key=API_KEY)
+    return [q.raw for q in quotes.values()]
 
 def profile(symbol: str) -> Dict:
     """Get company profile with detailed info."""
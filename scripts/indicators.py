@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Technical Indicators
+====================
+
+Vectorized indicators over price arrays from price_store.
+
+Every function takes a 1-D series (days,) or a matrix (symbols × days) and
+works along the last axis, so a whole watchlist is one call. Warm-up
+positions are NaN. Smoothing follows the usual conventions: EMA and Wilder
+averages are seeded with the SMA of the first `n` values, RSI and ATR use
+Wilder smoothing, Bollinger uses population std.
+
+Incremental: IndicatorState keeps the running values for every symbol and
+push() folds in one new bar in O(symbols), without recomputing history.
+
+Usage:
+    import indicators, price_store
+    dates, close = price_store.aligned(['NVDA', 'AMD'], days=250)
+    indicators.rsi(close)[:, -1]                  # latest RSI per symbol
+    line, signal, hist = indicators.macd(close)
+
+    state = indicators.IndicatorState.from_history(close)
+    latest = state.push(new_close)                 # {'sma_20': [...], 'rsi': [...], ...}
+
+    python3 scripts/indicators.py NVDA AMD         # Latest indicator table
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+TRADING_DAYS = 252
+
+
+def _f(x) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+def _nan_like(x: np.ndarray) -> np.ndarray:
+    return np.full(x.shape, np.nan)
+
+
+# === Moving averages ===
+
+def sma(x, n: int) -> np.ndarray:
+    """Simple moving average."""
+    x = _f(x)
+    out = _nan_like(x)
+    if x.shape[-1] < n:
+        return out
+    c = np.cumsum(x, axis=-1)
+    c = np.concatenate([np.zeros(x.shape[:-1] + (1,)), c], axis=-1)
+    out[..., n - 1:] = (c[..., n:] - c[..., :-n]) / n
+    return out
+
+
+def _smooth(x: np.ndarray, n: int, alpha: float) -> np.ndarray:
+    """Exponential smoothing seeded with the SMA of the first n values."""
+    out = _nan_like(x)
+    if x.shape[-1] < n:
+        return out
+    prev = x[..., :n].mean(axis=-1)
+    out[..., n - 1] = prev
+    for t in range(n, x.shape[-1]):
+        prev = prev + alpha * (x[..., t] - prev)
+        out[..., t] = prev
+    return out
+
+
+def ema(x, n: int) -> np.ndarray:
+    """Exponential moving average, alpha = 2 / (n + 1)."""
+    return _smooth(_f(x), n, 2.0 / (n + 1))
+
+
+def wilder(x, n: int) -> np.ndarray:
+    """Wilder's smoothing (RMA), alpha = 1 / n."""
+    return _smooth(_f(x), n, 1.0 / n)
+
+
+def rolling_std(x, n: int) -> np.ndarray:
+    """Population standard deviation over a trailing window."""
+    x = _f(x)
+    out = _nan_like(x)
+    if x.shape[-1] < n:
+        return out
+    out[..., n - 1:] = sliding_window_view(x, n, axis=-1).std(axis=-1)
+    return out
+
+
+# === Oscillators / bands ===
+
+def rsi(close, n: int = 14) -> np.ndarray:
+    """Relative Strength Index (Wilder)."""
+    close = _f(close)
+    delta = np.diff(close, axis=-1)
+    gain = wilder(np.clip(delta, 0, None), n)
+    loss = wilder(np.clip(-delta, 0, None), n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.where(loss == 0, 100.0, 100 - 100 / (1 + gain / loss))
+    value = np.where(np.isnan(gain), np.nan, value)
+    return np.concatenate([np.full(close.shape[:-1] + (1,), np.nan), value], axis=-1)
+
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(MACD line, signal line, histogram)."""
+    close = _f(close)
+    line = ema(close, fast) - ema(close, slow)
+    sig = _nan_like(line)
+    start = slow - 1
+    if close.shape[-1] >= start + signal:
+        sig[..., start:] = ema(line[..., start:], signal)
+    return line, sig, line - sig
+
+
+def bollinger(close, n: int = 20, k: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(middle, upper, lower) bands."""
+    mid = sma(close, n)
+    band = k * rolling_std(close, n)
+    return mid, mid + band, mid - band
+
+
+def true_range(high, low, close) -> np.ndarray:
+    high, low, close = _f(high), _f(low), _f(close)
+    prev = np.concatenate([close[..., :1], close[..., :-1]], axis=-1)
+    return np.maximum(high, prev) - np.minimum(low, prev)
+
+
+def atr(high, low, close, n: int = 14) -> np.ndarray:
+    """Average True Range (Wilder)."""
+    return wilder(true_range(high, low, close), n)
+
+
+# === Returns / risk ===
+
+def returns(close) -> np.ndarray:
+    """Simple daily returns (first position NaN)."""
+    close = _f(close)
+    out = _nan_like(close)
+    out[..., 1:] = close[..., 1:] / close[..., :-1] - 1
+    return out
+
+
+def log_returns(close) -> np.ndarray:
+    close = _f(close)
+    out = _nan_like(close)
+    out[..., 1:] = np.diff(np.log(close), axis=-1)
+    return out
+
+
+def change_pct(close) -> np.ndarray:
+    """Percent change from first to last value."""
+    close = _f(close)
+    return (close[..., -1] / close[..., 0] - 1) * 100
+
+
+def rolling_volatility(close, n: int = 20, annualize: bool = True) -> np.ndarray:
+    """Rolling std of log returns (annualized by default)."""
+    vol = rolling_std(log_returns(close)[..., 1:], n)
+    vol = np.concatenate([np.full(vol.shape[:-1] + (1,), np.nan), vol], axis=-1)
+    return vol * np.sqrt(TRADING_DAYS) if annualize else vol
+
+
+def drawdown(close) -> Tuple[np.ndarray, np.ndarray]:
+    """(drawdown from running peak as a fraction ≤ 0, max drawdown per series)."""
+    close = _f(close)
+    peak = np.maximum.accumulate(close, axis=-1)
+    dd = close / peak - 1
+    return dd, dd.min(axis=-1)
+
+
+# === Incremental updates (one new bar) ===
+
+def sma_update(prev, new, dropped, n: int):
+    """SMA after appending `new` and dropping the value that left the window."""
+    return prev + (_f(new) - _f(dropped)) / n
+
+
+def ema_update(prev, new, n: int):
+    return prev + 2.0 / (n + 1) * (_f(new) - prev)
+
+
+def wilder_update(prev, new, n: int):
+    return prev + (_f(new) - prev) / n
+
+
+class IndicatorState:
+    """Running indicator values for a vector of symbols, advanced one bar at a time.
+
+    Keeps only what each indicator needs: window tails for SMA/Bollinger/
+    volatility, last smoothed values for EMA/RSI/MACD/ATR, running peak for
+    drawdown.
+    """
+
+    SMA_PERIODS = (20, 50)
+    RSI_N = 14
+    ATR_N = 14
+    BOLL_N = 20
+    VOL_N = 20
+    MACD = (12, 26, 9)
+
+    def __init__(self):
+        self.window = None      # symbols × max window of recent closes
+        self.prev_close = None
+        self.ema_fast = self.ema_slow = self.signal = None
+        self.avg_gain = self.avg_loss = None
+        self.atr = None
+        self.peak = None
+
+    @classmethod
+    def from_history(cls, close, high=None, low=None) -> 'IndicatorState':
+        """Seed from a (symbols × days) history; needs at least MACD slow + signal bars."""
+        close = np.atleast_2d(_f(close))
+        s = cls()
+        keep = max(max(cls.SMA_PERIODS), cls.BOLL_N, cls.VOL_N + 1)
+        s.window = close[:, -keep:].copy()
+        s.prev_close = close[:, -1].copy()
+        fast, slow, sig = cls.MACD
+        ef, es = ema(close, fast), ema(close, slow)
+        s.ema_fast, s.ema_slow = ef[:, -1], es[:, -1]
+        s.signal = macd(close, fast, slow, sig)[1][:, -1]
+        delta = np.diff(close, axis=-1)
+        s.avg_gain = wilder(np.clip(delta, 0, None), cls.RSI_N)[:, -1]
+        s.avg_loss = wilder(np.clip(-delta, 0, None), cls.RSI_N)[:, -1]
+        if high is not None and low is not None:
+            s.atr = atr(np.atleast_2d(high), np.atleast_2d(low), close, cls.ATR_N)[:, -1]
+        s.peak = close.max(axis=-1)
+        return s
+
+    def push(self, close, high=None, low=None) -> Dict[str, np.ndarray]:
+        """Fold in one bar per symbol and return the latest values."""
+        close = np.atleast_1d(_f(close))
+        fast, slow, sig = self.MACD
+        delta = close - self.prev_close
+        self.avg_gain = wilder_update(self.avg_gain, np.clip(delta, 0, None), self.RSI_N)
+        self.avg_loss = wilder_update(self.avg_loss, np.clip(-delta, 0, None), self.RSI_N)
+        self.ema_fast = ema_update(self.ema_fast, close, fast)
+        self.ema_slow = ema_update(self.ema_slow, close, slow)
+        line = self.ema_fast - self.ema_slow
+        self.signal = ema_update(self.signal, line, sig)
+        if self.atr is not None and high is not None and low is not None:
+            tr = np.maximum(_f(high), self.prev_close) - np.minimum(_f(low), self.prev_close)
+            self.atr = wilder_update(self.atr, tr, self.ATR_N)
+        self.peak = np.maximum(self.peak, close)
+        self.window = np.concatenate([self.window[:, 1:], close[:, None]], axis=1)
+        self.prev_close = close
+        return self.latest()
+
+    def latest(self) -> Dict[str, np.ndarray]:
+        w = self.window
+        out = {f'sma_{n}': w[:, -n:].mean(axis=1) for n in self.SMA_PERIODS}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['rsi'] = np.where(self.avg_loss == 0, 100.0, 100 - 100 / (1 + self.avg_gain / self.avg_loss))
+        line = self.ema_fast - self.ema_slow
+        out.update({'macd': line, 'macd_signal': self.signal, 'macd_hist': line - self.signal})
+        mid = w[:, -self.BOLL_N:].mean(axis=1)
+        band = 2.0 * w[:, -self.BOLL_N:].std(axis=1)
+        out.update({'boll_mid': mid, 'boll_upper': mid + band, 'boll_lower': mid - band})
+        out['volatility'] = np.diff(np.log(w[:, -(self.VOL_N + 1):]), axis=1).std(axis=1) * np.sqrt(TRADING_DAYS)
+        out['drawdown'] = w[:, -1] / self.peak - 1
+        if self.atr is not None:
+            out['atr'] = self.atr
+        return out
+
+
+def snapshot(close, high=None, low=None) -> Dict[str, np.ndarray]:
+    """Latest value of every indicator per symbol, from full history."""
+    return IndicatorState.from_history(close, high, low).latest()
+
+
+def main():
+    symbols = [s.upper() for a in sys.argv[1:] for s in a.split(',') if s]
+    if not symbols:
+        print(__doc__)
+        return
+    sys.path.insert(0, str(Path(__file__).parent))
+    import price_store
+    store = price_store.get_store()
+    dates, close = store.aligned(symbols, days=300)
+    _, high = store.aligned(symbols, days=300, field='high', refresh=False)
+    _, low = store.aligned(symbols, days=300, field='low', refresh=False)
+    if close.shape[1] < 35:
+        print("❌ Not enough aligned history")
+        return
+    snap = snapshot(close, high, low)
+    print(f"📊 Indicators as of {dates[-1]}")
+    print(f"{'':<6} {'Close':>9} {'SMA20':>9} {'SMA50':>9} {'RSI':>6} {'MACD':>8} {'ATR':>7} {'Vol':>6} {'DD':>7}")
+    for i, sym in enumerate(symbols):
+        print(f"{sym:<6} {close[i, -1]:>9.2f} {snap['sma_20'][i]:>9.2f} {snap['sma_50'][i]:>9.2f} "
+              f"{snap['rsi'][i]:>6.1f} {snap['macd'][i]:>8.2f} {snap['atr'][i]:>7.2f} "
+              f"{snap['volatility'][i]:>6.0%} {snap['drawdown'][i]:>7.1%}")
+
+
+if __name__ == '__main__':
+    main()
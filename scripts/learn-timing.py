@@ -22,6 +22,9 @@ from pathlib import Path
 from collections import defaultdict
 import math
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 FEEDBACK_LOG = Path.home() / '.openclaw/workspace/memory/feedback-log.jsonl'
 SCHEDULING_FILE = Path.home() / '.openclaw/workspace/memory/scheduling-intelligence.json'
 LEARNING_STATE = Path.home() / '.openclaw/workspace/memory/timing-learner-state.json'
@@ -30,17 +33,7 @@ SGT_OFFSET = 8
 
 def load_feedback():
     """Load all feedback entries."""
-    entries = []
-    if not FEEDBACK_LOG.exists():
-        return entries
-    with open(FEEDBACK_LOG) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entries.append(json.loads(line))
-                except:
-                    pass
-    return entries
+    return EventLog(FEEDBACK_LOG).read()
 
 
 def load_scheduling():
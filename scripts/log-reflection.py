@@ -12,12 +12,14 @@ Options:
   --tags TAG1,TAG2  Comma-separated tags
 """
 
-import json
 import sys
 import argparse
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 REFLECTIONS_PATH = Path(__file__).parent.parent / "memory" / "reflections.jsonl"
 
 def log_reflection(task: str, outcome: str, reflection: str, lesson: str, 
@@ -37,12 +39,8 @@ def log_reflection(task: str, outcome: str, reflection: str, lesson: str,
     if tags:
         entry["tags"] = tags
     
-    # Ensure directory exists
-    REFLECTIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Append to file
-    with open(REFLECTIONS_PATH, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    # Append to the active segment (rotates once it fills)
+    EventLog(REFLECTIONS_PATH).append(entry)
     
     print(f"✓ Logged reflection for '{task}'")
     print(f"  Outcome: {outcome}")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Market Monitor - One polling loop for watchlist, position and thesis alerts
+
+Replaces the three cron-launched checks (watchlist-tracker check,
+position-tracker alerts, thesis-tracker check). Each interval it:
+
+1. Reads the watchlist, open positions and active theses
+2. Fetches ONE quote snapshot for the union of their symbols (quote_engine:
+   batch-quote, shared cache, in-flight dedupe)
+3. Evaluates all three rule sets against that same snapshot
+4. Pushes alerts onto a single asyncio queue; one writer dedupes them
+   (same alert at most once per day) and appends to monitor-alerts.jsonl
+
+Usage:
+    python3 scripts/market-monitor.py                 # Run forever (default 300s interval)
+    python3 scripts/market-monitor.py --interval 120
+    python3 scripts/market-monitor.py --once          # Single cycle (cron-compatible)
+    python3 scripts/market-monitor.py --tail [N]      # Show recent alerts
+"""
+
+import sys
+import json
+import time
+import signal
+import asyncio
+import importlib.util
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+import quote_engine
+
+MEMORY_DIR = Path.home() / '.openclaw/workspace/memory'
+ALERTS_FILE = MEMORY_DIR / 'monitor-alerts.jsonl'
+STATE_FILE = MEMORY_DIR / 'monitor-state.json'
+DEFAULT_INTERVAL = 300
+QUEUE_SIZE = 1000
+
+SCRIPTS_DIR = Path(__file__).parent
+_modules = {}
+
+
+def load_script(name: str):
+    """Import a hyphenated sibling script as a module."""
+    if name not in _modules:
+        spec = importlib.util.spec_from_file_location(name.replace('-', '_'), SCRIPTS_DIR / f'{name}.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+
+# === Snapshot + rules ===
+
+def collect() -> Tuple[Dict, List[Dict], Dict[str, Dict], List[str]]:
+    """(watchlist, open positions, active theses, union of their symbols)."""
+    wl = load_script('watchlist-tracker').load_watchlist()
+    positions = load_script('position-tracker').load_open_positions()
+    theses = {s: t for s, t in load_script('thesis-tracker').load_theses().get('theses', {}).items()
+              if t.get('status') == 'active'}
+    symbols = list(wl.get('tickers', []))
+    symbols += [p.get('ticker', '') for p in positions]
+    symbols += list(theses)
+    symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+    return wl, positions, theses, symbols
+
+
+def evaluate(wl: Dict, positions: List[Dict], theses: Dict[str, Dict],
+             quotes: Dict[str, 'quote_engine.Quote']) -> List[Dict]:
+    """Run every tracker's rules against one snapshot. Returns alert dicts."""
+    alerts = []
+    now = datetime.now(timezone.utc).isoformat()
+
+    # Watchlist: daily move threshold
+    watchlist = load_script('watchlist-tracker')
+    raw = {t: quotes[t.upper()].raw for t in wl.get('tickers', []) if t.upper() in quotes}
+    if raw:
+        moves, _, _ = watchlist.evaluate_prices(wl, raw)
+        watchlist.save_watchlist(wl)
+        for a in moves:
+            alerts.append({'source': 'watchlist', 'ticker': a['ticker'], 'type': a['type'],
+                           'level': 'warning', 'message': a['message'], 'price': a['price']})
+
+    # Positions: expiry + strike distance
+    tracker = load_script('position-tracker')
+    for pos in positions:
+        q = quotes.get(pos.get('ticker', '').upper())
+        analysis = tracker.analyze_position(pos, q.price if q else None)
+        if analysis['status'] in ('critical', 'warning', 'watch'):
+            alerts.append({'source': 'position', 'ticker': analysis['ticker'],
+                           'type': f"position_{analysis['status']}", 'level': analysis['status'],
+                           'message': f"{analysis['ticker']}: {', '.join(analysis['alerts'])}",
+                           'price': analysis.get('current_price')})
+
+    # Theses: big move, conviction mismatch, stale
+    thesis_tracker = load_script('thesis-tracker')
+    for symbol, thesis in theses.items():
+        q = quotes.get(symbol.upper())
+        ret, triggers = thesis_tracker.thesis_triggers(thesis, q.price if q else None)
+        if triggers:
+            alerts.append({'source': 'thesis', 'ticker': symbol, 'type': 'thesis_review', 'level': 'watch',
+                           'message': f"{symbol} ({thesis.get('direction', 'long')}, "
+                                      f"{thesis.get('conviction', 5)}/10): {'; '.join(triggers)}",
+                           'return_pct': ret})
+
+    for a in alerts:
+        a['timestamp'] = now
+    return alerts
+
+
+# === Alert sink ===
+
+def load_sent() -> Dict:
+    """Alert keys already written today (survives restarts and --once runs)."""
+    today = datetime.now().strftime('%Y-%m-%d')
+    try:
+        state = json.loads(STATE_FILE.read_text())
+        if state.get('date') == today:
+            return {'date': today, 'sent': set(state.get('sent', []))}
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {'date': today, 'sent': set()}
+
+
+def save_sent(sent: Dict) -> None:
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STATE_FILE.write_text(json.dumps({'date': sent['date'], 'sent': sorted(sent['sent'])}))
+
+
+async def alert_writer(queue: asyncio.Queue) -> int:
+    """Single consumer: dedupe, append to ALERTS_FILE, print. Returns alerts written."""
+    sent = load_sent()
+    written = 0
+    while True:
+        alert = await queue.get()
+        if alert is None:
+            break
+        today = datetime.now().strftime('%Y-%m-%d')
+        if sent['date'] != today:
+            sent = {'date': today, 'sent': set()}
+        key = f"{alert['source']}:{alert['ticker']}:{alert['type']}"
+        if key in sent['sent']:
+            continue
+        sent['sent'].add(key)
+        ALERTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(ALERTS_FILE, 'a') as f:
+            f.write(json.dumps(alert) + '\n')
+        save_sent(sent)
+        written += 1
+        print(f"🚨 [{alert['source']}] {alert['message']}", flush=True)
+    return written
+
+
+# === Poll loop ===
+
+async def poll(queue: asyncio.Queue, stop: asyncio.Event, interval: float, once: bool) -> None:
+    engine = quote_engine.get_engine('fmp')
+    try:
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            trips = engine.round_trips
+            try:
+                wl, positions, theses, symbols = await asyncio.to_thread(collect)
+                quotes = await asyncio.to_thread(engine.get, symbols) if symbols else {}
+                alerts = await asyncio.to_thread(evaluate, wl, positions, theses, quotes)
+            except Exception as e:
+                print(f"⚠️ Cycle failed: {e}", file=sys.stderr, flush=True)
+                alerts, symbols, quotes, positions, theses = [], [], {}, [], {}
+                wl = {}
+            for alert in alerts:
+                await queue.put(alert)
+            # What the three separate scripts would have requested
+            separate = (1 if wl.get('tickers') else 0) + len(positions) + len(theses)
+            elapsed = time.perf_counter() - t0
+            print(f"⏱️ {datetime.now().strftime('%H:%M:%S')} {len(symbols)} symbols, {len(quotes)} quotes, "
+                  f"{engine.round_trips - trips} round-trips (separate scripts: ~{separate}), "
+                  f"{len(alerts)} alerts, {elapsed:.2f}s", flush=True)
+            if once:
+                break
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=max(0.0, interval - elapsed))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await queue.put(None)
+
+
+async def run(interval: float = DEFAULT_INTERVAL, once: bool = False) -> int:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    writer = asyncio.create_task(alert_writer(queue))
+    await poll(queue, stop, interval, once)
+    return await writer
+
+
+def tail(n: int = 20) -> None:
+    if not ALERTS_FILE.exists():
+        print("No alerts yet.")
+        return
+    lines = ALERTS_FILE.read_text().splitlines()[-n:]
+    for line in lines:
+        try:
+            a = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        print(f"{a.get('timestamp', '')[:16]}  [{a.get('source')}] {a.get('message')}")
+
+
+def main():
+    args = sys.argv[1:]
+    if '--help' in args or '-h' in args:
+        print(__doc__)
+        return
+    if '--tail' in args:
+        i = args.index('--tail')
+        tail(int(args[i + 1]) if i + 1 < len(args) else 20)
+        return
+    interval = DEFAULT_INTERVAL
+    if '--interval' in args:
+        i = args.index('--interval')
+        interval = float(args[i + 1])
+    once = '--once' in args
+    if not once:
+        print(f"👀 Market monitor: every {interval:.0f}s, alerts → {ALERTS_FILE}", flush=True)
+    written = asyncio.run(run(interval, once))
+    if not once:
+        print(f"👋 Stopped ({written} alerts written)")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,9 @@ from scipy.io import wavfile
 import subprocess
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+import price_store
+
 # Different timbres for different stocks (fundamental + harmonic ratios)
 INSTRUMENTS = {
     'piano': {'harmonics': [1.0, 0.5, 0.25, 0.125], 'attack': 0.02, 'decay': 0.3},
@@ -28,13 +31,11 @@ STOCK_CONFIG = {
 }
 
 def get_stock_data(symbol: str, days: int = 20):
-    """Fetch historical data using yfinance."""
+    """Last `days` daily closes from the local price store."""
     try:
-        import yfinance as yf
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=f"{days}d")
-        return hist if not hist.empty else None
-    except:
+        closes = price_store.history(symbol, days)['close']
+        return closes if len(closes) else None
+    except Exception:
         return None
 
 def generate_instrument_tone(freq: float, duration: float, instrument: dict, 
@@ -84,23 +85,21 @@ def create_symphony(symbols: list, days: int = 20, note_duration: float = 0.4) -
     
     sample_rate = 44100
     
-    # Fetch all data
-    stock_data = {}
-    for symbol in symbols:
-        data = get_stock_data(symbol, days)
-        if data is not None and len(data) > 1:
-            stock_data[symbol] = data['Close'].values
-            print(f"   ✓ {symbol}: {len(data)} days")
-    
-    if not stock_data:
+    # Fetch all data (topped up concurrently, aligned on common trading days)
+    store = price_store.get_store()
+    store.update_many(symbols)
+    available = [s for s in symbols if len(store.read(s)['date']) > 1]
+    stock_data, dates = {}, []
+    if available:
+        dates, closes = store.aligned(available, days, refresh=False)
+        for symbol, prices in zip(available, closes):
+            stock_data[symbol] = prices
+            print(f"   ✓ {symbol}: {len(prices)} days")
+    
+    if not stock_data or len(dates) < 2:
         print("   ❌ No data available")
         return None
     
-    # Find common length
-    min_len = min(len(v) for v in stock_data.values())
-    for symbol in stock_data:
-        stock_data[symbol] = stock_data[symbol][:min_len]
-    
     # Generate each stock's track
     tracks = {}
     for symbol, prices in stock_data.items():
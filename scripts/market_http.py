@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Market HTTP Transport
+=====================
+
+Shared HTTP layer for the market-data clients (FMP, Finnhub, Benzinga,
+Alpha Vantage, Danelfin). Stdlib only.
+
+- Keep-alive connection pool per host (http.client), thread-safe
+- Per-provider rate limiting (token bucket) and in-flight request cap
+- Retry with jittered exponential backoff on 429 / 5xx / dropped connections,
+  honouring Retry-After
+- gzip transfer encoding
+- Counters for requests, retries and connection reuse
+
+Usage:
+    import market_http
+    data = market_http.get_json('https://financialmodelingprep.com/stable/quote',
+                                {'symbol': 'NVDA', 'apikey': key}, provider='fmp')
+    market_http.stats()   # {'requests': .., 'connections_opened': .., 'reused': ..}
+
+Errors:
+    HttpError       non-2xx response after retries (has .status, .reason, .body)
+    TransportError  network failure after retries
+"""
+
+import gzip
+import json
+import time
+import random
+import threading
+import http.client
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+
+USER_AGENT = 'alyosha-market/1.0'
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5    # Seconds; doubles per attempt, full jitter
+BACKOFF_MAX = 8.0
+MAX_IDLE_PER_HOST = 8
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Requests per second (sustained) and burst size per provider
+PROVIDER_LIMITS = {
+    'fmp': (50.0, 50),             # Ultimate tier: 3000/min
+    'finnhub': (1.0, 30),          # Free tier: 60/min, 30/s cap
+    'benzinga': (10.0, 10),
+    'alphavantage': (5 / 60, 5),   # Free tier: 5/min
+    'danelfin': (2.0, 4),
+}
+# Max requests in flight per provider (across threads)
+PROVIDER_CONCURRENCY = {
+    'fmp': 8,
+    'finnhub': 4,
+    'benzinga': 4,
+    'alphavantage': 1,
+    'danelfin': 2,
+}
+PROVIDER_TIMEOUTS = {'danelfin': 30}
+DEFAULT_TIMEOUT = 15
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, reason: str, body: str = ''):
+        super().__init__(f"HTTP {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+class TransportError(Exception):
+    pass
+
+
+# === Rate limiting ===
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_slots: Dict[str, threading.BoundedSemaphore] = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket(provider: Optional[str]) -> Optional[TokenBucket]:
+    if provider not in PROVIDER_LIMITS:
+        return None
+    with _buckets_lock:
+        if provider not in _buckets:
+            _buckets[provider] = TokenBucket(*PROVIDER_LIMITS[provider])
+        return _buckets[provider]
+
+
+def _slot(provider: Optional[str]) -> Optional[threading.BoundedSemaphore]:
+    """Semaphore capping concurrent requests to a provider."""
+    if provider not in PROVIDER_CONCURRENCY:
+        return None
+    with _buckets_lock:
+        if provider not in _slots:
+            _slots[provider] = threading.BoundedSemaphore(PROVIDER_CONCURRENCY[provider])
+        return _slots[provider]
+
+
+# === Connection pool ===
+
+_pool: Dict[Tuple[str, str, int], list] = {}
+_pool_lock = threading.Lock()
+_stats = {'requests': 0, 'connections_opened': 0, 'reused': 0, 'retries': 0, 'bytes': 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += n
+
+
+def _acquire(scheme: str, host: str, port: int, timeout: float, fresh: bool = False):
+    """Idle pooled connection for host (unless fresh), or a new one. Returns (conn, reused)."""
+    key = (scheme, host, port)
+    with _pool_lock:
+        idle = None if fresh else _pool.get(key)
+        if idle:
+            conn = idle.pop()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+    cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+    _count('connections_opened')
+    return cls(host, port, timeout=timeout), False
+
+
+def _release(scheme: str, host: str, port: int, conn) -> None:
+    with _pool_lock:
+        idle = _pool.setdefault((scheme, host, port), [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def close_all() -> None:
+    """Close every pooled connection."""
+    with _pool_lock:
+        for idle in _pool.values():
+            for conn in idle:
+                conn.close()
+        _pool.clear()
+
+
+def stats() -> Dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+# === Requests ===
+
+def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    if retry_after:
+        try:
+            return min(float(retry_after), 60.0)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def build_url(url: str, params: Optional[Dict] = None) -> str:
+    """Append params (None values dropped) to url."""
+    if not params:
+        return url
+    query = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+def request(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            provider: Optional[str] = None, timeout: Optional[float] = None,
+            max_retries: int = MAX_RETRIES) -> bytes:
+    """GET url through the pool. Returns the (decompressed) body."""
+    slot = _slot(provider)
+    if slot is None:
+        return _request(url, params, headers, provider, timeout, max_retries)
+    with slot:
+        return _request(url, params, headers, provider, timeout, max_retries)
+
+
+def _request(url: str, params: Optional[Dict], headers: Optional[Dict],
+             provider: Optional[str], timeout: Optional[float], max_retries: int) -> bytes:
+    full = urllib.parse.urlsplit(build_url(url, params))
+    scheme = full.scheme or 'https'
+    host = full.hostname
+    port = full.port or (443 if scheme == 'https' else 80)
+    path = full.path or '/'
+    if full.query:
+        path += '?' + full.query
+    timeout = timeout or PROVIDER_TIMEOUTS.get(provider, DEFAULT_TIMEOUT)
+    hdrs = {'User-Agent': USER_AGENT, 'Accept': 'application/json', 'Accept-Encoding': 'gzip'}
+    hdrs.update(headers or {})
+    bucket = _bucket(provider)
+
+    attempt = 0
+    stale = False
+    while attempt <= max_retries:
+        if bucket and not stale:
+            bucket.acquire()
+        conn, reused = _acquire(scheme, host, port, timeout, fresh=stale)
+        _count('requests')
+        if reused:
+            _count('reused')
+        try:
+            conn.request('GET', path, headers=hdrs)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            # A pooled socket the server already closed: retry once, at once, on a
+            # fresh connection without spending an attempt or a backoff
+            stale = reused and isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError,
+                                              BrokenPipeError))
+            if stale:
+                _count('retries')
+                continue
+            if attempt == max_retries:
+                raise TransportError(str(e)) from e
+            _count('retries')
+            time.sleep(_backoff(attempt))
+            attempt += 1
+            continue
+        stale = False
+
+        if resp.getheader('Content-Encoding', '').lower() == 'gzip':
+            body = gzip.decompress(body)
+        _count('bytes', len(body))
+
+        if resp.will_close:
+            conn.close()
+        else:
+            _release(scheme, host, port, conn)
+
+        if 200 <= resp.status < 300:
+            return body
+        if resp.status in RETRY_STATUSES and attempt < max_retries:
+            _count('retries')
+            time.sleep(_backoff(attempt, resp.getheader('Retry-After')))
+            attempt += 1
+            continue
+        raise HttpError(resp.status, resp.reason, body.decode(errors='replace'))
+
+    raise TransportError(f"gave up after {max_retries + 1} attempts: {url}")
+
+
+def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+             provider: Optional[str] = None, timeout: Optional[float] = None) -> Any:
+    """GET url and decode JSON."""
+    return json.loads(request(url, params, headers, provider, timeout).decode())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Phrase Scanner
+==============
+
+Single-pass multi-lexicon phrase matcher for transcript analysis, shared by
+deep-analyzer, transcript-compare and transcript-analyzer.
+
+All phrases of all lexicons are compiled into one trie-shaped regex, so a
+50k-character transcript is scanned once for every lexicon (hedging,
+deflection, blame, guidance, sentiment, ...) instead of once per phrase with
+str.count. The regex (C speed) finds each start and its longest phrase; only
+phrases that extend a shorter phrase need a Python trie walk.
+
+Matching is case-insensitive. Substring mode counts like str.count
+(non-overlapping per phrase, no word boundaries); whole_words mode only
+matches complete words, like tokenizing with \\b[a-z]+\\b.
+
+Usage:
+    from phrase_scanner import PhraseScanner
+    scanner = PhraseScanner({'hedging': HEDGING_PHRASES, 'excuse': EXCUSE_PHRASES})
+    result = scanner.scan(content, sections={'prepared': (0, qa_start), 'qa': (qa_start, len(content))})
+    result.counts['hedging']                  # whole text
+    result.section_counts['qa']['hedging']    # one section
+    result.hits['qa']                         # [(offset, phrase, lexicon), ...]
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Span = Tuple[int, int]
+Hit = Tuple[int, str, str]      # (offset, phrase, lexicon)
+
+_END = ''                       # Trie key marking a complete phrase
+
+
+@dataclass
+class ScanResult:
+    """Per-lexicon counts for the whole text and for each section, plus hit positions."""
+    counts: Dict[str, int]
+    section_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    hits: Dict[str, List[Hit]] = field(default_factory=dict)
+
+    def section(self, name: str) -> Dict[str, int]:
+        return self.section_counts.get(name, {})
+
+
+def _trie_regex(node: Dict) -> str:
+    """Regex equivalent to the trie below node; shared prefixes branch only once."""
+    branches = []
+    for ch in sorted(k for k in node if k != _END):
+        branches.append(re.escape(ch) + _trie_regex(node[ch]))
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if _END in node:
+        body = '(?:' + body + ')?'
+    return body
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+class PhraseScanner:
+    """Compiled matcher over named phrase lists."""
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]], whole_words: bool = False):
+        self.whole_words = whole_words
+        self.lexicons: Dict[str, Tuple[str, ...]] = {}
+        self._owners: Dict[str, List[str]] = {}      # phrase -> lexicons containing it
+        self._trie: Dict = {}
+
+        for name, phrases in lexicons.items():
+            unique = tuple(dict.fromkeys(p.lower() for p in phrases if p))
+            self.lexicons[name] = unique
+            for phrase in unique:
+                self._owners.setdefault(phrase, []).append(name)
+                node = self._trie
+                for ch in phrase:
+                    node = node.setdefault(ch, {})
+                node[_END] = phrase
+
+        # Phrases that extend a shorter phrase need the trie walk; for the rest
+        # the (greedy, longest) regex match already is the only phrase at that start
+        self._extends = {p for p in self._owners
+                         if any(p[:i] in self._owners for i in range(1, len(p)))}
+
+        pattern = f'(?=({_trie_regex(self._trie)}))' if self._trie else '(?!)'
+        if whole_words:
+            pattern = r'\b' + pattern
+        self._start_re = re.compile(pattern)
+
+    def _phrases_at(self, text: str, pos: int):
+        """Every phrase starting at pos, shortest first."""
+        node = self._trie
+        i, n = pos, len(text)
+        while i < n:
+            node = node.get(text[i])
+            if node is None:
+                return
+            i += 1
+            phrase = node.get(_END)
+            if phrase is not None and not (self.whole_words and i < n and _is_word_char(text[i])):
+                yield phrase, i
+
+    def scan(self, text: str, sections: Optional[Dict[str, Span]] = None) -> ScanResult:
+        """
+        Count every lexicon in one pass over text.
+
+        sections maps a name to a (start, end) character span of text; a hit
+        belongs to a section when it lies entirely inside the span. Offsets
+        index into text.
+        """
+        lowered = text.lower()
+        n = len(lowered)
+        sections = sections or {}
+        counts = {name: 0 for name in self.lexicons}
+        section_counts = {s: {name: 0 for name in self.lexicons} for s in sections}
+        hits: Dict[str, List[Hit]] = {s: [] for s in sections}
+        last_end: Dict[str, int] = {}          # per phrase, for str.count-style non-overlap
+
+        for m in self._start_re.finditer(lowered):
+            start = m.start()
+            longest = m.group(1)
+            if longest in self._extends:
+                found = self._phrases_at(lowered, start)
+            else:
+                end = start + len(longest)
+                if self.whole_words and end < n and _is_word_char(lowered[end]):
+                    continue
+                found = ((longest, end),)
+            for phrase, end in found:
+                if start < last_end.get(phrase, 0):
+                    continue
+                last_end[phrase] = end
+                owners = self._owners[phrase]
+                for name in owners:
+                    counts[name] += 1
+                if not sections:
+                    continue
+                for s, (lo, hi) in sections.items():
+                    if lo <= start and end <= hi:
+                        for name in owners:
+                            section_counts[s][name] += 1
+                            hits[s].append((start, phrase, name))
+
+        return ScanResult(counts=counts, section_counts=section_counts, hits=hits)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Per-lexicon counts for the whole text."""
+        return self.scan(text).counts
+
+
+def count_phrases(text: str, phrases: Iterable[str]) -> int:
+    """One-off count of any phrase in text (builds a throwaway scanner)."""
+    return PhraseScanner({'_': phrases}).count(text)['_']
@@ -17,46 +17,47 @@ Usage:
     python3 position-tracker.py history   # Show position history with P&L
 """
 
-import json
 import sys
-import subprocess
+import importlib.util
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import re
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 JOURNAL_FILE = Path.home() / '.openclaw/workspace/memory/trade-journal.jsonl'
 ALERTS_FILE = Path.home() / '.openclaw/workspace/memory/position-alerts.json'
 
 
 def load_open_positions():
     """Load open positions from trade journal."""
-    positions = []
-    if not JOURNAL_FILE.exists():
-        return positions
-    
-    with open(JOURNAL_FILE) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    trade = json.loads(line)
-                    if trade.get('status') == 'open':
-                        positions.append(trade)
-                except:
-                    pass
-    return positions
+    return [t for t in journal().scan() if t.get('status') == 'open']
+
+
+def journal():
+    return EventLog(JOURNAL_FILE, ts_field='opened')
+
+
+_fmp = None
+
+
+def load_fmp_client():
+    """Import fmp-client.py in-process (shares its response cache and connection pool)."""
+    global _fmp
+    if _fmp is None:
+        spec = importlib.util.spec_from_file_location('fmp_client', Path(__file__).parent / 'fmp-client.py')
+        _fmp = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_fmp)
+    return _fmp
 
 
 def get_quote(ticker):
-    """Get current price via FMP client."""
+    """Get current price via FMP client (cached for a few seconds)."""
     try:
-        result = subprocess.run(
-            ['python3', str(Path.home() / '.openclaw/workspace/scripts/fmp-client.py'), 'quote', ticker],
-            capture_output=True, text=True, timeout=30
-        )
-        # Parse: "SPY: $689.53 (-5.88, -0.85%)"
-        match = re.search(r'\$([0-9,.]+)', result.stdout)
-        if match:
-            return float(match.group(1).replace(',', ''))
+        quotes = load_fmp_client().quote([ticker])
+        if quotes and quotes[0].get('price') is not None:
+            return float(quotes[0]['price'])
     except:
         pass
     return None
@@ -98,8 +99,11 @@ def days_to_expiry(expiry_str):
         return None
 
 
-def analyze_position(position):
-    """Analyze a single position and return status."""
+def analyze_position(position, price=None):
+    """Analyze a single position and return status.
+    
+    price: underlying price from a shared snapshot (fetched here if omitted).
+    """
     ticker = position.get('ticker', 'UNKNOWN')
     notes = position.get('notes', '')
     direction = position.get('direction', 'unknown')
@@ -113,7 +117,8 @@ def analyze_position(position):
     }
     
     # Get current price
-    price = get_quote(ticker)
+    if price is None:
+        price = get_quote(ticker)
     if price:
         result['current_price'] = price
     
@@ -302,8 +307,7 @@ def add_position():
             pass
     
     # Append to journal
-    with open(JOURNAL_FILE, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    journal().append(entry)
     
     print(f"\n✅ Added: {ticker} {direction} {notes}")
     
@@ -315,76 +319,51 @@ def add_position():
 
 def close_position(ticker):
     """Close an open position."""
-    positions = []
-    closed = False
-    
-    if not JOURNAL_FILE.exists():
-        print("No positions found")
-        return
+    closed = []
     
-    with open(JOURNAL_FILE) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    trade = json.loads(line)
-                    positions.append(trade)
-                except:
-                    pass
-    
-    # Find and close matching position
-    for pos in positions:
-        if pos.get('ticker', '').upper() == ticker.upper() and pos.get('status') == 'open':
-            pos['status'] = 'closed'
-            pos['closed_at'] = datetime.now(timezone.utc).isoformat()
+    # Find and close the first matching position
+    def close(pos):
+        if closed or pos.get('ticker', '').upper() != ticker.upper() or pos.get('status') != 'open':
+            return pos
+        pos = dict(pos, status='closed', closed_at=datetime.now(timezone.utc).isoformat())
+        
+        # Get exit price
+        exit_price = get_quote(ticker)
+        if exit_price:
+            pos['exit_price'] = exit_price
             
-            # Get exit price
-            exit_price = get_quote(ticker)
-            if exit_price:
-                pos['exit_price'] = exit_price
+            # Calculate P&L if entry price exists
+            if 'entry_price' in pos:
+                entry = pos['entry_price']
+                direction = pos.get('direction', 'long')
                 
-                # Calculate P&L if entry price exists
-                if 'entry_price' in pos:
-                    entry = pos['entry_price']
-                    direction = pos.get('direction', 'long')
-                    
-                    if direction == 'long':
-                        pnl_pct = ((exit_price - entry) / entry) * 100
-                    else:
-                        pnl_pct = ((entry - exit_price) / entry) * 100
-                    
-                    pos['pnl_pct'] = round(pnl_pct, 2)
-            
-            closed = True
-            print(f"✅ Closed: {ticker}")
-            if 'pnl_pct' in pos:
-                emoji = "🟢" if pos['pnl_pct'] > 0 else "🔴"
-                print(f"   {emoji} P&L: {pos['pnl_pct']:+.1f}%")
-            break
+                if direction == 'long':
+                    pnl_pct = ((exit_price - entry) / entry) * 100
+                else:
+                    pnl_pct = ((entry - exit_price) / entry) * 100
+                
+                pos['pnl_pct'] = round(pnl_pct, 2)
+        
+        closed.append(pos)
+        return pos
+    
+    # Only the segment holding the position is rewritten
+    journal().rewrite(close)
     
     if not closed:
         print(f"❌ No open position found for {ticker}")
         return
     
-    # Rewrite journal
-    with open(JOURNAL_FILE, 'w') as f:
-        for pos in positions:
-            f.write(json.dumps(pos) + '\n')
+    pos = closed[0]
+    print(f"✅ Closed: {ticker}")
+    if 'pnl_pct' in pos:
+        emoji = "🟢" if pos['pnl_pct'] > 0 else "🔴"
+        print(f"   {emoji} P&L: {pos['pnl_pct']:+.1f}%")
 
 
 def show_history():
     """Show position history with P&L."""
-    if not JOURNAL_FILE.exists():
-        print("No position history")
-        return
-    
-    positions = []
-    with open(JOURNAL_FILE) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    positions.append(json.loads(line))
-                except:
-                    pass
+    positions = journal().read()
     
     if not positions:
         print("No position history")
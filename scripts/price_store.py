@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Price Store
+===========
+
+Local daily OHLCV history (split- and dividend-adjusted where the source
+offers it), one columnar directory per symbol.
+
+    ~/.openclaw/workspace/memory/prices/NVDA/
+        date.i4  open.f8  high.f8  low.f8  close.f8  volume.f8  meta.json
+
+Each column is a raw little-endian array appended to in place, so reading a
+symbol is a handful of np.fromfile calls and a top-up only writes new bars.
+Top-up asks the source for bars from the last settled bar onward (the newest
+bar is re-written, since it may have been an intraday snapshot). Adjusted
+prices are rescaled back in time by every split or dividend, so when the
+settled bar's adjusted close no longer matches the stored one the symbol's
+whole range is fetched again and replaced.
+
+Sources, first available wins: FMP (FMP_API_KEY), Alpha Vantage
+(ALPHAVANTAGE_API_KEY), yfinance. Alpha Vantage's free tier only serves
+unadjusted, compact (100 bar) series; those are topped up from the last
+stored bar without the re-adjustment check. Set ALPHAVANTAGE_PREMIUM=1
+for adjusted, full-length history.
+
+Usage:
+    import price_store
+    bars = price_store.history('NVDA', days=30)          # {'date', 'open', ..., 'volume'} arrays
+    dates, closes = price_store.aligned(['NVDA', 'AMD'], days=60)   # closes: symbols × days
+
+    python3 scripts/price_store.py update NVDA AMD AVGO
+    python3 scripts/price_store.py show NVDA [days]
+    python3 scripts/price_store.py --status
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+from pathlib import Path
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+
+PRICE_DIR = Path.home() / '.openclaw/workspace/memory/prices'
+COLUMNS = {
+    'date': '<i4',       # Days since 1970-01-01
+    'open': '<f8',
+    'high': '<f8',
+    'low': '<f8',
+    'close': '<f8',
+    'volume': '<f8',
+}
+INITIAL_YEARS = 5          # History pulled the first time a symbol is seen
+REFRESH_SECONDS = 3600     # Don't ask the source again within this window
+UPDATE_WORKERS = 8
+ADJUST_TOLERANCE = 1e-6    # Relative change in a settled adjusted close that means re-adjustment
+
+FMP_EOD_URL = "https://financialmodelingprep.com/stable/historical-price-eod/dividend-adjusted"
+ALPHAVANTAGE_URL = "https://www.alphavantage.co/query"
+
+Bars = Dict[str, np.ndarray]
+
+
+def load_key(name: str) -> Optional[str]:
+    """{NAME}_API_KEY from env or ~/.secure/{name}.env."""
+    return load_setting(name, f"{name.upper()}_API_KEY")
+
+
+def load_setting(name: str, var: str) -> Optional[str]:
+    """var from env or ~/.secure/{name}.env."""
+    if os.environ.get(var):
+        return os.environ[var]
+    path = Path.home() / f'.secure/{name.lower()}.env'
+    if path.exists():
+        for line in path.read_text().splitlines():
+            if line.startswith(f'{var}='):
+                return line.split('=', 1)[1].strip().strip('"\'')
+    return None
+
+
+def to_day(d) -> int:
+    """'2026-01-30' / date -> days since epoch."""
+    if isinstance(d, str):
+        d = date.fromisoformat(d[:10])
+    return (d - date(1970, 1, 1)).days
+
+
+def to_iso(day: int) -> str:
+    """Days since epoch -> '2026-01-30'."""
+    return (date(1970, 1, 1) + timedelta(days=int(day))).isoformat()
+
+
+def empty_bars() -> Bars:
+    return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+
+def rows_to_bars(rows: List[Dict]) -> Bars:
+    """[{'date', 'open', ...}] (any order) -> chronological column arrays."""
+    rows = sorted(rows, key=lambda r: r['date'])
+    bars = {'date': np.array([to_day(r['date']) for r in rows], dtype=COLUMNS['date'])}
+    for name in ('open', 'high', 'low', 'close', 'volume'):
+        bars[name] = np.array([r.get(name) if r.get(name) is not None else np.nan for r in rows],
+                              dtype=COLUMNS[name])
+    return bars
+
+
+# === Sources ===
+
+def fetch_fmp(symbol: str, start: str) -> List[Dict]:
+    data = market_http.get_json(FMP_EOD_URL, {'symbol': symbol, 'from': start, 'apikey': load_key('fmp')},
+                                provider='fmp')
+    if isinstance(data, dict):   # Older shape: {'historical': [...]}
+        data = data.get('historical', [])
+    return [{'date': d['date'], 'open': d.get('adjOpen'), 'high': d.get('adjHigh'), 'low': d.get('adjLow'),
+             'close': d.get('adjClose'), 'volume': d.get('volume')} for d in data or []]
+
+
+def alphavantage_premium() -> bool:
+    """ALPHAVANTAGE_PREMIUM=1 (env or ~/.secure/alphavantage.env) unlocks adjusted, full-length series."""
+    return (load_setting('alphavantage', 'ALPHAVANTAGE_PREMIUM') or '').lower() in ('1', 'true', 'yes')
+
+
+def fetch_alphavantage(symbol: str, start: str) -> List[Dict]:
+    # Free tier: unadjusted TIME_SERIES_DAILY, compact only (last 100 bars,
+    # enough for any top-up shorter than ~5 months)
+    premium = alphavantage_premium()
+    span = (date.today() - date.fromisoformat(start)).days
+    data = market_http.get_json(ALPHAVANTAGE_URL, {
+        'function': 'TIME_SERIES_DAILY_ADJUSTED' if premium else 'TIME_SERIES_DAILY', 'symbol': symbol,
+        'outputsize': 'full' if premium and span >= 140 else 'compact', 'apikey': load_key('alphavantage'),
+    }, provider='alphavantage')
+    series = data.get('Time Series (Daily)', {})
+    if not series:
+        raise ValueError(data.get('Note') or data.get('Information') or data.get('Error Message')
+                         or 'no daily series')
+    if not premium:
+        return [{'date': day, 'open': float(v['1. open']), 'high': float(v['2. high']), 'low': float(v['3. low']),
+                 'close': float(v['4. close']), 'volume': float(v['5. volume'])}
+                for day, v in series.items() if day >= start]
+    rows = []
+    for day, v in series.items():
+        if day < start:
+            continue
+        factor = float(v['5. adjusted close']) / float(v['4. close'])
+        rows.append({'date': day, 'open': float(v['1. open']) * factor, 'high': float(v['2. high']) * factor,
+                     'low': float(v['3. low']) * factor, 'close': float(v['5. adjusted close']),
+                     'volume': float(v['6. volume'])})
+    return rows
+
+
+def fetch_yfinance(symbol: str, start: str) -> List[Dict]:
+    import yfinance as yf
+    hist = yf.Ticker(symbol).history(start=start, auto_adjust=True)
+    return [{'date': str(ts.date()), 'open': row['Open'], 'high': row['High'], 'low': row['Low'],
+             'close': row['Close'], 'volume': row['Volume']} for ts, row in hist.iterrows()]
+
+
+SOURCES = {
+    'fmp': fetch_fmp,
+    'alphavantage': fetch_alphavantage,
+    'yfinance': fetch_yfinance,
+}
+
+
+def adjusted_source(source: str) -> bool:
+    """Whether a source returns split- and dividend-adjusted bars."""
+    return source != 'alphavantage' or alphavantage_premium()
+
+
+def default_source() -> str:
+    if load_key('fmp'):
+        return 'fmp'
+    if load_key('alphavantage'):
+        return 'alphavantage'
+    return 'yfinance'
+
+
+# === Store ===
+
+class PriceStore:
+    """Per-symbol append-only column files."""
+
+    def __init__(self, root: Path = PRICE_DIR, source: Optional[str] = None):
+        self.root = Path(root)
+        self.source = source
+
+    def _dir(self, symbol: str) -> Path:
+        return self.root / symbol.upper()
+
+    def _meta(self, symbol: str) -> Dict:
+        path = self._dir(symbol) / 'meta.json'
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def read(self, symbol: str, start: Optional[str] = None, end: Optional[str] = None) -> Bars:
+        """Stored bars for symbol, optionally clipped to [start, end] (ISO dates)."""
+        d = self._dir(symbol)
+        if not (d / 'date.i4').exists():
+            return empty_bars()
+        bars = {}
+        for name, dtype in COLUMNS.items():
+            path = d / f"{name}.{dtype[-2:]}"
+            bars[name] = np.fromfile(path, dtype=dtype) if path.exists() else np.empty(0, dtype=dtype)
+        # A write interrupted between columns leaves them ragged; trust the shortest
+        n = min(len(a) for a in bars.values())
+        lo, hi = 0, n
+        if start:
+            lo = int(np.searchsorted(bars['date'][:n], to_day(start), 'left'))
+        if end:
+            hi = int(np.searchsorted(bars['date'][:n], to_day(end), 'right'))
+        return {name: a[lo:hi] for name, a in bars.items()}
+
+    def append(self, symbol: str, bars: Bars) -> int:
+        """Write bars, replacing every stored bar from the batch's first date on."""
+        d = self._dir(symbol)
+        d.mkdir(parents=True, exist_ok=True)
+        with open(d / '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            stored = self.read(symbol)
+            n = len(stored['date'])
+            keep = n
+            if n and len(bars['date']):
+                # Drop stored rows the new batch overlaps (normally just the last bar)
+                keep = int(np.searchsorted(stored['date'], bars['date'][0], 'left'))
+            for name, dtype in COLUMNS.items():
+                path = d / f"{name}.{dtype[-2:]}"
+                with open(path, 'ab') as f:
+                    f.truncate(keep * np.dtype(dtype).itemsize)
+                    bars[name].astype(dtype).tofile(f)
+        return len(bars['date']) - (n - keep)
+
+    def update(self, symbol: str, force: bool = False) -> int:
+        """Top up symbol from its source. Returns the number of new bars."""
+        symbol = symbol.upper()
+        meta = self._meta(symbol)
+        if not force and time.time() - meta.get('checked', 0) < REFRESH_SECONDS:
+            return 0
+        stored = self.read(symbol)
+        source = meta.get('source') or self.source or default_source()
+        fetch = SOURCES[source]
+        full_start = (to_iso(stored['date'][0]) if len(stored['date'])
+                      else (date.today() - timedelta(days=365 * INITIAL_YEARS)).isoformat())
+        adjusted = adjusted_source(source)
+        bars = None
+        if len(stored['date']) and not adjusted and not meta.get('adjusted'):
+            # Unadjusted source (free Alpha Vantage): plain top-up from the last stored bar
+            bars = rows_to_bars(fetch(symbol, to_iso(stored['date'][-1])))
+        elif len(stored['date']) > 1 and adjusted and meta.get('adjusted'):
+            # The second-newest bar is settled: if its adjusted close moved, a split or
+            # dividend since the last top-up rescaled all history, so fetch it all again
+            settled = stored['date'][-2]
+            bars = rows_to_bars(fetch(symbol, to_iso(settled)))
+            hit = bars['date'] == settled
+            if not hit.any() or not np.isclose(bars['close'][hit][0], stored['close'][-2],
+                                               rtol=ADJUST_TOLERANCE, atol=0):
+                bars = None
+        if bars is None:
+            bars = rows_to_bars(fetch(symbol, full_start))
+        added = self.append(symbol, bars) if len(bars['date']) else 0
+        meta.update({'source': source, 'checked': time.time(), 'adjusted': adjusted})
+        (self._dir(symbol) / 'meta.json').write_text(json.dumps(meta))
+        return added
+
+    def update_many(self, symbols: List[str], force: bool = False) -> Dict[str, int]:
+        """Concurrent top-up. Failed symbols map to -1."""
+        def one(sym):
+            try:
+                return sym, self.update(sym, force)
+            except Exception as e:
+                print(f"⚠️ {sym}: {e}", file=sys.stderr)
+                return sym, -1
+        with ThreadPoolExecutor(max_workers=min(UPDATE_WORKERS, max(1, len(symbols)))) as pool:
+            return dict(pool.map(one, symbols))
+
+    def history(self, symbol: str, days: Optional[int] = None, refresh: bool = True) -> Bars:
+        """Last `days` bars (all if None), topped up first unless refresh=False."""
+        if refresh:
+            try:
+                self.update(symbol)
+            except Exception as e:
+                print(f"⚠️ {symbol}: {e}", file=sys.stderr)
+        bars = self.read(symbol)
+        return {name: a[-days:] for name, a in bars.items()} if days else bars
+
+    def aligned(self, symbols: List[str], days: Optional[int] = None, field: str = 'close',
+                how: str = 'inner', refresh: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """(dates as datetime64[D], matrix symbols × dates) for one field.
+
+        how='inner' keeps dates every symbol traded; 'outer' keeps all dates and
+        fills gaps with NaN. days keeps the most recent N of the aligned dates.
+        """
+        symbols = [s.upper() for s in symbols]
+        if refresh:
+            self.update_many(symbols)
+        series = [self.read(s) for s in symbols]
+        if not series:
+            return np.empty(0, dtype='datetime64[D]'), np.empty((0, 0))
+        day_sets = [b['date'] for b in series]
+        if how == 'inner':
+            axis = day_sets[0]
+            for days_ in day_sets[1:]:
+                axis = np.intersect1d(axis, days_, assume_unique=True)
+        else:
+            axis = np.unique(np.concatenate(day_sets))
+        if days:
+            axis = axis[-days:]
+        matrix = np.full((len(symbols), len(axis)), np.nan)
+        for i, bars in enumerate(series):
+            idx = np.searchsorted(bars['date'], axis)
+            idx = np.clip(idx, 0, max(len(bars['date']) - 1, 0))
+            hit = bars['date'][idx] == axis if len(bars['date']) else np.zeros(len(axis), bool)
+            matrix[i, hit] = bars[field][idx[hit]]
+        return axis.astype('datetime64[D]'), matrix
+
+    def status(self) -> List[Dict]:
+        rows = []
+        if not self.root.exists():
+            return rows
+        for d in sorted(p for p in self.root.iterdir() if p.is_dir()):
+            dates = self.read(d.name)['date']
+            if not len(dates):
+                continue
+            size = sum(f.stat().st_size for f in d.iterdir() if f.is_file())
+            rows.append({
+                'symbol': d.name,
+                'bars': len(dates),
+                'first': to_iso(dates[0]),
+                'last': to_iso(dates[-1]),
+                'bytes': size,
+                'source': self._meta(d.name).get('source'),
+            })
+        return rows
+
+
+_store: Optional[PriceStore] = None
+
+
+def get_store() -> PriceStore:
+    global _store
+    if _store is None:
+        _store = PriceStore()
+    return _store
+
+
+def history(symbol: str, days: Optional[int] = None, refresh: bool = True) -> Bars:
+    return get_store().history(symbol, days, refresh)
+
+
+def aligned(symbols: List[str], days: Optional[int] = None, field: str = 'close',
+            how: str = 'inner', refresh: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    return get_store().aligned(symbols, days, field, how, refresh)
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    store = get_store()
+    if args[0] == 'update':
+        symbols = [s for a in args[1:] if not a.startswith('--') for s in a.split(',')]
+        t0 = time.perf_counter()
+        added = store.update_many(symbols, force='--force' in args)
+        for sym, n in added.items():
+            print(f"{'❌' if n < 0 else '✅'} {sym.upper():<6} {'failed' if n < 0 else f'+{n} bars'}")
+        print(f"⏱️ {time.perf_counter() - t0:.2f}s")
+    elif args[0] == 'show' and len(args) > 1:
+        days = int(args[2]) if len(args) > 2 else 10
+        bars = store.history(args[1], days)
+        for i in range(len(bars['date'])):
+            print(f"{to_iso(bars['date'][i])}  O {bars['open'][i]:>10.2f}  H {bars['high'][i]:>10.2f}  "
+                  f"L {bars['low'][i]:>10.2f}  C {bars['close'][i]:>10.2f}  V {bars['volume'][i]:>14,.0f}")
+    elif args[0] == '--status':
+        rows = store.status()
+        print(f"📈 Price store: {len(rows)} symbols in {store.root}")
+        for r in rows:
+            print(f"   {r['symbol']:<8} {r['bars']:>6} bars  {r['first']} → {r['last']}  "
+                  f"{r['bytes'] / 1024:>7.1f} KB  ({r['source']})")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
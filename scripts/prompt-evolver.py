@@ -25,6 +25,9 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 FEEDBACK_LOG = Path.home() / '.openclaw/workspace/memory/feedback-log.jsonl'
 REFLECTIONS = Path.home() / '.openclaw/workspace/memory/reflections.jsonl'
 EVOLUTION_STATE = Path.home() / '.openclaw/workspace/memory/prompt-evolution.json'
@@ -32,29 +35,11 @@ EVOLVED_PROMPTS = Path.home() / '.openclaw/workspace/memory/evolved-prompts.json
 
 def load_feedback():
     """Load feedback log entries."""
-    entries = []
-    if FEEDBACK_LOG.exists():
-        with open(FEEDBACK_LOG) as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entries.append(json.loads(line))
-                    except:
-                        pass
-    return entries
+    return EventLog(FEEDBACK_LOG).read()
 
 def load_reflections():
     """Load reflection entries."""
-    entries = []
-    if REFLECTIONS.exists():
-        with open(REFLECTIONS) as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entries.append(json.loads(line))
-                    except:
-                        pass
-    return entries
+    return EventLog(REFLECTIONS).read()
 
 def load_evolution_state():
     """Load or initialize evolution state."""
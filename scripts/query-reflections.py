@@ -10,28 +10,18 @@ Usage:
     python3 scripts/query-reflections.py --failures     # Only failures
 """
 
-import json
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 REFLECTIONS_FILE = Path.home() / ".openclaw/workspace/memory/reflections.jsonl"
 
 def load_reflections():
     """Load all reflections from JSONL file."""
-    if not REFLECTIONS_FILE.exists():
-        return []
-    
-    reflections = []
-    with open(REFLECTIONS_FILE) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    reflections.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return reflections
+    return EventLog(REFLECTIONS_FILE).read()
 
 def search_reflections(query, reflections):
     """Simple keyword search in reflections."""
@@ -64,9 +54,9 @@ def format_reflection(r):
 
 def main():
     args = sys.argv[1:]
-    reflections = load_reflections()
+    log = EventLog(REFLECTIONS_FILE)
     
-    if not reflections:
+    if not log.count():
         print("No reflections found. Start logging lessons!")
         return
     
@@ -74,13 +64,15 @@ def main():
     if "--recent" in args:
         idx = args.index("--recent")
         count = int(args[idx + 1]) if idx + 1 < len(args) else 5
-        recent = reflections[-count:]
+        recent = log.tail(count)
         print(f"📚 Last {len(recent)} reflections:\n")
         for r in recent:
             print(format_reflection(r))
             print()
         return
     
+    reflections = log.read()
+    
     if "--failures" in args:
         failures = [r for r in reflections if r.get('outcome') in ['failure', 'partial']]
         print(f"❌ {len(failures)} failures/partial successes:\n")
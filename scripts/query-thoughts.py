@@ -4,6 +4,7 @@ Query the thought log.
 
 Usage:
   query-thoughts.py --date 2026-02-02          # All entries on date
+  query-thoughts.py --since 2026-02-01 --until 2026-03-01
   query-thoughts.py --entity "jon"             # All mentioning entity
   query-thoughts.py --type decision            # All decisions
   query-thoughts.py --tag "investing"          # All with tag
@@ -14,49 +15,19 @@ Usage:
 
 import argparse
 import json
-import os
-from datetime import datetime, timezone
+import sys
 from pathlib import Path
 
-THOUGHTS_DIR = Path.home() / ".openclaw/workspace/memory/thoughts"
+sys.path.insert(0, str(Path(__file__).parent))
+from thought_store import ThoughtStore
 
-def load_all_entries():
-    entries = []
-    for f in sorted(THOUGHTS_DIR.glob("*.jsonl")):
-        with open(f) as fh:
-            for line in fh:
-                if line.strip():
-                    entries.append(json.loads(line))
-    return entries
-
-def filter_entries(entries, args):
-    results = entries
-    
-    if args.date:
-        results = [e for e in results if e.get("ts", "").startswith(args.date)]
-    
-    if args.entity:
-        entity = args.entity.lower()
-        results = [e for e in results if entity in [x.lower() for x in e.get("entities", [])]]
-    
-    if args.type:
-        results = [e for e in results if e.get("type") == args.type]
-    
-    if args.tag:
-        tag = args.tag.lower()
-        results = [e for e in results if tag in [x.lower() for x in e.get("tags", [])]]
-    
-    if args.search:
-        search = args.search.lower()
-        results = [e for e in results if search in json.dumps(e).lower()]
-    
-    if args.questions:
-        results = [e for e in results if e.get("type") == "question" and e.get("status") == "open"]
-    
-    if args.recent:
-        results = results[-args.recent:]
-    
-    return results
+def query(args):
+    """Matching entries via the thought index (see thought_store); no full-log scan."""
+    store = ThoughtStore()
+    store.sync()
+    return list(store.query(date=args.date, since=args.since, until=args.until,
+                            entity=args.entity, type=args.type, tag=args.tag,
+                            search=args.search, questions=args.questions, recent=args.recent))
 
 def format_entry(e):
     ts = e.get("ts", "")[:19].replace("T", " ")
@@ -79,6 +50,8 @@ def format_entry(e):
 def main():
     parser = argparse.ArgumentParser(description="Query thought log")
     parser.add_argument("--date", help="Filter by date (YYYY-MM-DD)")
+    parser.add_argument("--since", help="Entries at/after this date or timestamp")
+    parser.add_argument("--until", help="Entries before this date or timestamp")
     parser.add_argument("--entity", help="Filter by entity")
     parser.add_argument("--type", help="Filter by type")
     parser.add_argument("--tag", help="Filter by tag")
@@ -89,8 +62,7 @@ def main():
     
     args = parser.parse_args()
     
-    entries = load_all_entries()
-    results = filter_entries(entries, args)
+    results = query(args)
     
     if not results:
         print("No entries found.")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Query Embedding Cache
+=====================
+
+Persistent, size-bounded LRU cache of query embeddings for semantic-search.
+
+Heartbeat prompts repeat the same recall queries many times a day; a hit
+here skips the embeddings API round-trip entirely.
+
+- Keyed by (model, normalized query text)
+- SQLite file, safe to share between concurrent processes
+- Evicts least-recently-used entries beyond MAX_ENTRIES
+- Hit/miss counters persisted alongside (shown in semantic-search --status)
+
+Usage:
+    from query_cache import QueryEmbeddingCache
+    qc = QueryEmbeddingCache(path)
+    emb = qc.get(model, query)            # None on miss
+    qc.put(model, query, embedding)
+    qc.stats()                            # {'entries', 'hits', 'misses', 'hit_rate', 'bytes'}
+"""
+
+import re
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+MAX_ENTRIES = 5000
+
+
+def normalize_query(text: str) -> str:
+    """Case- and whitespace-insensitive form of a query."""
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+class QueryEmbeddingCache:
+    """(model, query) -> float32 embedding, LRU-evicted."""
+
+    def __init__(self, path: Path, max_entries: int = MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path), timeout=10)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS queries (
+                model TEXT NOT NULL,
+                query TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, query)
+            );
+            CREATE INDEX IF NOT EXISTS idx_queries_last_used ON queries(last_used);
+            CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        ''')
+
+    def _bump(self, name: str, n: int = 1) -> None:
+        self.db.execute(
+            'INSERT INTO counters(name, value) VALUES (?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value', (name, n))
+
+    def get(self, model: str, query: str) -> Optional[List[float]]:
+        key = normalize_query(query)
+        with self.db:
+            row = self.db.execute(
+                'SELECT embedding FROM queries WHERE model = ? AND query = ?', (model, key)).fetchone()
+            if row is None:
+                self._bump('misses')
+                return None
+            self.db.execute('UPDATE queries SET last_used = ? WHERE model = ? AND query = ?',
+                            (time.time(), model, key))
+            self._bump('hits')
+        return array('f', row[0]).tolist()
+
+    def put(self, model: str, query: str, embedding: List[float]) -> None:
+        with self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO queries(model, query, embedding, last_used) VALUES (?, ?, ?, ?)',
+                (model, normalize_query(query), array('f', embedding).tobytes(), time.time()))
+            self._evict()
+
+    def _evict(self) -> None:
+        (count,) = self.db.execute('SELECT COUNT(*) FROM queries').fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self.db.execute(
+                'DELETE FROM queries WHERE rowid IN '
+                '(SELECT rowid FROM queries ORDER BY last_used ASC LIMIT ?)', (excess,))
+            self._bump('evictions', excess)
+
+    def stats(self) -> Dict:
+        (entries,) = self.db.execute('SELECT COUNT(*) FROM queries').fetchone()
+        counters = dict(self.db.execute('SELECT name, value FROM counters').fetchall())
+        hits, misses = counters.get('hits', 0), counters.get('misses', 0)
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'hits': hits,
+            'misses': misses,
+            'evictions': counters.get('evictions', 0),
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'bytes': self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def close(self) -> None:
+        self.db.close()
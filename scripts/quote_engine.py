@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Quote Engine
+============
+
+One place to get quotes for many symbols at once.
+
+- FMP: symbols are coalesced into multi-symbol batch-quote requests
+  (BATCH_SIZE per call). If the account tier rejects batch-quote (402/403 or
+  a "not in plan" payload) or the call fails in transport or returns a garbled
+  body, the engine falls back to per-symbol requests and remembers that in the
+  response cache (a day for a rejection, an hour otherwise), so later
+  processes (cron runs) skip the batch call too until the flag expires.
+- Finnhub (no batch endpoint): bounded-concurrency fan-out.
+- Per-symbol results go through the shared response cache, so a batch also
+  warms the single-symbol `quote` entries used by other scripts.
+- Concurrent callers asking for the same symbol share one in-flight request.
+- Everything comes back as a normalized Quote record (raw provider dict kept
+  in .raw).
+
+Usage:
+    import quote_engine
+    quotes = quote_engine.get_quotes(['NVDA', 'AMD'])            # {symbol: Quote}
+    quotes = quote_engine.get_quotes(['NVDA'], provider='finnhub')
+    quotes['NVDA'].price, quotes['NVDA'].change_pct
+
+    python3 scripts/quote_engine.py NVDA AMD AVGO [--provider finnhub]
+"""
+
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import response_cache
+
+FMP_QUOTE_URL = "https://financialmodelingprep.com/stable/quote"
+FMP_BATCH_URL = "https://financialmodelingprep.com/stable/batch-quote"
+FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
+
+BATCH_SIZE = 100     # Symbols per FMP batch-quote call
+MAX_WORKERS = 8      # Fan-out threads; market_http caps in-flight calls per provider
+BATCH_REJECTED_TTL = response_cache.DAY    # Skip batch-quote this long after a tier rejection
+BATCH_FAILED_TTL = response_cache.HOUR     # ... or after a transport failure
+BATCH_FLAG_KEY = response_cache.cache_key(FMP_BATCH_URL, {'supported': 'no'})
+PLAN_ERROR_WORDS = ('subscription', 'plan', 'upgrade', 'special endpoint')   # FMP "not in plan" payloads
+
+
+class BatchNotInPlan(Exception):
+    """FMP answered batch-quote with a "not available on your plan" payload."""
+
+
+@dataclass
+class Quote:
+    """Provider-independent quote."""
+    symbol: str
+    price: Optional[float] = None
+    change: Optional[float] = None
+    change_pct: Optional[float] = None
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    prev_close: Optional[float] = None
+    volume: Optional[float] = None
+    avg_volume: Optional[float] = None
+    market_cap: Optional[float] = None
+    year_high: Optional[float] = None
+    year_low: Optional[float] = None
+    name: Optional[str] = None
+    timestamp: Optional[int] = None
+    source: str = ''
+    raw: Dict = field(default_factory=dict, repr=False)
+
+    def to_dict(self, include_raw: bool = False) -> Dict:
+        d = asdict(self)
+        if not include_raw:
+            d.pop('raw')
+        return d
+
+
+def from_fmp(d: Dict) -> Quote:
+    return Quote(
+        symbol=d.get('symbol', ''),
+        price=d.get('price'),
+        change=d.get('change'),
+        change_pct=d.get('changePercentage', d.get('changesPercentage')),
+        open=d.get('open'),
+        high=d.get('dayHigh'),
+        low=d.get('dayLow'),
+        prev_close=d.get('previousClose'),
+        volume=d.get('volume'),
+        avg_volume=d.get('avgVolume'),
+        market_cap=d.get('marketCap'),
+        year_high=d.get('yearHigh'),
+        year_low=d.get('yearLow'),
+        name=d.get('name'),
+        timestamp=d.get('timestamp'),
+        source='fmp',
+        raw=d,
+    )
+
+
+def from_finnhub(symbol: str, d: Dict) -> Quote:
+    return Quote(
+        symbol=symbol,
+        price=d.get('c'),
+        change=d.get('d'),
+        change_pct=d.get('dp'),
+        open=d.get('o'),
+        high=d.get('h'),
+        low=d.get('l'),
+        prev_close=d.get('pc'),
+        timestamp=d.get('t'),
+        source='finnhub',
+        raw=d,
+    )
+
+
+def load_key(name: str) -> Optional[str]:
+    """{NAME}_API_KEY from env or ~/.secure/{name}.env."""
+    var = f"{name.upper()}_API_KEY"
+    if os.environ.get(var):
+        return os.environ[var]
+    path = Path.home() / f'.secure/{name.lower()}.env'
+    if path.exists():
+        for line in path.read_text().splitlines():
+            if line.startswith(f'{var}='):
+                return line.split('=', 1)[1].strip().strip('"\'')
+    return None
+
+
+class QuoteEngine:
+    """Batched / fanned-out quote fetching for one provider."""
+
+    def __init__(self, provider: str = 'fmp', api_key: Optional[str] = None,
+                 batch_size: int = BATCH_SIZE, max_workers: int = MAX_WORKERS):
+        self.provider = provider
+        self.api_key = api_key
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.batch_supported = provider == 'fmp'
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.round_trips = 0
+
+    def _key(self) -> str:
+        if self.api_key is None:
+            self.api_key = load_key(self.provider)
+            if not self.api_key:
+                raise ValueError(f"{self.provider.upper()}_API_KEY not found")
+        return self.api_key
+
+    # === Cache (per-symbol entries, same keys as the single-quote endpoint) ===
+
+    def _single_url(self) -> str:
+        return FMP_QUOTE_URL if self.provider == 'fmp' else FINNHUB_QUOTE_URL
+
+    def _cached(self, symbol: str) -> Optional[Quote]:
+        if not response_cache.enabled():
+            return None
+        try:
+            data, state = response_cache.lookup(
+                response_cache.cache_key(self._single_url(), {'symbol': symbol}), 'quote')
+        except Exception:
+            return None
+        if state != 'fresh':
+            return None
+        return self._normalize(symbol, data)
+
+    def _store(self, symbol: str, data) -> None:
+        if not response_cache.enabled() or not response_cache.usable(data):
+            return
+        try:
+            response_cache.store(response_cache.cache_key(self._single_url(), {'symbol': symbol}), data, 'quote')
+        except Exception:
+            pass
+
+    def _normalize(self, symbol: str, data) -> Optional[Quote]:
+        if self.provider == 'fmp':
+            if isinstance(data, list) and data:
+                return from_fmp(data[0])
+            if isinstance(data, dict) and 'symbol' in data:
+                return from_fmp(data)
+            return None
+        if isinstance(data, dict) and data.get('c'):
+            return from_finnhub(symbol, data)
+        return None
+
+    # === Batch support (shared across processes through the response cache) ===
+
+    def _batch_enabled(self) -> bool:
+        if self.batch_supported and response_cache.enabled():
+            try:
+                _, state = response_cache.lookup(BATCH_FLAG_KEY, 'batch-quote')
+            except Exception:
+                state = 'miss'
+            if state == 'fresh':
+                self.batch_supported = False
+        return self.batch_supported
+
+    def _disable_batch(self, ttl: float) -> None:
+        self.batch_supported = False
+        if not response_cache.enabled():
+            return
+        try:
+            response_cache.store(BATCH_FLAG_KEY, {'batch_supported': False}, 'batch-quote', ttl)
+        except Exception:
+            pass
+
+    # === Fetching ===
+
+    def _fetch_single(self, symbol: str) -> Optional[Quote]:
+        token = 'apikey' if self.provider == 'fmp' else 'token'
+        self.round_trips += 1
+        data = market_http.get_json(self._single_url(), {'symbol': symbol, token: self._key()},
+                                    provider=self.provider)
+        self._store(symbol, data)
+        return self._normalize(symbol, data)
+
+    def _fetch_batch(self, symbols: List[str]) -> Dict[str, Quote]:
+        """One FMP batch-quote call. Raises on tier/HTTP failure."""
+        self.round_trips += 1
+        data = market_http.get_json(FMP_BATCH_URL, {'symbols': ','.join(symbols), 'apikey': self._key()},
+                                    provider='fmp')
+        if not isinstance(data, list):
+            message = str(data.get('Error Message', '') if isinstance(data, dict) else '')
+            if any(word in message.lower() for word in PLAN_ERROR_WORDS):
+                raise BatchNotInPlan(message)
+            raise ValueError(f"unexpected batch-quote payload: {str(data)[:100]}")
+        out = {}
+        for row in data:
+            sym = row.get('symbol')
+            if sym:
+                self._store(sym, [row])
+                out[sym] = from_fmp(row)
+        return out
+
+    def _fetch(self, symbols: List[str]) -> Dict[str, Optional[Quote]]:
+        results: Dict[str, Optional[Quote]] = {}
+        remaining = list(symbols)
+
+        if len(remaining) > 1 and self._batch_enabled():
+            self._key()     # A missing key is not a batch-quote failure
+            for i in range(0, len(remaining), self.batch_size):
+                chunk = remaining[i:i + self.batch_size]
+                try:
+                    results.update(self._fetch_batch(chunk))
+                except BatchNotInPlan:
+                    self._disable_batch(BATCH_REJECTED_TTL)
+                    break
+                except market_http.HttpError as e:
+                    # 402/403 = not in this plan; remember and fan out instead
+                    if e.status in (402, 403):
+                        self._disable_batch(BATCH_REJECTED_TTL)
+                    break
+                except (market_http.TransportError, ValueError):
+                    # Dropped connection or garbled body: skip batch-quote for a while
+                    self._disable_batch(BATCH_FAILED_TTL)
+                    break
+            remaining = [s for s in remaining if s not in results]
+
+        if remaining:
+            def one(sym):
+                try:
+                    return sym, self._fetch_single(sym)
+                except Exception:
+                    return sym, None
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(remaining))) as pool:
+                for sym, q in pool.map(one, remaining):
+                    results[sym] = q
+        return results
+
+    def get(self, symbols: List[str]) -> Dict[str, Quote]:
+        """Quotes for symbols (deduplicated, upper-cased). Missing symbols are omitted."""
+        wanted = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        out: Dict[str, Quote] = {}
+        to_fetch: List[str] = []
+        waiting: Dict[str, Future] = {}
+        mine: Dict[str, Future] = {}
+
+        for sym in wanted:
+            q = self._cached(sym)
+            if q is not None:
+                out[sym] = q
+        with self._lock:
+            for sym in wanted:
+                if sym in out:
+                    continue
+                if sym in self._inflight:
+                    waiting[sym] = self._inflight[sym]
+                else:
+                    fut = Future()
+                    self._inflight[sym] = fut
+                    mine[sym] = fut
+                    to_fetch.append(sym)
+
+        if to_fetch:
+            try:
+                fetched = self._fetch(to_fetch)
+            except Exception:
+                fetched = {}
+            with self._lock:
+                for sym in to_fetch:
+                    mine[sym].set_result(fetched.get(sym))
+                    self._inflight.pop(sym, None)
+
+        for sym, fut in list(mine.items()) + list(waiting.items()):
+            q = fut.result()
+            if q is not None:
+                out[sym] = q
+        return {s: out[s] for s in wanted if s in out}
+
+
+_engines: Dict[str, QuoteEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(provider: str = 'fmp', api_key: Optional[str] = None) -> QuoteEngine:
+    """Shared engine per provider (so in-flight dedupe works across callers)."""
+    with _engines_lock:
+        engine = _engines.get(provider)
+        if engine is None:
+            engine = _engines[provider] = QuoteEngine(provider, api_key)
+        elif api_key and engine.api_key is None:
+            engine.api_key = api_key
+        return engine
+
+
+def get_quotes(symbols: List[str], provider: str = 'fmp', api_key: Optional[str] = None) -> Dict[str, Quote]:
+    return get_engine(provider, api_key).get(symbols)
+
+
+def main():
+    args = sys.argv[1:]
+    provider = 'fmp'
+    if '--provider' in args:
+        i = args.index('--provider')
+        provider = args[i + 1] if i + 1 < len(args) else provider
+        args = args[:i] + args[i + 2:]
+    if not args:
+        print(__doc__)
+        return
+    symbols = [s for a in args for s in a.split(',')]
+    engine = get_engine(provider)
+    t0 = time.perf_counter()
+    quotes = engine.get(symbols)
+    elapsed = time.perf_counter() - t0
+    for sym, q in quotes.items():
+        pct = f"{q.change_pct:+.2f}%" if q.change_pct is not None else "N/A"
+        print(f"{sym:<6} ${q.price}  {pct}")
+    missing = [s.upper() for s in symbols if s.upper() not in quotes]
+    if missing:
+        print(f"⚠️ No quote: {', '.join(missing)}")
+    print(f"\n⏱️ {len(quotes)} quotes in {elapsed:.2f}s, {engine.round_trips} round-trips")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,83 +1,48 @@
 #!/usr/bin/env python3
 """
 Real Cost Tracker - parses actual session data for accurate cost tracking
+
+Reports query the cost rollup database (cost_rollup), which is topped up
+from the lines appended to session transcripts since the previous run.
+
+Usage:
+    python3 scripts/real-cost-tracker.py [today|week|HOURS]   # Cost incurred in the window
+    python3 scripts/real-cost-tracker.py trend [DAYS]         # Daily totals
 """
 
 import json
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+sys.path.insert(0, str(Path(__file__).parent))
+from cost_rollup import CostRollup
+
 SGT = ZoneInfo("Asia/Singapore")
 
-SESSIONS_DIR = Path.home() / ".openclaw" / "agents" / "main" / "sessions"
 OUTPUT_FILE = Path(__file__).parent.parent / "memory" / "real-costs.jsonl"
 
-def parse_session_costs(session_file: Path) -> dict:
-    """Parse a session file and extract cost data."""
-    total_cost = 0.0
-    total_input = 0
-    total_output = 0
-    total_cache_read = 0
-    total_cache_write = 0
-    model_costs = defaultdict(float)
-    turn_count = 0
-    
-    try:
-        with open(session_file) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    msg = entry.get("message", {})
-                    usage = msg.get("usage", {})
-                    cost = usage.get("cost", {})
-                    
-                    if cost.get("total"):
-                        total_cost += cost["total"]
-                        total_input += usage.get("input", 0)
-                        total_output += usage.get("output", 0)
-                        total_cache_read += usage.get("cacheRead", 0)
-                        total_cache_write += usage.get("cacheWrite", 0)
-                        model = msg.get("model", "unknown")
-                        model_costs[model] += cost["total"]
-                        turn_count += 1
-                except json.JSONDecodeError:
-                    continue
-    except Exception as e:
-        return {"error": str(e)}
-    
-    return {
-        "file": session_file.name,
-        "total_cost": round(total_cost, 4),
-        "turns": turn_count,
-        "tokens": {
-            "input": total_input,
-            "output": total_output,
-            "cache_read": total_cache_read,
-            "cache_write": total_cache_write,
-        },
-        "by_model": {k: round(v, 4) for k, v in model_costs.items()}
-    }
-
-def get_recent_sessions(hours: int = 24) -> list:
-    """Get session files modified in the last N hours."""
-    cutoff = datetime.now(SGT) - timedelta(hours=hours)
-    sessions = []
-    
-    for f in SESSIONS_DIR.glob("*.jsonl"):
-        if f.name.endswith(".lock"):
-            continue
-        mtime = datetime.fromtimestamp(f.stat().st_mtime, tz=SGT)
-        if mtime > cutoff:
-            sessions.append((f, mtime))
-    
-    return sorted(sessions, key=lambda x: x[1], reverse=True)
+def print_trend(db: CostRollup, days: int):
+    rows = db.daily(days)
+    print(f"📈 DAILY COST (last {days} days, SGT)")
+    print("=" * 50)
+    for r in rows:
+        print(f"{r['day']}  ${r['cost']:>8.2f}  ({r['turns']} turns)")
+    total = sum(r['cost'] for r in rows)
+    print("=" * 50)
+    print(f"TOTAL: ${total:.2f} | Daily avg: ${total / max(len(rows), 1):.2f}")
 
 def main():
     cmd = sys.argv[1] if len(sys.argv) > 1 else "today"
     
+    db = CostRollup()
+    db.update()
+    
+    if cmd == "trend":
+        print_trend(db, int(sys.argv[2]) if len(sys.argv) > 2 else 30)
+        return
+    
     if cmd == "today":
         hours = 24
     elif cmd == "week":
@@ -87,31 +52,25 @@ def main():
     else:
         hours = 24
     
-    sessions = get_recent_sessions(hours)
+    since = (datetime.now(SGT) - timedelta(hours=hours)).timestamp()
+    sessions = db.sessions(since)
     
     if not sessions:
         print(f"No sessions found in last {hours} hours")
         return
     
-    total = 0.0
-    by_model = defaultdict(float)
+    total = db.total(since)
+    by_model = {r["model"]: r["cost"] for r in db.by_model(since)}
     
     print(f"📊 REAL COST REPORT (last {hours}h)")
     print("=" * 50)
     
-    for session_file, mtime in sessions:
-        costs = parse_session_costs(session_file)
-        if "error" in costs:
-            continue
-        
-        total += costs["total_cost"]
-        for model, cost in costs.get("by_model", {}).items():
-            by_model[model] += cost
-        
-        if costs["total_cost"] > 0.01:  # Only show sessions with meaningful cost
-            print(f"\n{session_file.name[:8]}... ({mtime.strftime('%H:%M SGT')})")
-            print(f"  Cost: ${costs['total_cost']:.2f} | Turns: {costs['turns']}")
-            print(f"  Tokens: in={costs['tokens']['input']:,} out={costs['tokens']['output']:,}")
+    for s in sessions:
+        if s["cost"] > 0.01:  # Only show sessions with meaningful cost
+            last = datetime.fromtimestamp(s["last_ts"], tz=SGT)
+            print(f"\n{s['session'][:8]}... ({last.strftime('%H:%M SGT')})")
+            print(f"  Cost: ${s['cost']:.2f} | Turns: {s['turns']}")
+            print(f"  Tokens: in={s['input']:,} out={s['output']:,}")
     
     print("\n" + "=" * 50)
     print(f"TOTAL: ${total:.2f}")
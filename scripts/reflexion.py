@@ -20,21 +20,15 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 REFLECTIONS_FILE = Path.home() / ".openclaw/workspace/memory/reflections.jsonl"
 REFLECTIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 def load_reflections():
     """Load all reflections from JSONL file."""
-    reflections = []
-    if REFLECTIONS_FILE.exists():
-        with open(REFLECTIONS_FILE, 'r') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        reflections.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    return reflections
+    return EventLog(REFLECTIONS_FILE).read()
 
 def add_reflection(topic: str, hypothesis: str, outcome: str, 
                    what_worked: str, what_failed: str, lesson: str,
@@ -52,8 +46,7 @@ def add_reflection(topic: str, hypothesis: str, outcome: str,
         "applied": False  # Whether lesson was applied to future behavior
     }
     
-    with open(REFLECTIONS_FILE, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    EventLog(REFLECTIONS_FILE).append(entry)
     
     return entry
 
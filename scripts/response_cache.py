@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Market Response Cache
+=====================
+
+Shared, process-safe TTL cache for market-data API responses (FMP, Finnhub,
+Benzinga, ...). One SQLite file, used by every client script.
+
+- Per-endpoint TTLs: quotes live seconds, fundamentals days, transcripts forever
+- Stale-while-revalidate: an expired entry inside its stale window is returned
+  at once and refreshed in a background thread
+- Size-bounded: least-recently-used entries evicted beyond MAX_BYTES
+- Hit / stale / miss counters per endpoint
+- Auth params (apikey, token) never become part of the key
+
+Usage:
+    import response_cache
+    data = response_cache.get_json(url, params, provider='fmp')      # via market_http
+    data = response_cache.cached('my-key', fetch_fn, endpoint='profile')
+
+    python3 scripts/response_cache.py --stats
+    python3 scripts/response_cache.py --clear [endpoint]
+
+Set MARKET_CACHE=off to bypass (always fetch, never store).
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import threading
+import urllib.parse
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+
+CACHE_FILE = Path.home() / '.openclaw/workspace/memory/.market-cache.db'
+MAX_BYTES = 200 * 1024 * 1024
+AUTH_PARAMS = {'apikey', 'token', 'api_key'}
+
+MINUTE, HOUR, DAY = 60, 3600, 86400
+
+# TTL in seconds, matched against the last path segment(s) of the URL
+ENDPOINT_TTLS = {
+    'quote': 15,
+    'quote-short': 15,
+    'batch-quote': 15,
+    'profile': 7 * DAY,
+    'key-metrics': DAY,
+    'key-metrics-ttm': DAY,
+    'ratios': DAY,
+    'ratios-ttm': DAY,
+    'financial-growth': DAY,
+    'income-statement': 7 * DAY,
+    'balance-sheet-statement': 7 * DAY,
+    'cash-flow-statement': 7 * DAY,
+    'stock-peers': 7 * DAY,
+    'institutional-holder': DAY,
+    'insider-trades': 6 * HOUR,
+    'analyst-estimates': DAY,
+    'company-news': 15 * MINUTE,
+    'news': 15 * MINUTE,
+    'historical-price-eod': 6 * HOUR,
+    'earning-calendar': 6 * HOUR,
+    'earning_calendar': 6 * HOUR,
+    'earning-call-transcript': 365 * DAY,
+    'earning_call_transcript': 365 * DAY,
+}
+DEFAULT_TTL = HOUR
+STALE_FACTOR = 1.0   # Serve stale for up to TTL × this past expiry, while revalidating
+
+_local = threading.local()
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return os.environ.get('MARKET_CACHE', 'on').lower() not in ('off', '0', 'no')
+
+
+def endpoint_of(url: str) -> str:
+    """Endpoint name from a URL path ('.../stable/historical-price-eod/light' -> 'historical-price-eod')."""
+    parts = [p for p in urllib.parse.urlsplit(url).path.split('/') if p]
+    for part in reversed(parts):
+        if part in ENDPOINT_TTLS:
+            return part
+    for part in parts:
+        if part in ENDPOINT_TTLS:
+            return part
+    return parts[-1] if parts else ''
+
+
+def ttl_for(endpoint: str) -> int:
+    return ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL)
+
+
+def cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """URL + sorted non-auth params."""
+    split = urllib.parse.urlsplit(url)
+    query = dict(urllib.parse.parse_qsl(split.query))
+    query.update({k: v for k, v in (params or {}).items() if v is not None})
+    clean = sorted((k, str(v)) for k, v in query.items() if k.lower() not in AUTH_PARAMS)
+    return f"{split.netloc}{split.path}?{urllib.parse.urlencode(clean)}"
+
+
+# === Storage ===
+
+def _db() -> sqlite3.Connection:
+    """Per-thread connection (sqlite3 connections are not shared across threads)."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(CACHE_FILE), timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored REAL NOT NULL,
+                expires REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access);
+            CREATE INDEX IF NOT EXISTS idx_responses_stale ON responses(stale_until);
+            CREATE TABLE IF NOT EXISTS counters (
+                endpoint TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value INTEGER NOT NULL,
+                PRIMARY KEY (endpoint, name)
+            );
+        ''')
+        _local.conn = conn
+    return conn
+
+
+def _bump(conn, endpoint: str, name: str, n: int = 1) -> None:
+    conn.execute(
+        'INSERT INTO counters(endpoint, name, value) VALUES (?, ?, ?) '
+        'ON CONFLICT(endpoint, name) DO UPDATE SET value = value + excluded.value',
+        (endpoint, name, n))
+
+
+def lookup(key: str, endpoint: str = ''):
+    """Returns (data, state) where state is 'fresh', 'stale' or 'miss'."""
+    conn = _db()
+    now = time.time()
+    with conn:
+        row = conn.execute('SELECT body, expires, stale_until FROM responses WHERE key = ?',
+                           (key,)).fetchone()
+        if row is None or now >= row[2]:
+            _bump(conn, endpoint, 'misses')
+            return None, 'miss'
+        conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+        state = 'fresh' if now < row[1] else 'stale'
+        _bump(conn, endpoint, 'hits' if state == 'fresh' else 'stale_hits')
+    return json.loads(zlib.decompress(row[0])), state
+
+
+def store(key: str, data: Any, endpoint: str = '', ttl: Optional[float] = None) -> None:
+    ttl = ttl_for(endpoint) if ttl is None else ttl
+    body = zlib.compress(json.dumps(data, separators=(',', ':')).encode())
+    now = time.time()
+    conn = _db()
+    with conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO responses(key, endpoint, body, size, stored, expires, stale_until, last_access) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, endpoint, body, len(body), now, now + ttl, now + ttl * (1 + STALE_FACTOR), now))
+        _evict(conn)
+
+
+def _evict(conn) -> None:
+    """Drop dead entries, then LRU entries until under 90% of MAX_BYTES."""
+    conn.execute('DELETE FROM responses WHERE stale_until < ?', (time.time(),))
+    (total,) = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+    if total <= MAX_BYTES:
+        return
+    target = total - int(MAX_BYTES * 0.9)
+    freed = evicted = 0
+    for key, size in conn.execute('SELECT key, size FROM responses ORDER BY last_access ASC').fetchall():
+        if freed >= target:
+            break
+        conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+        freed += size
+        evicted += 1
+    _bump(conn, '', 'evictions', evicted)
+
+
+def usable(data: Any) -> bool:
+    """Don't cache empty or error payloads."""
+    if data is None or data == [] or data == {}:
+        return False
+    if isinstance(data, dict) and ('error' in data or 'Error Message' in data or 'Note' in data):
+        return False
+    return True
+
+
+# === Cached fetch ===
+
+def _revalidate(key: str, fetch: Callable[[], Any], endpoint: str, ttl: Optional[float]) -> None:
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def run():
+        try:
+            data = fetch()
+            if usable(data):
+                store(key, data, endpoint, ttl)
+                with _db() as conn:
+                    _bump(conn, endpoint, 'revalidations')
+        except Exception:
+            pass  # Keep serving the stale copy
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    # Non-daemon: a short-lived CLI waits for the refresh before exiting
+    threading.Thread(target=run).start()
+
+
+def cached(key: str, fetch: Callable[[], Any], endpoint: str = '', ttl: Optional[float] = None) -> Any:
+    """Return cached data for key, or fetch() and store it."""
+    if not enabled():
+        return fetch()
+    try:
+        data, state = lookup(key, endpoint)
+    except sqlite3.Error:
+        return fetch()
+    if state == 'fresh':
+        return data
+    if state == 'stale':
+        _revalidate(key, fetch, endpoint, ttl)
+        return data
+    data = fetch()
+    if usable(data):
+        try:
+            store(key, data, endpoint, ttl)
+        except sqlite3.Error:
+            pass
+    return data
+
+
+def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+             provider: Optional[str] = None, ttl: Optional[float] = None, timeout: Optional[float] = None) -> Any:
+    """market_http.get_json with caching. Raises the same errors on a miss."""
+    endpoint = endpoint_of(url)
+    return cached(cache_key(url, params),
+                  lambda: market_http.get_json(url, params, headers, provider, timeout),
+                  endpoint, ttl)
+
+
+# === Stats ===
+
+def stats() -> Dict:
+    conn = _db()
+    entries, size = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+    per_endpoint: Dict[str, Dict[str, int]] = {}
+    for endpoint, name, value in conn.execute('SELECT endpoint, name, value FROM counters'):
+        per_endpoint.setdefault(endpoint or '(all)', {})[name] = value
+    totals = {'hits': 0, 'stale_hits': 0, 'misses': 0}
+    for counts in per_endpoint.values():
+        for name in totals:
+            totals[name] += counts.get(name, 0)
+    lookups = sum(totals.values())
+    return {
+        'entries': entries,
+        'bytes': size,
+        'max_bytes': MAX_BYTES,
+        'hit_rate': (totals['hits'] + totals['stale_hits']) / lookups if lookups else 0.0,
+        **totals,
+        'endpoints': per_endpoint,
+    }
+
+
+def clear(endpoint: Optional[str] = None) -> int:
+    conn = _db()
+    with conn:
+        if endpoint:
+            cur = conn.execute('DELETE FROM responses WHERE endpoint = ?', (endpoint,))
+        else:
+            cur = conn.execute('DELETE FROM responses')
+    return cur.rowcount
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+    if sys.argv[1] == '--stats':
+        s = stats()
+        print(f"📦 Market cache: {s['entries']} entries, {s['bytes'] / 1024:.1f} KB "
+              f"(max {s['max_bytes'] // (1024 * 1024)} MB)")
+        print(f"   Hit rate: {s['hit_rate']:.0%}  (fresh {s['hits']}, stale {s['stale_hits']}, miss {s['misses']})")
+        for endpoint, counts in sorted(s['endpoints'].items()):
+            looks = counts.get('hits', 0) + counts.get('stale_hits', 0) + counts.get('misses', 0)
+            rate = (counts.get('hits', 0) + counts.get('stale_hits', 0)) / looks if looks else 0
+            extra = ', '.join(f"{k} {v}" for k, v in sorted(counts.items()))
+            print(f"   {endpoint:<26} {rate:>4.0%}  {extra}")
+    elif sys.argv[1] == '--clear':
+        n = clear(sys.argv[2] if len(sys.argv) > 2 else None)
+        print(f"🗑️ Cleared {n} entries")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
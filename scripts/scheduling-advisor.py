@@ -22,6 +22,9 @@ import sys
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 SCHEDULING_FILE = Path.home() / '.openclaw/workspace/memory/scheduling-intelligence.json'
 HEARTBEAT_STATE = Path.home() / '.openclaw/workspace/memory/heartbeat-state.json'
 FEEDBACK_LOG = Path.home() / '.openclaw/workspace/memory/feedback-log.jsonl'
@@ -68,17 +71,7 @@ def load_heartbeat_state():
 
 def get_recent_engagement(n=10):
     """Calculate rolling engagement rate from recent feedback."""
-    if not FEEDBACK_LOG.exists():
-        return None, 0
-    
-    entries = []
-    with open(FEEDBACK_LOG) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entries.append(json.loads(line))
-                except:
-                    pass
+    entries = EventLog(FEEDBACK_LOG).scan()
     
     # Get recent surfaces and their outcomes
     surfaces = []
@@ -122,31 +115,11 @@ def check_message_fatigue(config):
     backoff_triggers = engagement_signals.get('backoffTriggers', ['👎', 'stop', 'less', 'too much'])
     max_negative = fatigue_config.get('maxNegativeSignals', 2)  # 2 explicit negatives = fatigue
     
-    if not FEEDBACK_LOG.exists():
-        return False, 0, {"threshold": max_negative, "action": "pause"}
-    
-    entries = []
-    with open(FEEDBACK_LOG) as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entries.append(json.loads(line))
-                except:
-                    pass
-    
     # Count recent negative signals (last 7 days)
     # ONLY count explicit negative feedback about surfacing frequency
     recent_negative = 0
-    cutoff = datetime.now(timezone.utc) - timedelta(days=7)
     
-    for e in entries:
-        try:
-            ts = datetime.fromisoformat(e.get('timestamp', '').replace('Z', '+00:00'))
-            if ts < cutoff:
-                continue
-        except:
-            continue
-        
+    for e in EventLog(FEEDBACK_LOG).scan(since=days_ago(7)):
         entry_type = e.get('type', '')
         
         # Only these count as negative:
@@ -180,8 +153,7 @@ def log_surface(category, topic=None, source=None):
         'source': source
     }
     
-    with open(FEEDBACK_LOG, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    EventLog(FEEDBACK_LOG).append(entry)
     
     return entry
 
@@ -11,12 +11,13 @@ Usage:
   python3 self-challenge.py --list    # List recent weaknesses
 """
 
-import json
 import sys
-from datetime import datetime, timedelta
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 WORKSPACE = Path(__file__).parent.parent
 REFLECTIONS_FILE = WORKSPACE / "memory" / "reflections.jsonl"
 
@@ -51,24 +52,7 @@ CHALLENGE_TEMPLATES = {
 
 def load_reflections(days: int = 14) -> list:
     """Load recent reflections"""
-    if not REFLECTIONS_FILE.exists():
-        return []
-    
-    cutoff = datetime.now() - timedelta(days=days)
-    reflections = []
-    
-    with open(REFLECTIONS_FILE) as f:
-        for line in f:
-            try:
-                r = json.loads(line.strip())
-                if r.get("timestamp"):
-                    ts = datetime.fromisoformat(r["timestamp"].replace("Z", "+00:00"))
-                    if ts.replace(tzinfo=None) > cutoff:
-                        reflections.append(r)
-            except:
-                continue
-    
-    return reflections
+    return EventLog(REFLECTIONS_FILE).read(since=days_ago(days))
 
 def identify_weaknesses(reflections: list) -> dict:
     """Identify weakness categories from reflections"""
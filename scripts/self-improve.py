@@ -17,13 +17,15 @@ Usage:
     python3 self-improve.py --dry-run   # Show what would change
 """
 
-import json
 import sys
 import re
 from pathlib import Path
 from datetime import datetime
 from collections import Counter, defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 WORKSPACE = Path.home() / '.openclaw/workspace'
 REFLECTIONS = WORKSPACE / 'memory/reflections.jsonl'
 FEEDBACK = WORKSPACE / 'memory/feedback-log.jsonl'
@@ -33,17 +35,7 @@ SELF_IMPROVE_LOG = WORKSPACE / 'memory/self-improvement-log.md'
 
 def load_jsonl(path):
     """Load JSONL file."""
-    entries = []
-    if path.exists():
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except:
-                        pass
-    return entries
+    return EventLog(path).read()
 
 
 def extract_lesson_patterns(reflections):
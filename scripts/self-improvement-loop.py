@@ -14,9 +14,12 @@ Usage: python3 scripts/self-improvement-loop.py [review|propose|status]
 
 import json
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 # Paths
 WORKSPACE = Path(__file__).parent.parent
 IMPROVEMENTS_FILE = WORKSPACE / "memory" / "improvement-proposals.json"
@@ -35,30 +38,8 @@ def load_json(path, default=None):
     return default if default is not None else {}
 
 def load_jsonl(path, days=7):
-    """Load JSONL entries from last N days."""
-    entries = []
-    if not path.exists():
-        return entries
-    cutoff = datetime.now() - timedelta(days=days)
-    try:
-        with open(path) as f:
-            for line in f:
-                if line.strip():
-                    entry = json.loads(line)
-                    # Try to parse timestamp
-                    ts = entry.get("timestamp") or entry.get("ts") or entry.get("date")
-                    if ts:
-                        try:
-                            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                            if dt.replace(tzinfo=None) > cutoff:
-                                entries.append(entry)
-                        except:
-                            entries.append(entry)  # Include if can't parse
-                    else:
-                        entries.append(entry)
-    except:
-        pass
-    return entries
+    """Load JSONL entries from last N days (older segments are skipped)."""
+    return EventLog(path).read(since=days_ago(days))
 
 def review_performance():
     """Review recent corrections, reflections, and feedback."""
@@ -11,47 +11,87 @@ Usage:
     python3 scripts/semantic-search.py --rebuild          # Force rebuild embeddings
     python3 scripts/semantic-search.py --status           # Check health
     python3 scripts/semantic-search.py --update           # Update changed files only
+    python3 scripts/semantic-search.py --batch queries.txt  # One query per line (- for stdin), JSON out
+    python3 scripts/semantic-search.py --benchmark        # ANN recall vs latency against exact scan
+    python3 scripts/semantic-search.py --serve            # Resident daemon on a Unix socket
+    python3 scripts/semantic-search.py --stop             # Stop the daemon
+    python3 scripts/semantic-search.py --migrate          # Convert legacy JSON cache to binary store
+    python3 scripts/semantic-search.py --migrate --remove-json  # ...and delete the JSON afterwards
 
 Safeguards:
     - Source files never modified (read-only)
     - Results always show file + line number
     - Confidence scores filter low-quality matches
-    - Falls back to grep if API fails
+    - Repeated queries hit an on-disk LRU cache instead of the API
+    - Hybrid ranking: BM25 keyword index fused with vector scores (RRF)
+    - Falls back to ranked keyword search (BM25) if the API fails
     - One command rebuild if anything breaks
+    - Interrupted rebuilds resume from a checkpoint
+    - OPENAI_BASE_URL is honoured (see embed_ingest.py for an offline fake server)
+
+Daemon:
+    --serve keeps the index in memory, polls memory/ for changes and reindexes
+    incrementally, and answers queries on ~/.openclaw/semantic-search.sock.
+    Queries and --batch go through the daemon when it is running and fall back
+    to in-process search when it is not (SEMANTIC_NO_DAEMON=1 forces in-process).
 """
 
 import os
 import sys
 import json
+import time
+import socket
 import hashlib
-import subprocess
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 
+sys.path.insert(0, str(Path(__file__).parent))
+from bm25_index import BM25Index, rrf_fuse
+from embed_ingest import content_key
+from query_cache import QueryEmbeddingCache
+
 # Lazy imports for faster --help
 def get_imports():
-    global np, openai
+    global np, openai, EmbeddingStore, VectorIndex, EmbeddingIngestor, ann_index
     try:
         import numpy as np
         import openai
+        from embedding_store import EmbeddingStore
+        from vector_search import VectorIndex
+        from embed_ingest import EmbeddingIngestor
+        import ann_index
         return True
     except ImportError as e:
-        print(f"Missing dependency: {e}")
-        print("Run: pip install numpy openai")
+        print(f"Missing dependency: {e}", file=sys.stderr)
+        print("Run: pip install numpy openai", file=sys.stderr)
         return False
 
 # Paths
 WORKSPACE = Path.home() / '.openclaw/workspace'
 MEMORY_DIR = WORKSPACE / 'memory'
 MEMORY_MD = WORKSPACE / 'MEMORY.md'
-EMBEDDINGS_FILE = WORKSPACE / 'memory/.embeddings-cache.json'
+EMBEDDINGS_FILE = WORKSPACE / 'memory/.embeddings-cache.json'  # Legacy JSON cache (see --migrate)
+CHECKPOINT_FILE = WORKSPACE / 'memory/.embeddings-checkpoint.jsonl'  # Resume state for interrupted rebuilds
+ANN_FILE = WORKSPACE / 'memory/.embeddings-ivf.npz'  # Approximate index (large stores only)
+BM25_FILE = WORKSPACE / 'memory/.bm25-index.json'  # Keyword index over the same chunks
+QUERY_CACHE_FILE = WORKSPACE / 'memory/.query-embeddings.db'  # LRU cache of query embeddings
 OPENAI_KEY_FILE = Path.home() / '.openclaw/config.yaml'
+SOCKET_PATH = Path.home() / '.openclaw/semantic-search.sock'
 
 # Config
 EMBEDDING_MODEL = "text-embedding-3-small"
-CHUNK_SIZE = 500  # tokens approx (chars / 4)
+CHUNK_SIZE = 500  # tokens approx (chars / 4); chunks never grow past this
+CHUNK_MIN = 200  # Heading and hash cut points are ignored in chunks smaller than this
+CHUNK_CUT_EVERY = 8  # Content-defined cut after ~1 in N paragraphs (by paragraph hash)
 MIN_SIMILARITY = 0.3  # Don't show results below this
 TOP_K = 5  # Max results to return
+FUSION_DEPTH = 4  # Candidates per ranker = top_k × this, before RRF
+RRF_K = 60  # Reciprocal-rank fusion constant
+INDEX_BACKEND = os.environ.get('SEMANTIC_INDEX', 'auto')  # auto | exact | ivf
+ANN_MIN_CHUNKS = 20000  # auto: switch from exact scan to IVF at this size
+WATCH_INTERVAL = 30  # Daemon: seconds between memory/ change checks
+CLIENT_TIMEOUT = 60  # Seconds to wait for a daemon answer
 
 
 def get_openai_key():
@@ -69,7 +109,7 @@ def get_openai_key():
         # Fallback to env
         return os.environ.get('OPENAI_API_KEY')
     except Exception as e:
-        print(f"Warning: Could not read config: {e}")
+        print(f"Warning: Could not read config: {e}", file=sys.stderr)
         return os.environ.get('OPENAI_API_KEY')
 
 
@@ -79,79 +119,132 @@ def get_file_hash(filepath):
         return hashlib.md5(f.read()).hexdigest()
 
 
+def paragraphs(lines, chunk_size=CHUNK_SIZE):
+    """(first line index, line count, token estimate, text) per paragraph.
+
+    A markdown heading starts a paragraph and a blank line ends one (blank lines
+    stay with the paragraph above them). A paragraph bigger than chunk_size is
+    split into its lines.
+    """
+    units = []
+    start = 0
+    for i in range(1, len(lines) + 1):
+        at_boundary = (i == len(lines) or lines[i].startswith('#')
+                       or (not lines[i - 1].strip() and lines[i].strip()))
+        if not at_boundary:
+            continue
+        block = lines[start:i]
+        size = sum(len(line) // 4 for line in block)
+        if size > chunk_size:
+            units.extend((start + j, 1, len(line) // 4, line) for j, line in enumerate(block))
+        else:
+            units.append((start, len(block), size, '\n'.join(block)))
+        start = i
+    return units
+
+
+def is_cut_point(text):
+    """Content-defined boundary: depends only on this paragraph, not its position."""
+    digest = hashlib.md5(text.strip().encode()).digest()
+    return int.from_bytes(digest[:4], 'big') % CHUNK_CUT_EVERY == 0
+
+
 def chunk_text(text, filepath, chunk_size=CHUNK_SIZE):
-    """Split text into chunks with metadata."""
+    """Split text into chunks with metadata.
+
+    Boundaries come from the content (headings, and paragraphs whose hash marks
+    a cut point) rather than a running size count, so an edit only re-chunks
+    around itself and later chunks keep their text (and embeddings).
+    """
     lines = text.split('\n')
     chunks = []
-    current_chunk = []
+    current = []  # (first line index, line count) per paragraph in the chunk
     current_size = 0
-    start_line = 1
-    
-    for i, line in enumerate(lines, 1):
-        line_size = len(line) // 4  # Rough token estimate
-        
-        if current_size + line_size > chunk_size and current_chunk:
-            chunks.append({
-                'text': '\n'.join(current_chunk),
-                'file': str(filepath),
-                'start_line': start_line,
-                'end_line': i - 1
-            })
-            current_chunk = [line]
-            current_size = line_size
-            start_line = i
-        else:
-            current_chunk.append(line)
-            current_size += line_size
-    
-    # Don't forget the last chunk
-    if current_chunk:
+
+    def flush():
+        first = current[0][0]
+        last = current[-1][0] + current[-1][1]
         chunks.append({
-            'text': '\n'.join(current_chunk),
+            'text': '\n'.join(lines[first:last]),
             'file': str(filepath),
-            'start_line': start_line,
-            'end_line': len(lines)
+            'start_line': first + 1,
+            'end_line': last
         })
-    
+        current.clear()
+
+    for start, count, size, para in paragraphs(lines, chunk_size):
+        if current and (current_size + size > chunk_size or
+                        (para.startswith('#') and current_size >= CHUNK_MIN)):
+            flush()
+            current_size = 0
+        current.append((start, count))
+        current_size += size
+        if current_size >= CHUNK_MIN and is_cut_point(para):
+            flush()
+            current_size = 0
+
+    # Don't forget the last chunk
+    if current:
+        flush()
+
     return chunks
 
 
-def get_embedding(text, client):
-    """Get embedding for text from OpenAI."""
+def get_embeddings(texts, client):
+    """Get embeddings for several texts in one API call."""
     try:
         response = client.embeddings.create(
             model=EMBEDDING_MODEL,
-            input=text[:8000]  # Truncate if too long
+            input=[t[:8000] for t in texts]
         )
-        return response.data[0].embedding
+        return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
     except Exception as e:
-        print(f"Embedding error: {e}")
+        print(f"Embedding error: {e}", file=sys.stderr)
         return None
 
 
-def cosine_similarity(a, b):
-    """Compute cosine similarity between two vectors."""
-    a = np.array(a)
-    b = np.array(b)
-    return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+def get_store():
+    """Binary embedding store (float32 matrix + metadata sidecar)."""
+    return EmbeddingStore(MEMORY_DIR)
+
+
+def empty_cache():
+    return {'files': {}, 'chunks': [], 'embeddings': np.zeros((0, 0), dtype=np.float32)}
 
 
 def load_cache():
-    """Load embeddings cache."""
-    if EMBEDDINGS_FILE.exists():
-        try:
-            with open(EMBEDDINGS_FILE) as f:
-                return json.load(f)
-        except:
-            return {'files': {}, 'chunks': [], 'embeddings': []}
-    return {'files': {}, 'chunks': [], 'embeddings': []}
+    """Load embeddings cache. Embeddings come back as a memory-mapped float32 matrix."""
+    store = get_store()
+    if not store.exists() and EMBEDDINGS_FILE.exists():
+        print("📦 Migrating legacy JSON cache to binary store...", file=sys.stderr)
+        migrate_cache()
+    try:
+        meta, matrix = store.load()
+    except Exception as e:
+        print(f"⚠️ Could not load embedding store: {e}", file=sys.stderr)
+        return empty_cache()
+    meta['embeddings'] = matrix
+    return meta
 
 
 def save_cache(cache):
     """Save embeddings cache."""
-    EMBEDDINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(EMBEDDINGS_FILE, 'w') as f:
-        json.dump(cache, f)
+    cache = dict(cache)
+    embeddings = cache.pop('embeddings')
+    get_store().save(cache, embeddings)
+
+
+def migrate_cache(remove=False):
+    """Convert legacy .embeddings-cache.json into the binary store."""
+    summary = get_store().migrate_json(EMBEDDINGS_FILE, remove=remove)
+    if summary is None:
+        print("Nothing to migrate (no legacy JSON cache)")
+        return False
+    ratio = summary['json_bytes'] / max(summary['store_bytes'], 1)
+    print(f"✅ Migrated {summary['chunks']} chunks: "
+          f"{summary['json_bytes'] / 1024:.1f} KB JSON → {summary['store_bytes'] / 1024:.1f} KB binary "
+          f"({ratio:.1f}x smaller)")
+    return True
 
 
 def get_memory_files():
@@ -179,141 +272,375 @@ def rebuild_embeddings(force=False):
     
     api_key = get_openai_key()
     if not api_key:
-        print("❌ No OpenAI API key found")
+        print("❌ No OpenAI API key found", file=sys.stderr)
         return False
     
     client = openai.OpenAI(api_key=api_key)
-    cache = load_cache() if not force else {'files': {}, 'chunks': [], 'embeddings': []}
+    cache = load_cache() if not force else empty_cache()
     
     files = get_memory_files()
-    print(f"📁 Found {len(files)} memory files")
-    
-    new_chunks = []
-    new_embeddings = []
-    files_processed = {}
+    print(f"📁 Found {len(files)} memory files", file=sys.stderr)
+    
+    # Content-addressed lookup: chunk key -> row, file -> rows
+    key_to_row = {}
+    file_rows = cache.get('file_chunks') or {}
+    if cache.get('model', EMBEDDING_MODEL) == EMBEDDING_MODEL:
+        for i, chunk in enumerate(cache.get('chunks', [])):
+            key = chunk.get('key') or content_key(chunk['text'], EMBEDDING_MODEL)
+            key_to_row.setdefault(key, i)
+    if not file_rows:  # Stores written before the per-file chunk index existed
+        for i, chunk in enumerate(cache.get('chunks', [])):
+            file_rows.setdefault(chunk.get('file', ''), []).append(i)
+    
+    planned = []  # (rel_path, file_hash, [(chunk, cached_row or None)])
+    to_embed = []
+    reused = 0
     
     for filepath in files:
         file_hash = get_file_hash(filepath)
         rel_path = str(filepath.relative_to(WORKSPACE))
         
-        # Check if file changed
-        if not force and rel_path in cache.get('files', {}) and cache['files'][rel_path] == file_hash:
-            # Keep existing embeddings for this file
-            for i, chunk in enumerate(cache.get('chunks', [])):
-                if chunk.get('file', '').endswith(rel_path) or rel_path in chunk.get('file', ''):
-                    new_chunks.append(chunk)
-                    if i < len(cache.get('embeddings', [])):
-                        new_embeddings.append(cache['embeddings'][i])
-            files_processed[rel_path] = file_hash
+        # Unchanged file: keep its rows as-is
+        if not force and cache.get('files', {}).get(rel_path) == file_hash and rel_path in file_rows:
+            rows = file_rows[rel_path]
+            planned.append((rel_path, file_hash, [(cache['chunks'][i], i) for i in rows]))
             continue
         
-        # Process changed/new file
-        print(f"  → Embedding: {rel_path}")
+        # Changed/new file: re-chunk, reuse any chunk whose content is already embedded
         try:
             text = filepath.read_text()
-            chunks = chunk_text(text, rel_path)
-            
-            for chunk in chunks:
-                embedding = get_embedding(chunk['text'], client)
-                if embedding:
-                    new_chunks.append(chunk)
-                    new_embeddings.append(embedding)
-            
-            files_processed[rel_path] = file_hash
         except Exception as e:
-            print(f"    ⚠️ Error: {e}")
+            print(f"    ⚠️ Error: {rel_path}: {e}", file=sys.stderr)
+            continue
+        
+        entries = []
+        for chunk in chunk_text(text, rel_path):
+            chunk['key'] = content_key(chunk['text'], EMBEDDING_MODEL)
+            row = None if force else key_to_row.get(chunk['key'])
+            if row is None:
+                to_embed.append(chunk['text'])
+            else:
+                reused += 1
+            entries.append((chunk, row))
+        new_count = sum(1 for _, row in entries if row is None)
+        print(f"  → {rel_path}: {new_count} new/changed of {len(entries)} chunks", file=sys.stderr)
+        planned.append((rel_path, file_hash, entries))
+    
+    if reused:
+        print(f"  ♻️ Reusing {reused} unchanged chunks from changed files", file=sys.stderr)
+    
+    # Embed only new/changed chunks, in batched concurrent requests (resumable)
+    ingestor = EmbeddingIngestor(client, EMBEDDING_MODEL, checkpoint_path=CHECKPOINT_FILE)
+    embedded = ingestor.embed(to_embed) if to_embed else {}
+    
+    new_chunks = []
+    new_embeddings = []
+    files_processed = {}
+    file_chunks = {}
+    fresh = 0
+    complete = True
+    
+    for rel_path, file_hash, entries in planned:
+        rows = []
+        missing = 0
+        for chunk, row in entries:
+            key = chunk.get('key') or content_key(chunk['text'], EMBEDDING_MODEL)
+            embedding = cache['embeddings'][row] if row is not None else embedded.get(key)
+            if embedding is None:
+                missing += 1
+                continue
+            fresh += row is None
+            rows.append(len(new_chunks))
+            new_chunks.append(dict(chunk, key=key))
+            new_embeddings.append(embedding)
+        file_chunks[rel_path] = rows
+        if missing:
+            complete = False  # Leave hash unrecorded so --update retries this file
+        else:
+            files_processed[rel_path] = file_hash
     
     # Save updated cache
     cache = {
         'files': files_processed,
+        'file_chunks': file_chunks,
         'chunks': new_chunks,
         'embeddings': new_embeddings,
         'model': EMBEDDING_MODEL,
         'updated': datetime.now(timezone.utc).isoformat()
     }
     save_cache(cache)
+    if complete:
+        ingestor.checkpoint.clear()
+    if use_ann(len(new_chunks)):
+        sync_ann_index(load_cache())
+    sync_bm25_index(new_chunks)
+    
+    print(f"✅ Indexed {len(new_chunks)} chunks from {len(files_processed)} files "
+          f"({fresh} embedded, {len(new_chunks) - fresh} reused)", file=sys.stderr)
+    return True
+
+
+def use_ann(n_chunks):
+    """Whether searches should go through the approximate index."""
+    if INDEX_BACKEND == 'ivf':
+        return True
+    if INDEX_BACKEND == 'exact':
+        return False
+    return n_chunks >= ANN_MIN_CHUNKS
+
+
+def sync_ann_index(cache):
+    """Bring the IVF index in line with the store: insert new keys, delete stale ones."""
+    keys = [c['key'] for c in cache['chunks']]
+    index = None
+    if ANN_FILE.exists():
+        try:
+            index = ann_index.IVFIndex.load(ANN_FILE)
+        except Exception as e:
+            print(f"⚠️ Could not load ANN index ({e}), rebuilding", file=sys.stderr)
+    
+    if index is None or index.needs_retrain():
+        print(f"🧭 Training IVF index over {len(keys)} chunks...", file=sys.stderr)
+        index = ann_index.IVFIndex.build(keys, cache['embeddings'])
+    else:
+        current = set(keys)
+        stale = [k for k in index.keys if k in index.key_to_slot and k not in current]
+        rows = [i for i, k in enumerate(keys) if k not in index.key_to_slot]
+        index.remove(stale)
+        index.add([keys[i] for i in rows], cache['embeddings'][rows])
+        if stale or rows:
+            print(f"🧭 IVF index: +{len(rows)} / -{len(stale)} chunks", file=sys.stderr)
     
-    print(f"✅ Indexed {len(new_chunks)} chunks from {len(files_processed)} files")
+    index.save(ANN_FILE)
+    return index
+
+
+class AnnSearcher:
+    """Adapts IVFIndex (keyed) to the row-based VectorIndex interface."""
+    
+    def __init__(self, index, chunks):
+        self.index = index
+        self.key_to_row = {c['key']: i for i, c in enumerate(chunks)}
+    
+    def search_batch(self, queries, top_k=TOP_K, min_score=-1.0):
+        return [[(score, self.key_to_row[key]) for score, key in hits if key in self.key_to_row]
+                for hits in self.index.search_batch(queries, top_k, min_score)]
+
+
+def get_index(cache):
+    """Exact scan for small stores, IVF for large ones (see SEMANTIC_INDEX)."""
+    if use_ann(len(cache['chunks'])) and all('key' in c for c in cache['chunks']):
+        index = ann_index.IVFIndex.load(ANN_FILE) if ANN_FILE.exists() else sync_ann_index(cache)
+        return AnnSearcher(index, cache['chunks'])
+    return VectorIndex(cache['embeddings'], normalized=cache.get('normalized', False))
+
+
+def run_benchmark():
+    """Recall-vs-latency of the IVF index against exact scan, on the real store."""
+    if not get_imports():
+        return False
+    cache = load_cache()
+    if len(cache['embeddings']) < 100:
+        print("Store too small to benchmark (use: python3 scripts/ann_index.py --benchmark N DIM)")
+        return False
+    ann_index.benchmark(np.asarray(cache['embeddings']))
     return True
 
 
+def format_result(chunk, score):
+    """Turn a cached chunk + score into a result dict."""
+    return {
+        'score': round(score, 3),
+        'file': chunk['file'],
+        'lines': f"{chunk['start_line']}-{chunk['end_line']}",
+        'preview': chunk['text'][:200] + '...' if len(chunk['text']) > 200 else chunk['text']
+    }
+
+
 def search(query, top_k=TOP_K):
     """Search memory files semantically."""
-    if not get_imports():
-        return fallback_grep(query)
-    
+    return search_many([query], top_k=top_k)[0]
+
+
+def load_search_state():
+    """Everything a query needs, loaded once: chunk store, vector index, keyword index."""
     cache = load_cache()
+    return {
+        'cache': cache,
+        'index': get_index(cache) if len(cache['embeddings']) else None,
+        'bm25': load_bm25_index(),
+    }
+
+
+def search_many(queries, top_k=TOP_K, state=None):
+    """Search several queries at once: one embeddings call, one matrix product.
+
+    Vector hits are fused with BM25 keyword hits (reciprocal-rank fusion).
+    `state` (from load_search_state) lets the daemon skip reloading per query.
+    Returns a list of result lists, aligned with `queries`.
+    """
+    if not queries:
+        return []
     
-    if not cache.get('embeddings'):
-        print("⚠️ No embeddings found. Building index...")
-        if not rebuild_embeddings():
-            return fallback_grep(query)
-        cache = load_cache()
+    def fallback():
+        return [keyword_search(q, top_k) for q in queries]
     
-    api_key = get_openai_key()
-    if not api_key:
-        print("⚠️ No API key, falling back to grep")
-        return fallback_grep(query)
+    if not get_imports():
+        return fallback()
+    
+    if state is None:
+        state = load_search_state()
+        if state['index'] is None:
+            print("⚠️ No embeddings found. Building index...", file=sys.stderr)
+            if not rebuild_embeddings():
+                return fallback()
+            state = load_search_state()
+    
+    if state['index'] is None:
+        return fallback()
     
     try:
-        client = openai.OpenAI(api_key=api_key)
-        query_embedding = get_embedding(query, client)
-        
-        if not query_embedding:
-            return fallback_grep(query)
+        query_embeddings = embed_queries(queries)
         
-        # Calculate similarities
-        similarities = []
-        for i, emb in enumerate(cache['embeddings']):
-            sim = cosine_similarity(query_embedding, emb)
-            if sim >= MIN_SIMILARITY:
-                similarities.append((sim, i))
+        if not query_embeddings:
+            return fallback()
         
-        # Sort by similarity
-        similarities.sort(reverse=True)
+        depth = top_k * FUSION_DEPTH
+        cache, bm25 = state['cache'], state['bm25']
+        batch = state['index'].search_batch(query_embeddings, top_k=depth, min_score=MIN_SIMILARITY)
         
-        # Format results
         results = []
-        for sim, idx in similarities[:top_k]:
-            chunk = cache['chunks'][idx]
-            results.append({
-                'score': round(sim, 3),
-                'file': chunk['file'],
-                'lines': f"{chunk['start_line']}-{chunk['end_line']}",
-                'preview': chunk['text'][:200] + '...' if len(chunk['text']) > 200 else chunk['text']
-            })
-        
+        for query, hits in zip(queries, batch):
+            lexical = bm25.search(query, top_k=depth)
+            results.append(fuse_results(cache['chunks'], hits, lexical, bm25, top_k))
         return results
     
     except Exception as e:
-        print(f"⚠️ Search error: {e}, falling back to grep")
-        return fallback_grep(query)
+        print(f"⚠️ Search error: {e}, falling back to keyword search", file=sys.stderr)
+        return fallback()
 
 
-def fallback_grep(query):
-    """Fallback to grep if semantic search fails."""
-    print(f"🔍 Grep fallback for: {query}")
-    results = []
-    
+_client = None
+
+
+def get_client(api_key):
+    """OpenAI client, reused across calls (keeps the daemon's connection pool warm)."""
+    global _client
+    if _client is None:
+        _client = openai.OpenAI(api_key=api_key)
+    return _client
+
+
+def embed_queries(queries):
+    """Query embeddings, served from the on-disk LRU cache where possible.
+
+    Only cache misses go to the API. Returns None if any miss can't be embedded.
+    """
+    qcache = QueryEmbeddingCache(QUERY_CACHE_FILE)
     try:
-        # Simple grep through memory files
-        cmd = f'grep -rn -i "{query}" {MEMORY_DIR} {MEMORY_MD} 2>/dev/null | head -10'
-        output = subprocess.check_output(cmd, shell=True, text=True)
+        embeddings = [qcache.get(EMBEDDING_MODEL, q) for q in queries]
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if not missing:
+            return embeddings
         
-        for line in output.strip().split('\n'):
-            if line:
-                parts = line.split(':', 2)
-                if len(parts) >= 3:
-                    results.append({
-                        'score': 0.5,  # Unknown confidence
-                        'file': parts[0],
-                        'lines': parts[1],
-                        'preview': parts[2][:200],
-                        'fallback': True
-                    })
-    except:
-        pass
+        api_key = get_openai_key()
+        if not api_key:
+            print("⚠️ No API key, falling back to keyword search", file=sys.stderr)
+            return None
+        
+        fetched = get_embeddings([queries[i] for i in missing], get_client(api_key))
+        if not fetched:
+            return None
+        
+        for i, embedding in zip(missing, fetched):
+            embeddings[i] = embedding
+            qcache.put(EMBEDDING_MODEL, queries[i], embedding)
+        return embeddings
+    finally:
+        qcache.close()
+
+
+def fuse_results(chunks, vector_hits, lexical_hits, bm25, top_k=TOP_K):
+    """Reciprocal-rank fusion of vector (score, row) and BM25 (score, key) hits.
+
+    'score' is the fused RRF score scaled so 1.0 = ranked first by both.
+    """
+    by_key = {}
+    for sim, idx in vector_hits:
+        key = chunks[idx].get('key') or content_key(chunks[idx]['text'], EMBEDDING_MODEL)
+        by_key.setdefault(key, (chunks[idx], sim))
+    
+    fused = rrf_fuse([list(by_key), [key for _, key in lexical_hits]], k=RRF_K)
+    best = 2.0 / (RRF_K + 1)
+    lexical_keys = {key for _, key in lexical_hits}
     
+    results = []
+    for rrf, key in fused[:top_k]:
+        if key in by_key:
+            chunk, sim = by_key[key]
+            r = format_result(chunk, rrf / best)
+            r['similarity'] = round(sim, 3)
+            r['match'] = 'hybrid' if key in lexical_keys else 'vector'
+        else:
+            r = format_doc(bm25.docs[key], rrf / best)
+            r['match'] = 'keyword'
+        results.append(r)
+    return results
+
+
+def format_doc(doc, score):
+    """Result dict from a BM25 doc entry (no embedding store needed)."""
+    return {
+        'score': round(score, 3),
+        'file': doc['file'],
+        'lines': f"{doc['start_line']}-{doc['end_line']}",
+        'preview': doc['preview'],
+    }
+
+
+def load_bm25_index():
+    """Load the keyword index, building it straight from memory files if missing."""
+    index = BM25Index.load(BM25_FILE)
+    if not len(index):
+        chunks = []
+        for filepath in get_memory_files():
+            rel_path = str(filepath.relative_to(WORKSPACE))
+            try:
+                text = filepath.read_text()
+            except Exception:
+                continue
+            for chunk in chunk_text(text, rel_path):
+                chunk['key'] = content_key(chunk['text'], EMBEDDING_MODEL)
+                chunks.append(chunk)
+        index.sync(chunks)
+        index.save(BM25_FILE)
+    return index
+
+
+def sync_bm25_index(chunks):
+    """Keep the keyword index covering exactly the embedded chunks."""
+    index = BM25Index.load(BM25_FILE)
+    added, removed = index.sync(chunks)
+    index.save(BM25_FILE)
+    if added or removed:
+        print(f"🔤 Keyword index: +{added} / -{removed} chunks", file=sys.stderr)
+    return index
+
+
+def keyword_search(query, top_k=TOP_K):
+    """Ranked BM25 keyword search — used when embeddings are unavailable."""
+    print(f"🔍 Keyword fallback for: {query}", file=sys.stderr)
+    index = load_bm25_index()
+    hits = index.search(query, top_k=top_k)
+    if not hits:
+        return []
+    top = hits[0][0]
+    results = []
+    for score, key in hits:
+        r = format_doc(index.docs[key], score / top)
+        r['bm25'] = round(score, 3)
+        r['fallback'] = True
+        results.append(r)
     return results
 
 
@@ -321,23 +648,41 @@ def status():
     """Check health of semantic search system."""
     print("🔍 Semantic Search Status\n")
     
+    if not get_imports():
+        return False
+    
     cache = load_cache()
+    store = get_store()
     
     # Cache status
-    if EMBEDDINGS_FILE.exists():
-        size = EMBEDDINGS_FILE.stat().st_size / 1024
-        print(f"📦 Cache: {size:.1f} KB")
+    if store.exists():
+        size = store.size_bytes() / 1024
+        print(f"📦 Cache: {size:.1f} KB ({store.matrix_path.name} + {store.meta_path.name})")
         print(f"   Model: {cache.get('model', 'unknown')}")
         print(f"   Updated: {cache.get('updated', 'unknown')}")
         print(f"   Chunks: {len(cache.get('chunks', []))}")
         print(f"   Files: {len(cache.get('files', {}))}")
+        print(f"   Dim: {cache.get('dim', 'unknown')}")
     else:
         print("📦 Cache: Not found (run --rebuild)")
     
+    bm25 = BM25Index.load(BM25_FILE)
+    if len(bm25):
+        print(f"🔤 Keyword index: {len(bm25)} chunks, {len(bm25.postings)} terms, "
+              f"{BM25_FILE.stat().st_size / 1024:.1f} KB")
+    else:
+        print("🔤 Keyword index: Not built (built on next --update or search)")
+    
+    qcache = QueryEmbeddingCache(QUERY_CACHE_FILE)
+    qs = qcache.stats()
+    qcache.close()
+    print(f"⚡ Query cache: {qs['entries']}/{qs['max_entries']} entries, {qs['bytes'] / 1024:.1f} KB")
+    print(f"   Hits: {qs['hits']}  Misses: {qs['misses']}  Hit rate: {qs['hit_rate']:.0%}  "
+          f"Evictions: {qs['evictions']}")
+    
     # File coverage
     print(f"\n📁 Memory files:")
     files = get_memory_files()
-    cached_files = set(cache.get('files', {}).keys())
     
     stale = 0
     for f in files:
@@ -357,6 +702,15 @@ def status():
     else:
         print(f"\n   Run --update to refresh {stale} files")
     
+    # Daemon check
+    info = daemon_request({'op': 'ping'}, timeout=2)
+    print("\n🧠 Daemon:")
+    if info:
+        print(f"   ✅ pid {info['pid']}, up {info['uptime']}s, {info['chunks']} chunks, "
+              f"{info['queries']} queries, {info['reindexes']} reindexes")
+    else:
+        print("   ⚪ Not running (queries run in-process; start with --serve)")
+    
     # API check
     print(f"\n🔑 API:")
     api_key = get_openai_key()
@@ -368,6 +722,147 @@ def status():
     return stale == 0
 
 
+# === Daemon ===
+
+def daemon_request(request, timeout=CLIENT_TIMEOUT):
+    """Send one JSON request to the daemon. Returns the reply, or None if no daemon."""
+    if os.environ.get('SEMANTIC_NO_DAEMON') or not SOCKET_PATH.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(json.dumps(request).encode() + b'\n')
+            data = b''
+            while not data.endswith(b'\n'):
+                part = sock.recv(65536)
+                if not part:
+                    break
+                data += part
+        reply = json.loads(data)
+        return None if 'error' in reply else reply
+    except (OSError, ValueError):
+        return None
+
+
+def search_client(queries, top_k=TOP_K):
+    """Thin client: ask the daemon, fall back to in-process search."""
+    reply = daemon_request({'op': 'search', 'queries': queries, 'top_k': top_k})
+    if reply is not None:
+        return reply['results']
+    return search_many(queries, top_k=top_k)
+
+
+def memory_snapshot():
+    """(mtime, size) per memory file — cheap change detection for the watcher."""
+    snap = {}
+    for f in get_memory_files():
+        try:
+            st = f.stat()
+            snap[str(f)] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+    return snap
+
+
+class SearchDaemon:
+    """Resident index + Unix socket server + memory/ watcher."""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = load_search_state()
+        self.snapshot = memory_snapshot()
+        self.started = time.time()
+        self.queries = 0
+        self.reindexes = 0
+        self.running = True
+    
+    def reindex(self):
+        """Incremental --update, then swap in the fresh state."""
+        with self.lock:
+            rebuild_embeddings(force=False)
+            self.state = load_search_state()
+            self.snapshot = memory_snapshot()
+            self.reindexes += 1
+    
+    def watch(self):
+        while self.running:
+            time.sleep(WATCH_INTERVAL)
+            if memory_snapshot() != self.snapshot:
+                print(f"👀 memory/ changed — reindexing ({datetime.now():%H:%M:%S})")
+                try:
+                    self.reindex()
+                except Exception as e:
+                    print(f"⚠️ Reindex failed: {e}")
+    
+    def handle(self, request):
+        op = request.get('op')
+        if op == 'search':
+            self.queries += len(request['queries'])
+            state = self.state  # Snapshot reference; reindex swaps it atomically
+            return {'results': search_many(request['queries'], request.get('top_k', TOP_K), state=state)}
+        if op == 'ping':
+            return {
+                'pid': os.getpid(),
+                'uptime': round(time.time() - self.started),
+                'chunks': len(self.state['cache']['chunks']),
+                'queries': self.queries,
+                'reindexes': self.reindexes,
+            }
+        if op == 'reindex':
+            self.reindex()
+            return {'chunks': len(self.state['cache']['chunks'])}
+        if op == 'shutdown':
+            self.running = False
+            return {'ok': True}
+        return {'error': f'unknown op: {op}'}
+
+
+def serve():
+    """Run the daemon in the foreground."""
+    import socketserver
+    
+    if not get_imports():
+        return False
+    if daemon_request({'op': 'ping'}, timeout=2) is not None:
+        print(f"Daemon already running on {SOCKET_PATH}")
+        return False
+    
+    print("🧠 Loading index...")
+    daemon = SearchDaemon()
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                reply = daemon.handle(json.loads(self.rfile.readline()))
+            except Exception as e:
+                reply = {'error': str(e)}
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+            if not daemon.running:
+                threading.Thread(target=server.shutdown, daemon=True).start()
+    
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()  # Stale socket from a crashed daemon
+    server = socketserver.ThreadingUnixStreamServer(str(SOCKET_PATH), Handler)
+    server.daemon_threads = True
+    os.chmod(SOCKET_PATH, 0o600)
+    threading.Thread(target=daemon.watch, daemon=True).start()
+    
+    print(f"✅ Serving {len(daemon.state['cache']['chunks'])} chunks on {SOCKET_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.running = False
+        server.server_close()
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
+    print("👋 Daemon stopped")
+    return True
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -384,10 +879,31 @@ def main():
     elif arg == '--status':
         status()
     
+    elif arg == '--batch':
+        source = sys.argv[2] if len(sys.argv) > 2 else '-'
+        lines = sys.stdin.read() if source == '-' else Path(source).read_text()
+        queries = [q.strip() for q in lines.split('\n') if q.strip()]
+        results = search_client(queries)
+        print(json.dumps([{'query': q, 'results': r} for q, r in zip(queries, results)], indent=2))
+    
+    elif arg == '--benchmark':
+        run_benchmark()
+    
+    elif arg == '--serve':
+        serve()
+    
+    elif arg == '--stop':
+        reply = daemon_request({'op': 'shutdown'}, timeout=5)
+        print("👋 Daemon stopped" if reply else "No daemon running")
+    
+    elif arg == '--migrate':
+        if get_imports():
+            migrate_cache(remove='--remove-json' in sys.argv)
+    
     else:
         # Search query
         query = ' '.join(sys.argv[1:])
-        results = search(query)
+        results = search_client([query])[0]
         
         if not results:
             print(f"No results for: {query}")
@@ -396,7 +912,7 @@ def main():
         print(f"🔍 Results for: {query}\n")
         for r in results:
             confidence = "🟢" if r['score'] > 0.5 else "🟡" if r['score'] > 0.35 else "🔴"
-            fallback = " (grep)" if r.get('fallback') else ""
+            fallback = " (keyword)" if r.get('fallback') else f" ({r['match']})" if r.get('match') else ""
             print(f"{confidence} [{r['score']}] {r['file']}:{r['lines']}{fallback}")
             print(f"   {r['preview']}")
             print()
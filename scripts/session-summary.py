@@ -15,6 +15,9 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 WORKSPACE = Path(__file__).parent.parent
 SUMMARY_FILE = WORKSPACE / "memory" / "session-summary.md"
 
@@ -56,18 +59,12 @@ def generate_summary():
             pass
     
     # Recent reflections
-    reflections_file = WORKSPACE / "memory" / "reflections.jsonl"
-    if reflections_file.exists():
+    recent_reflections = EventLog(WORKSPACE / "memory" / "reflections.jsonl").tail(5)
+    if recent_reflections:
         summary_parts.append("## Recent Lessons")
-        lines = reflections_file.read_text().strip().split('\n')
-        recent = lines[-5:] if len(lines) >= 5 else lines
-        for line in recent:
-            try:
-                r = json.loads(line)
-                if r.get("lesson"):
-                    summary_parts.append(f"- {r['lesson'][:100]}")
-            except:
-                pass
+        for r in recent_reflections:
+            if r.get("lesson"):
+                summary_parts.append(f"- {r['lesson'][:100]}")
         summary_parts.append("")
     
     # Today's key events
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Session Index
+=============
+
+Persistent, incrementally maintained inverted index over OpenClaw session
+transcripts (~/.openclaw/agents/main/sessions/*.jsonl), used by
+search-history.py.
+
+One SQLite file holds:
+- messages: session, ordinal, role, timestamp, byte offset + length of the
+  JSONL line it came from (text itself stays in the transcript)
+- postings: word -> message ids
+- files: per transcript, the inode and byte offset indexed so far
+
+Transcripts are append-only, so update() only parses bytes past the stored
+offset (session_tail cursors); a file whose inode changed or that shrank is
+reindexed from byte 0.
+Queries intersect postings (rarest term first), filter role/date through
+indexed columns, and read message text back by seeking to stored offsets.
+
+Usage:
+    from session_index import SessionIndex
+    index = SessionIndex()
+    index.update()                                    # incremental
+    hits = index.search('"vector database" pricing', limit=10, role='user',
+                        since=time.time() - 7 * 86400, context=True)
+
+    python3 scripts/session_index.py --update
+    python3 scripts/session_index.py --rebuild
+    python3 scripts/session_index.py --stats
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from session_tail import read_lines, start_offset
+
+SESSIONS_DIR = Path.home() / ".openclaw" / "agents" / "main" / "sessions"
+SESSIONS_INDEX = SESSIONS_DIR / "sessions.json"
+INDEX_FILE = Path.home() / '.openclaw/workspace/memory/.session-index.db'
+
+TOKEN_RE = re.compile(r'\w+')
+PHRASE_RE = re.compile(r'"([^"]+)"')
+ROLES = ("user", "assistant")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def load_sessions_index(path: Path = SESSIONS_INDEX) -> Dict:
+    """Load the sessions index (key-value format)."""
+    if not path.exists():
+        return {}
+    content = path.read_text()
+    # Handle potential trailing commas (JSON5-ish)
+    content = re.sub(r',(\s*[}\]])', r'\1', content)
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        print(f"Warning: Could not parse sessions.json: {e}", file=sys.stderr)
+        return {}
+
+
+def extract_text_from_content(content) -> str:
+    """Extract readable text from message content."""
+    if isinstance(content, str):
+        return content
+
+    if isinstance(content, list):
+        texts = []
+        for part in content:
+            if isinstance(part, dict):
+                if part.get("type") == "text":
+                    texts.append(part.get("text", ""))
+            elif isinstance(part, str):
+                texts.append(part)
+        return " ".join(texts)
+
+    return ""
+
+
+def parse_message(event: Dict) -> Optional[Dict]:
+    """User/assistant text message from one transcript event, else None."""
+    if event.get("type") != "message":
+        return None
+    msg_data = event.get("message", {})
+    role = msg_data.get("role", "")
+    if role not in ROLES:
+        return None
+    text = extract_text_from_content(msg_data.get("content", ""))
+    if not text:
+        return None
+    return {"role": role, "content": text, "timestamp": event.get("timestamp", "")}
+
+
+def to_epoch(timestamp) -> float:
+    """Event timestamp (ISO string or epoch ms/s) as epoch seconds; 0 if unknown."""
+    if isinstance(timestamp, (int, float)):
+        return timestamp / 1000 if timestamp > 1e11 else float(timestamp)
+    if isinstance(timestamp, str) and timestamp:
+        try:
+            return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+class SessionIndex:
+    """Inverted index over session transcript messages."""
+
+    def __init__(self, db_path: Path = INDEX_FILE, sessions_dir: Path = SESSIONS_DIR):
+        self.sessions_dir = Path(sessions_dir)
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=10)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS files (
+                session_id TEXT PRIMARY KEY,
+                inode INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                next_seq INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                session_key TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                role TEXT NOT NULL,
+                ts REAL NOT NULL,
+                timestamp TEXT,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                question INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages(ts);
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_seq ON messages(session_id, seq);
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                msg_id INTEGER NOT NULL,
+                PRIMARY KEY (term, msg_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_msg ON postings(msg_id);
+        ''')
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # === Maintenance ===
+
+    def _drop_session(self, session_id: str) -> None:
+        self.conn.execute('DELETE FROM postings WHERE msg_id IN (SELECT id FROM messages WHERE session_id = ?)',
+                          (session_id,))
+        self.conn.execute('DELETE FROM messages WHERE session_id = ?', (session_id,))
+        self.conn.execute('DELETE FROM files WHERE session_id = ?', (session_id,))
+
+    def _index_file(self, path: Path, session_id: str, start: int, seq: int) -> Tuple[int, int, int]:
+        """Index complete lines from byte start. Returns (new offset, next seq, messages added)."""
+        offset, added = start, 0
+        for line_offset, line in read_lines(path, start):
+            offset = line_offset + len(line)
+            try:
+                msg = parse_message(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                continue
+            if msg is None:
+                continue
+            cur = self.conn.execute(
+                'INSERT INTO messages (session_id, seq, role, ts, timestamp, offset, length, question) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (session_id, seq, msg['role'], to_epoch(msg['timestamp']), str(msg['timestamp'] or ''),
+                 line_offset, len(line), int('?' in msg['content'])))
+            msg_id = cur.lastrowid
+            self.conn.executemany('INSERT OR IGNORE INTO postings (term, msg_id) VALUES (?, ?)',
+                                  ((term, msg_id) for term in set(tokenize(msg['content']))))
+            seq += 1
+            added += 1
+        return offset, seq, added
+
+    def update(self) -> Dict[str, int]:
+        """Index whatever was appended since the last update. Returns stats."""
+        stats = {'files': 0, 'reindexed': 0, 'messages': 0, 'removed': 0}
+        known = {row[0]: {'inode': row[1], 'offset': row[2], 'next_seq': row[3]}
+                 for row in self.conn.execute('SELECT session_id, inode, offset, next_seq FROM files')}
+        present = set()
+
+        for path in sorted(self.sessions_dir.glob('*.jsonl')) if self.sessions_dir.exists() else []:
+            session_id = path.stem
+            present.add(session_id)
+            offset, reset = start_offset(path, known.get(session_id))
+            if session_id in known and not reset and path.stat().st_size == offset:
+                continue
+            with self.conn:
+                # Re-read the cursor under the write lock: an overlapping update()
+                # may already have indexed these lines
+                self.conn.execute('BEGIN IMMEDIATE')
+                row = self.conn.execute('SELECT inode, offset, next_seq FROM files WHERE session_id = ?',
+                                        (session_id,)).fetchone()
+                cursor = {'inode': row[0], 'offset': row[1], 'next_seq': row[2]} if row else None
+                st = path.stat()
+                offset, reset = start_offset(path, cursor)
+                if cursor and not reset and st.st_size == offset:
+                    continue
+                seq = cursor['next_seq'] if cursor and not reset else 0
+                if reset:
+                    self._drop_session(session_id)
+                    stats['reindexed'] += 1
+                new_offset, seq, added = self._index_file(path, session_id, offset, seq)
+                self.conn.execute('INSERT OR REPLACE INTO files (session_id, inode, offset, next_seq) '
+                                  'VALUES (?, ?, ?, ?)', (session_id, st.st_ino, new_offset, seq))
+            stats['files'] += 1
+            stats['messages'] += added
+
+        with self.conn:
+            for session_id in set(known) - present:
+                self._drop_session(session_id)
+                stats['removed'] += 1
+            sessions = load_sessions_index(self.sessions_dir / 'sessions.json')
+            self.conn.execute('DELETE FROM sessions')
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO sessions (session_id, session_key) VALUES (?, ?)',
+                ((d['sessionId'], key) for key, d in sessions.items()
+                 if isinstance(d, dict) and d.get('sessionId')))
+        return stats
+
+    def rebuild(self) -> Dict[str, int]:
+        with self.conn:
+            self.conn.executescript('DELETE FROM postings; DELETE FROM messages; DELETE FROM files;')
+        return self.update()
+
+    # === Queries ===
+
+    def read_message(self, session_id: str, offset: int, length: int) -> Optional[Dict]:
+        """Message stored at a byte offset of a transcript."""
+        try:
+            with open(self.sessions_dir / f"{session_id}.jsonl", 'rb') as f:
+                f.seek(offset)
+                return parse_message(json.loads(f.read(length)))
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+            return None
+
+    def messages(self, session_id: str) -> List[Dict]:
+        """Every indexed message of a session, in transcript order."""
+        rows = self.conn.execute('SELECT offset, length FROM messages WHERE session_id = ? ORDER BY seq',
+                                 (session_id,)).fetchall()
+        msgs = (self.read_message(session_id, offset, length) for offset, length in rows)
+        return [m for m in msgs if m]
+
+    def _neighbour(self, session_id: str, seq: int) -> Optional[str]:
+        row = self.conn.execute('SELECT offset, length FROM messages WHERE session_id = ? AND seq = ?',
+                                (session_id, seq)).fetchone()
+        if not row:
+            return None
+        msg = self.read_message(session_id, *row)
+        return msg['content'] if msg else None
+
+    def candidates(self, terms: List[str], role: Optional[str] = None, questions_only: bool = False,
+                   since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Tuple]:
+        """(id, session_id, seq, role, ts, timestamp, offset, length) newest first."""
+        where, params = [], []
+        if terms:
+            dfs = {t: self.conn.execute('SELECT COUNT(*) FROM postings WHERE term = ?', (t,)).fetchone()[0]
+                   for t in terms}
+            if min(dfs.values()) == 0:
+                return
+            ordered = sorted(dfs, key=dfs.get)
+            subquery = ' INTERSECT '.join('SELECT msg_id FROM postings WHERE term = ?' for _ in ordered)
+            where.append(f'id IN ({subquery})')
+            params.extend(ordered)
+        if role:
+            where.append('role = ?')
+            params.append(role)
+        if questions_only:
+            where.append('question = 1')
+        if since is not None:
+            where.append('ts >= ?')
+            params.append(since)
+        if until is not None:
+            where.append('ts < ?')
+            params.append(until)
+        sql = 'SELECT id, session_id, seq, role, ts, timestamp, offset, length FROM messages'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        yield from self.conn.execute(sql + ' ORDER BY ts DESC, id DESC', params)
+
+    def search(self, query: str, limit: int = 10, role: Optional[str] = None, questions_only: bool = False,
+               since: Optional[float] = None, until: Optional[float] = None, context: bool = False) -> List[Dict]:
+        """Messages containing every term; "quoted" parts must appear as exact phrases."""
+        phrases = [p.lower() for p in PHRASE_RE.findall(query)]
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms and query.strip():
+            phrases = [query.strip().lower()]     # Punctuation-only query: plain substring scan
+        keys = dict(self.conn.execute('SELECT session_id, session_key FROM sessions'))
+
+        results = []
+        for _, session_id, seq, msg_role, ts, timestamp, offset, length in self.candidates(
+                terms, role, questions_only, since, until):
+            msg = self.read_message(session_id, offset, length)
+            if msg is None:
+                continue
+            text = msg['content']
+            if phrases and not all(p in text.lower() for p in phrases):
+                continue
+            hit = {
+                'session': keys.get(session_id, session_id),
+                'session_id': session_id,
+                'role': msg_role,
+                'text': text,
+                'timestamp': timestamp,
+                'ts': ts,
+            }
+            if context:
+                before = self._neighbour(session_id, seq - 1)
+                after = self._neighbour(session_id, seq + 1)
+                if before is not None:
+                    hit['context_before'] = before
+                if after is not None:
+                    hit['context_after'] = after
+            results.append(hit)
+            if len(results) >= limit:
+                break
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        q = lambda sql: self.conn.execute(sql).fetchone()[0]
+        return {
+            'sessions': q('SELECT COUNT(*) FROM files'),
+            'messages': q('SELECT COUNT(*) FROM messages'),
+            'terms': q('SELECT COUNT(DISTINCT term) FROM postings'),
+            'postings': q('SELECT COUNT(*) FROM postings'),
+        }
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    index = SessionIndex()
+    t0 = time.perf_counter()
+    if args[0] == '--update':
+        print(f"📇 {index.update()} ({time.perf_counter() - t0:.2f}s)")
+    elif args[0] == '--rebuild':
+        print(f"📇 {index.rebuild()} ({time.perf_counter() - t0:.2f}s)")
+    elif args[0] == '--stats':
+        s = index.stats()
+        size = os.path.getsize(INDEX_FILE) if INDEX_FILE.exists() else 0
+        print(f"📇 Session index: {s['sessions']} sessions, {s['messages']} messages, "
+              f"{s['terms']} terms, {s['postings']} postings, {size / 1024:.0f} KB")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
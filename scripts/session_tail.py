@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Session Tail
+============
+
+Offset-tracking incremental reader for OpenClaw session transcripts
+(~/.openclaw/agents/main/sessions/*.jsonl), shared by cost_rollup,
+turn-cost and session_index.
+
+Transcripts are append-only. Per file we remember the inode and the byte
+offset already consumed, and parse only lines appended since. A file whose
+inode changed or that shrank (rotated / rewritten) is read again from byte
+0. A trailing line without its newline is left for the next read.
+
+Running usage aggregates per session live in a small state file, so a cost
+report costs O(new lines) rather than O(all history):
+    cost, turns, tokens by type, cost by model, cost distribution,
+    min/max turn cost and the most recent RECENT_TURNS turns
+
+Usage:
+    from session_tail import SessionTail
+    tail = SessionTail()
+    aggs = tail.update()                     # {file name: aggregate} for every session
+    aggs = tail.update([path])               # just these files
+
+    python3 scripts/session_tail.py [--reset]
+"""
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+SESSIONS_DIR = Path.home() / ".openclaw" / "agents" / "main" / "sessions"
+STATE_FILE = Path.home() / '.openclaw/workspace/memory/.session-tail.json'
+
+RECENT_TURNS = 200          # Per-turn detail kept per session (turn-cost real --last N)
+COST_BUCKETS = [            # (label, lower bound) for turn cost distribution
+    ('<$0.10', 0.0),
+    ('$0.10-0.20', 0.10),
+    ('$0.20-0.50', 0.20),
+    ('$0.50-1.00', 0.50),
+    ('>$1.00', 1.00),
+]
+
+
+# === Reading ===
+
+def start_offset(path: Path, cursor: Optional[Dict]) -> Tuple[int, bool]:
+    """(byte offset to resume from, whether the file was replaced/truncated) for a stored cursor."""
+    st = path.stat()
+    if not cursor:
+        return 0, False
+    if cursor.get('inode') != st.st_ino or st.st_size < cursor.get('offset', 0):
+        return 0, True
+    return cursor.get('offset', 0), False
+
+
+def read_lines(path: Path, start: int) -> Iterator[Tuple[int, bytes]]:
+    """(offset, line) for every complete line from byte start; a trailing partial line is left for later."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b'\n'):
+                return
+            yield offset, line
+            offset += len(line)
+
+
+def usage_of(entry: Dict) -> Optional[Dict]:
+    """Billed turn from one transcript event, else None."""
+    msg = entry.get('message')
+    if not isinstance(msg, dict):
+        return None
+    usage = msg.get('usage') or {}
+    cost = (usage.get('cost') or {}).get('total')
+    if not cost or cost <= 0:
+        return None
+    return {
+        'cost': cost,
+        'input': usage.get('input', 0),
+        'output': usage.get('output', 0),
+        'cache_read': usage.get('cacheRead', 0),
+        'cache_write': usage.get('cacheWrite', 0),
+        'model': msg.get('model', 'unknown'),
+        'timestamp': entry.get('timestamp', ''),
+    }
+
+
+def parse_usage(line: bytes) -> Optional[Dict]:
+    try:
+        return usage_of(json.loads(line))
+    except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+        return None
+
+
+def iter_usage(path: Path, start: int = 0) -> Iterator[Dict]:
+    """Every billed turn after byte start."""
+    for _, line in read_lines(path, start):
+        turn = parse_usage(line)
+        if turn:
+            yield turn
+
+
+# === Aggregates ===
+
+def empty_aggregate() -> Dict:
+    return {
+        'total_cost': 0.0,
+        'turns': 0,
+        'tokens': {'input': 0, 'output': 0, 'cache_read': 0, 'cache_write': 0},
+        'by_model': {},
+        'min': None,
+        'max': None,
+        'distribution': {label: 0 for label, _ in COST_BUCKETS},
+        'recent': [],
+    }
+
+
+def add_turn(agg: Dict, turn: Dict) -> None:
+    cost = turn['cost']
+    agg['total_cost'] += cost
+    agg['turns'] += 1
+    for k in agg['tokens']:
+        agg['tokens'][k] += turn[k] or 0
+    agg['by_model'][turn['model']] = agg['by_model'].get(turn['model'], 0.0) + cost
+    agg['min'] = cost if agg['min'] is None else min(agg['min'], cost)
+    agg['max'] = cost if agg['max'] is None else max(agg['max'], cost)
+    label = [label for label, lower in COST_BUCKETS if cost >= lower][-1]
+    agg['distribution'][label] += 1
+    agg['recent'].append({k: turn[k] for k in ('cost', 'input', 'output', 'cache_read', 'cache_write')})
+    del agg['recent'][:-RECENT_TURNS]
+
+
+class SessionTail:
+    """Per-file cursors plus running usage aggregates, persisted in one JSON state file."""
+
+    def __init__(self, state_file: Path = STATE_FILE, sessions_dir: Path = SESSIONS_DIR):
+        self.state_file = Path(state_file)
+        self.sessions_dir = Path(sessions_dir)
+        try:
+            self.state = json.loads(self.state_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            self.state = {'files': {}}
+        self.files: Dict[str, Dict] = self.state.setdefault('files', {})
+
+    def save(self) -> None:
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_suffix(f'.tmp{os.getpid()}')
+        tmp.write_text(json.dumps(self.state, separators=(',', ':')))
+        os.replace(tmp, self.state_file)
+
+    def session_files(self) -> list:
+        if not self.sessions_dir.exists():
+            return []
+        return sorted(self.sessions_dir.glob('*.jsonl'))
+
+    def _advance(self, path: Path) -> Dict:
+        entry = self.files.get(path.name)
+        start, reset = start_offset(path, entry)
+        if entry is None or reset:
+            entry = {'inode': path.stat().st_ino, 'offset': 0, 'agg': empty_aggregate()}
+            self.files[path.name] = entry
+        offset = start
+        for line_offset, line in read_lines(path, start):
+            offset = line_offset + len(line)
+            turn = parse_usage(line)
+            if turn:
+                add_turn(entry['agg'], turn)
+        st = path.stat()
+        entry.update(offset=offset, inode=st.st_ino, mtime=st.st_mtime)
+        return entry['agg']
+
+    def update(self, paths: Optional[Iterable[Path]] = None) -> Dict[str, Dict]:
+        """Consume new lines of the given files (default: every session). {file name: aggregate}."""
+        full = paths is None
+        paths = self.session_files() if full else [Path(p) for p in paths]
+        out = {}
+        for path in paths:
+            if path.exists():
+                out[path.name] = self._advance(path)
+        if full:
+            for name in set(self.files) - set(out):
+                del self.files[name]
+        self.save()
+        return out
+
+    def reset(self) -> None:
+        self.files.clear()
+        self.save()
+
+
+def main():
+    tail = SessionTail()
+    if '--reset' in sys.argv:
+        tail.reset()
+    t0 = time.perf_counter()
+    aggs = tail.update()
+    total = sum(a['total_cost'] for a in aggs.values())
+    turns = sum(a['turns'] for a in aggs.values())
+    print(f"📼 {len(aggs)} sessions, {turns:,} turns, ${total:.2f} "
+          f"({time.perf_counter() - t0:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,9 +14,13 @@ Returns: JSON with decision + reasoning
 
 import json
 import os
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 WORKSPACE = Path(os.environ.get("WORKSPACE", "/home/ubuntu/.openclaw/workspace"))
 SCHEDULING_FILE = WORKSPACE / "memory/scheduling-intelligence.json"
 HEARTBEAT_STATE = WORKSPACE / "memory/heartbeat-state.json"
@@ -30,15 +34,7 @@ def load_json(path):
         return {}
 
 def load_jsonl(path):
-    entries = []
-    try:
-        with open(path) as f:
-            for line in f:
-                if line.strip():
-                    entries.append(json.loads(line))
-    except:
-        pass
-    return entries
+    return EventLog(path).read()
 
 def get_sgt_now():
     """Get current time in SGT (UTC+8)"""
@@ -13,13 +13,14 @@ Usage:
     python3 sparkline.py --watchlist    # All watchlist stocks
 """
 
-import json
-import urllib.request
 import sys
-import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+import price_store
+import indicators
+
 # Sparkline characters (8 levels)
 SPARKS = ' ▁▂▃▄▅▆█'
 
@@ -31,34 +32,11 @@ TREND_UP = '↗'
 TREND_DOWN = '↘'
 TREND_FLAT = '→'
 
-ENV_FILE = Path.home() / '.secure/fmp.env'
-
-def get_api_key() -> str:
-    """Load FMP API key."""
-    key = os.environ.get('FMP_API_KEY')
-    if key:
-        return key
-    if ENV_FILE.exists():
-        with open(ENV_FILE) as f:
-            for line in f:
-                if line.startswith('FMP_API_KEY='):
-                    return line.split('=', 1)[1].strip()
-    raise ValueError("FMP_API_KEY not found")
-
-
 def get_historical(symbol: str, days: int = 30) -> list:
-    """Fetch historical daily prices using stable API."""
-    api_key = get_api_key()
-    # Use stable API endpoint
-    url = f"https://financialmodelingprep.com/stable/historical-price-eod/light?symbol={symbol}&apikey={api_key}"
-    
+    """Daily closes from the local price store (topped up from FMP as needed)."""
     try:
-        with urllib.request.urlopen(url, timeout=15) as resp:
-            data = json.loads(resp.read().decode())
-            if isinstance(data, list) and data:
-                # Data comes newest first, take N days and reverse to chronological
-                recent = data[:days]
-                return [{'close': d['price'], 'date': d['date']} for d in reversed(recent)]
+        bars = price_store.history(symbol, days)
+        return [{'close': float(c), 'date': price_store.to_iso(d)} for d, c in zip(bars['date'], bars['close'])]
     except Exception as e:
         pass
     return []
@@ -93,9 +71,7 @@ def get_trend(prices: list) -> tuple:
     if len(prices) < 2:
         return TREND_FLAT, 0.0
     
-    start = prices[0]
-    end = prices[-1]
-    pct = ((end - start) / start) * 100
+    pct = float(indicators.change_pct(prices))
     
     if pct > 1:
         return TREND_UP, pct
@@ -139,6 +115,7 @@ def watchlist_sparklines(days: int = 30) -> str:
     """Generate sparklines for watchlist."""
     watchlist = ['NVDA', 'AMD', 'SMCI', 'TSM', 'AVGO']
     lines = [f"📈 **{days}-Day Trends**\n"]
+    price_store.get_store().update_many(watchlist)
     
     for symbol in watchlist:
         lines.append(format_sparkline(symbol, days))
@@ -150,6 +127,7 @@ def compare_view(symbols: list, days: int = 30) -> str:
     """Side-by-side comparison."""
     lines = [f"📊 **{days}-Day Comparison**\n"]
     lines.append("```")
+    price_store.get_store().update_many(symbols)
     
     for symbol in symbols:
         lines.append(format_sparkline(symbol, days))
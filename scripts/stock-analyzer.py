@@ -11,6 +11,9 @@ Usage:
     python3 stock-analyzer.py NVDA --quick   # Quick summary only
     python3 stock-analyzer.py NVDA --json    # Output as JSON
     python3 stock-analyzer.py NVDA --save    # Save to file
+    python3 stock-analyzer.py NVDA --timing  # Print per-endpoint fetch timings
+    python3 stock-analyzer.py --peer-group NVDA,AMD,AVGO,MRVL  # Peer tables for a group in one pass
+    python3 stock-analyzer.py --symbols watchlist.txt [--workers 4] [--quick]  # Batch, JSON lines
 
 Framework:
     1. Company Profile
@@ -29,12 +32,17 @@ Framework:
 import os
 import sys
 import json
-import urllib.request
-import urllib.error
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+import response_cache
+import batch_runner
+
 # =============================================================================
 # API Configuration
 # =============================================================================
@@ -42,6 +50,8 @@ from typing import Optional, Dict, List, Any
 BASE_URL = "https://financialmodelingprep.com/stable"
 V3_URL = "https://financialmodelingprep.com/api/v3"
 API_KEY = None
+FETCH_WORKERS = 11  # One thread per endpoint; market_http caps in-flight FMP calls
+PEER_LIMIT = 5  # Peers compared per symbol
 
 def get_api_key() -> str:
     key = os.environ.get('FMP_API_KEY')
@@ -66,13 +76,10 @@ def _request(endpoint: str, params: dict = None, base: str = None) -> Any:
     base = base or BASE_URL
     params = params or {}
     params['apikey'] = API_KEY
-    query = '&'.join(f"{k}={v}" for k, v in params.items())
-    url = f"{base}/{endpoint}?{query}"
     try:
-        with urllib.request.urlopen(url, timeout=15) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        return {"error": f"HTTP {e.code}"}
+        return response_cache.get_json(f"{base}/{endpoint}", params, provider='fmp')
+    except market_http.HttpError as e:
+        return {"error": f"HTTP {e.status}"}
     except Exception as e:
         return {"error": str(e)}
 
@@ -348,7 +355,20 @@ def analyze_ownership(institutional: Any, insiders: Any) -> Dict:
         "recent_insiders": recent_insiders[:5],
     }
 
-def analyze_peers(symbol: str, peers: Any, metrics: Any) -> Dict:
+def fetch_peer_metrics(symbols: List[str]) -> Dict[str, Dict]:
+    """Latest key metrics for each symbol, fetched concurrently, each symbol once.
+    
+    Uses the same key-metrics request as a full analysis, so the shared
+    response cache serves a symbol whether it was last seen as a target or a peer.
+    """
+    unique = list(dict.fromkeys(s.upper() for s in symbols if s))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(unique))) as pool:
+        results = list(pool.map(fetch_metrics, unique))
+    return {sym: (m[0] if isinstance(m, list) and m else {}) for sym, m in zip(unique, results)}
+
+def analyze_peers(symbol: str, peers: Any, metrics: Any, peer_metrics: Dict[str, Dict] = None) -> Dict:
     """Section 8: Peer Comparison."""
     peers_list = peers if isinstance(peers, list) else []
     if not peers_list:
@@ -358,10 +378,11 @@ def analyze_peers(symbol: str, peers: Any, metrics: Any) -> Dict:
     metrics_list = metrics if isinstance(metrics, list) else []
     my_metrics = metrics_list[0] if metrics_list else {}
     
-    # Get peer metrics
-    for peer in peers_list[:5]:
-        peer_metrics = fetch_metrics(peer, limit=1)
-        pm = peer_metrics[0] if peer_metrics and isinstance(peer_metrics, list) else {}
+    # Get peer metrics (pre-fetched for a whole peer group, or fetched here concurrently)
+    if peer_metrics is None:
+        peer_metrics = fetch_peer_metrics(peers_list[:PEER_LIMIT])
+    for peer in peers_list[:PEER_LIMIT]:
+        pm = peer_metrics.get(peer.upper(), {})
         if pm:
             comparison.append({
                 "symbol": peer,
@@ -379,6 +400,32 @@ def analyze_peers(symbol: str, peers: Any, metrics: Any) -> Dict:
         "my_roe": my_metrics.get('returnOnEquity'),
     }
 
+def analyze_peer_group(symbols: List[str], verbose: bool = True) -> Dict:
+    """Peer comparison for a whole group (e.g. a sector) in one pass.
+    
+    Peer lists are fetched concurrently, then key metrics for the union of
+    targets and peers — overlapping peers are fetched once.
+    """
+    symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(symbols) or 1)) as pool:
+        peer_lists = dict(zip(symbols, pool.map(fetch_peers, symbols)))
+    
+    universe = symbols + [p for sym in symbols for p in peer_lists[sym][:PEER_LIMIT]]
+    metrics = fetch_peer_metrics(universe)
+    elapsed = time.perf_counter() - t0
+    
+    group = {}
+    for sym in symbols:
+        own = [metrics[sym]] if metrics.get(sym) else []
+        group[sym] = analyze_peers(sym, peer_lists[sym], own, peer_metrics=metrics)
+    
+    naive = len(symbols) * (1 + PEER_LIMIT)
+    if verbose:
+        print(f"  ⏱️ Peer group: {len(symbols)} symbols, {len(metrics)} unique metric fetches "
+              f"(vs ~{naive} one-by-one) in {elapsed:.2f}s")
+    return {"group": group, "unique_symbols": len(metrics), "elapsed": round(elapsed, 3)}
+
 def analyze_news(news: Any) -> Dict:
     """Section 9: Recent News."""
     headlines = []
@@ -665,6 +712,60 @@ def generate_quick_summary(symbol: str, data: Dict) -> str:
 # Main Entry Point
 # =============================================================================
 
+FETCHERS = {
+    'profile': fetch_profile,
+    'quote': fetch_quote,
+    'metrics': fetch_metrics,
+    'ratios': fetch_ratios,
+    'growth': fetch_growth,
+    'income': fetch_income,
+    'balance': fetch_balance,
+    'institutional': fetch_institutional,
+    'insiders': fetch_insiders,
+    'peers': fetch_peers,
+    'news': fetch_news,
+}
+
+def fetch_all(symbol: str, verbose: bool = True) -> tuple:
+    """Fetch every FMP endpoint for a symbol concurrently.
+    
+    In-flight requests are capped per provider by market_http, so the pool
+    size here only bounds threads. Returns (results by name, timing dict).
+    """
+    calls = {}
+    
+    def timed(name, fn):
+        t0 = time.perf_counter()
+        try:
+            return fn(symbol)
+        finally:
+            calls[name] = round(time.perf_counter() - t0, 3)
+    
+    if verbose:
+        print(f"  Fetching {len(FETCHERS)} endpoints (up to {FETCH_WORKERS} in parallel)...")
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {name: pool.submit(timed, name, fn) for name, fn in FETCHERS.items()}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = {"error": str(e)}
+    wall = time.perf_counter() - start
+    
+    serial = sum(calls.values())
+    timing = {
+        'fetch_wall': round(wall, 3),
+        'fetch_serial': round(serial, 3),
+        'speedup': round(serial / wall, 1) if wall else None,
+        'calls': calls,
+    }
+    if verbose:
+        print(f"  ⏱️ Fetched in {wall:.2f}s (serial would be ~{serial:.2f}s, {timing['speedup']}x)")
+    return results, timing
+
 def analyze(symbol: str, quick: bool = False, verbose: bool = True) -> Dict:
     """Run full analysis on a symbol."""
     symbol = symbol.upper()
@@ -672,30 +773,16 @@ def analyze(symbol: str, quick: bool = False, verbose: bool = True) -> Dict:
     if verbose:
         print(f"Analyzing {symbol}...")
     
-    # Fetch all data
-    profile = fetch_profile(symbol)
+    # Fetch all data (independent calls run in parallel)
+    fetched, timing = fetch_all(symbol, verbose=verbose)
+    profile = fetched['profile']
     if not profile or 'error' in str(profile):
         return {"error": f"Could not fetch profile for {symbol}"}
     
-    quote = fetch_quote(symbol)
-    metrics = fetch_metrics(symbol)
-    ratios = fetch_ratios(symbol)
-    growth = fetch_growth(symbol)
-    income = fetch_income(symbol)
-    balance = fetch_balance(symbol)
-    
-    if verbose:
-        print("  Fetching ownership data...")
-    institutional = fetch_institutional(symbol)
-    insiders = fetch_insiders(symbol)
-    
-    if verbose:
-        print("  Fetching peers...")
-    peers = fetch_peers(symbol)
-    
-    if verbose:
-        print("  Fetching news...")
-    news = fetch_news(symbol)
+    quote, metrics, ratios = fetched['quote'], fetched['metrics'], fetched['ratios']
+    growth, income, balance = fetched['growth'], fetched['income'], fetched['balance']
+    institutional, insiders = fetched['institutional'], fetched['insiders']
+    peers, news = fetched['peers'], fetched['news']
     
     # Run analysis
     data = {
@@ -714,10 +801,13 @@ def analyze(symbol: str, quick: bool = False, verbose: bool = True) -> Dict:
     if not quick:
         if verbose:
             print("  Comparing to peers...")
+        t0 = time.perf_counter()
         data["peers"] = analyze_peers(symbol, peers, metrics)
+        timing['calls']['peer_metrics'] = round(time.perf_counter() - t0, 3)
     
     # Risk assessment (needs all data)
     data["risks"] = analyze_risks(data)
+    data["timing"] = timing
     
     return data
 
@@ -732,6 +822,28 @@ def main():
         print(f"Error: {e}")
         return
     
+    if sys.argv[1] == '--peer-group':
+        symbols = [s for a in sys.argv[2:] for s in a.split(',') if s and not s.startswith('--')]
+        result = analyze_peer_group(symbols)
+        if '--json' in sys.argv:
+            print(json.dumps(result, indent=2, default=str))
+            return
+        for sym, peers in result['group'].items():
+            print(f"\n## {sym}")
+            print("| Peer | P/E | EV/EBITDA | ROE |")
+            print("|------|-----|-----------|-----|")
+            print(f"| **{sym}** | {fmt_num(peers.get('my_pe'))} | {fmt_num(peers.get('my_ev_ebitda'))} | {fmt_pct(peers.get('my_roe'))} |")
+            for p in peers.get('comparison', []):
+                print(f"| {p['symbol']} | {fmt_num(p['pe'])} | {fmt_num(p['ev_ebitda'])} | {fmt_pct(p['roe'])} |")
+        return
+    
+    if sys.argv[1] == '--symbols':
+        symbols = batch_runner.parse_symbols(batch_runner.option(sys.argv, '--symbols', ''))
+        workers = int(batch_runner.option(sys.argv, '--workers', batch_runner.BATCH_WORKERS))
+        quick = '--quick' in sys.argv
+        batch_runner.run_batch(symbols, lambda s: analyze(s, quick=quick, verbose=False), workers)
+        return
+    
     symbol = sys.argv[1].upper()
     quick = '--quick' in sys.argv
     as_json = '--json' in sys.argv
@@ -743,6 +855,14 @@ def main():
         print(f"Error: {data['error']}")
         return
     
+    if '--timing' in sys.argv:
+        timing = data['timing']
+        print(f"⏱️ Fetch: {timing['fetch_wall']}s wall vs {timing['fetch_serial']}s serial "
+              f"({timing['speedup']}x)")
+        for name, secs in sorted(timing['calls'].items(), key=lambda kv: -kv[1]):
+            print(f"   {name:<14} {secs:.3f}s")
+        print()
+    
     if as_json:
         print(json.dumps(data, indent=2, default=str))
     elif quick:
@@ -24,7 +24,9 @@ import sys
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import os
-import urllib.request
+
+sys.path.insert(0, str(Path(__file__).parent))
+import response_cache
 
 THESIS_FILE = Path.home() / '.openclaw/workspace/memory/investment-theses.json'
 OUTCOMES_FILE = Path.home() / '.openclaw/workspace/memory/thesis-outcomes.jsonl'
@@ -55,10 +57,9 @@ def get_quote(symbol: str) -> dict:
     if not key:
         return {}
     try:
-        url = f"https://financialmodelingprep.com/stable/quote?symbol={symbol}&apikey={key}"
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read())
-            return data[0] if data else {}
+        data = response_cache.get_json("https://financialmodelingprep.com/stable/quote",
+                                       {'symbol': symbol, 'apikey': key}, provider='fmp')
+        return data[0] if data else {}
     except Exception as e:
         return {"error": str(e)}
 
@@ -212,6 +213,44 @@ def show_thesis(symbol: str):
     print(f"\nCreated: {created} | Updated: {updated}")
     print(f"{'='*60}\n")
 
+def thesis_triggers(thesis: dict, current_price) -> tuple:
+    """Review triggers for one active thesis at current_price.
+    
+    Returns (return_pct, triggers); return_pct is None without usable prices.
+    """
+    entry = thesis.get('entry_price')
+    if not isinstance(current_price, (int, float)) or not isinstance(entry, (int, float)):
+        return None, []
+    
+    # Calculate return
+    ret = ((current_price - entry) / entry) * 100
+    if thesis.get('direction') == 'short':
+        ret = -ret
+    
+    # Trigger conditions
+    triggers = []
+    
+    # Big move (>15% either direction)
+    if abs(ret) > 15:
+        triggers.append(f"{'🟢' if ret > 0 else '🔴'} {'+' if ret >= 0 else ''}{ret:.1f}% since entry")
+    
+    # Conviction vs performance mismatch
+    if thesis.get('conviction', 5) >= 7 and ret < -10:
+        triggers.append(f"⚠️  High conviction ({thesis['conviction']}/10) but down {ret:.1f}%")
+    
+    # Stale thesis (>30 days)
+    updated = thesis.get('updated', thesis.get('created', ''))
+    if updated:
+        try:
+            update_date = datetime.fromisoformat(updated.replace('Z', '+00:00'))
+            age = (datetime.now(timezone.utc) - update_date).days
+            if age > 30:
+                triggers.append(f"📅 {age} days since last update")
+        except:
+            pass
+    
+    return ret, triggers
+
 def check_theses():
     """Check all theses for review triggers."""
     data = load_theses()
@@ -230,38 +269,7 @@ def check_theses():
             continue
             
         quote = get_quote(symbol)
-        current_price = quote.get('price')
-        entry = thesis.get('entry_price')
-        
-        if not isinstance(current_price, (int, float)) or not isinstance(entry, (int, float)):
-            continue
-        
-        # Calculate return
-        ret = ((current_price - entry) / entry) * 100
-        if thesis.get('direction') == 'short':
-            ret = -ret
-        
-        # Trigger conditions
-        triggers = []
-        
-        # Big move (>15% either direction)
-        if abs(ret) > 15:
-            triggers.append(f"{'🟢' if ret > 0 else '🔴'} {'+' if ret >= 0 else ''}{ret:.1f}% since entry")
-        
-        # Conviction vs performance mismatch
-        if thesis.get('conviction', 5) >= 7 and ret < -10:
-            triggers.append(f"⚠️  High conviction ({thesis['conviction']}/10) but down {ret:.1f}%")
-        
-        # Stale thesis (>30 days)
-        updated = thesis.get('updated', thesis.get('created', ''))
-        if updated:
-            try:
-                update_date = datetime.fromisoformat(updated.replace('Z', '+00:00'))
-                age = (datetime.now(timezone.utc) - update_date).days
-                if age > 30:
-                    triggers.append(f"📅 {age} days since last update")
-            except:
-                pass
+        ret, triggers = thesis_triggers(thesis, quote.get('price'))
         
         if triggers:
             alerts.append((symbol, thesis, ret, triggers))
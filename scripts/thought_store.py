@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Thought Store
+=============
+
+Indexed store over the thought log (memory/thoughts/YYYY-MM.jsonl, written
+by log-thought.py), used by query-thoughts.py.
+
+The monthly JSONL files stay the source of truth. An SQLite side index
+holds, per entry, the file + byte offset of its line plus:
+- ts, type and status columns (ts indexed)
+- entity and tag tables (lowercased)
+- a token table over the entry's JSON text (keys and numbers included),
+  for text search
+
+sync() reads only lines appended since the last sync (session_tail cursors).
+query() is a small streaming planner: it estimates every predicate's
+cardinality from its index, drives from the most selective one in ts order,
+probes the remaining predicates per candidate, and only then seeks to and
+parses the matching lines. Query time tracks the size of the answer, not
+of the log.
+
+search= keeps query-thoughts' substring semantics: an entry matches when
+its JSON text contains the search string. Tokens inside the search string
+must be indexed token prefixes; a leading partial word ('ector') is found
+by scanning the token table instead (no log lines are read for it).
+
+Usage:
+    from thought_store import ThoughtStore
+    store = ThoughtStore()
+    store.sync()
+    for e in store.query(entity='jon', tag='investing', search='vector', recent=5):
+        ...
+
+    python3 scripts/thought_store.py --sync | --rebuild | --stats
+"""
+
+import re
+import sys
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from session_tail import read_lines, start_offset
+
+THOUGHTS_DIR = Path.home() / ".openclaw/workspace/memory/thoughts"
+INDEX_FILE = THOUGHTS_DIR / '.index.db'
+
+TOKEN_RE = re.compile(r'\w+')
+SCHEMA_VERSION = 1          # PRAGMA user_version; an older index is rebuilt
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def entry_text(entry: Dict) -> str:
+    """What search= matches against (as query-thoughts always has)."""
+    return json.dumps(entry).lower()
+
+
+class Predicate:
+    """One filter: a cardinality estimate, an ordered id stream and a per-id probe."""
+
+    def __init__(self, count_sql: str, ids_sql: str, probe_sql: str, params: Tuple):
+        self.count_sql, self.ids_sql, self.probe_sql, self.params = count_sql, ids_sql, probe_sql, params
+
+    def estimate(self, conn: sqlite3.Connection) -> int:
+        return conn.execute(self.count_sql, self.params).fetchone()[0]
+
+    def ids(self, conn: sqlite3.Connection, descending: bool) -> Iterator[int]:
+        order = 'DESC' if descending else 'ASC'
+        for (entry_id,) in conn.execute(f'{self.ids_sql} ORDER BY e.ts {order}, e.id {order}', self.params):
+            yield entry_id
+
+    def matches(self, conn: sqlite3.Connection, entry_id: int) -> bool:
+        return conn.execute(self.probe_sql, self.params + (entry_id,)).fetchone() is not None
+
+
+def _column(where: str, params: Tuple) -> Predicate:
+    return Predicate(f'SELECT COUNT(*) FROM entries e WHERE {where}',
+                     f'SELECT e.id FROM entries e WHERE {where}',
+                     f'SELECT 1 FROM entries e WHERE {where} AND e.id = ?', params)
+
+
+def _member(table: str, value: str) -> Predicate:
+    return Predicate(f'SELECT COUNT(*) FROM {table} WHERE value = ?',
+                     f'SELECT e.id FROM {table} m JOIN entries e ON e.id = m.id WHERE m.value = ?',
+                     f'SELECT 1 FROM {table} WHERE value = ? AND id = ?', (value,))
+
+
+def _partial(part: str) -> Predicate:
+    """Entries with a token containing part: a search may start mid-word."""
+    where = 'instr(term, ?) > 0'
+    return Predicate(f'SELECT COUNT(DISTINCT id) FROM tokens WHERE {where}',
+                     f'SELECT DISTINCT e.id FROM tokens t JOIN entries e ON e.id = t.id WHERE {where}',
+                     f'SELECT 1 FROM tokens WHERE {where} AND id = ?', (part,))
+
+
+def search_predicates(search: str) -> List[Predicate]:
+    """Index predicates every entry containing search must satisfy.
+
+    A word the search string starts in the middle of may be the tail of a longer
+    token; every later word starts where a token does, so is a token prefix.
+    """
+    terms = tokenize(search)
+    if not terms:
+        return []
+    preds = []
+    if TOKEN_RE.match(search.lower()):
+        preds.append(_partial(terms[0]))
+        terms = terms[1:]
+    preds.extend(_token(t) for t in dict.fromkeys(terms))
+    return preds
+
+
+def _token(prefix: str) -> Predicate:
+    """Entries with a token starting with prefix (so 'vec' finds 'vector', like a substring search)."""
+    where = 'term >= ? AND term < ?'
+    params = (prefix, prefix + '\uffff')
+    return Predicate(f'SELECT COUNT(DISTINCT id) FROM tokens WHERE {where}',
+                     f'SELECT DISTINCT e.id FROM tokens t JOIN entries e ON e.id = t.id WHERE t.{where}',
+                     f'SELECT 1 FROM tokens WHERE {where} AND id = ?', params)
+
+
+class ThoughtStore:
+    """Secondary indexes over the monthly thought-log files."""
+
+    def __init__(self, thoughts_dir: Path = THOUGHTS_DIR, db_path: Optional[Path] = None):
+        self.thoughts_dir = Path(thoughts_dir)
+        db_path = Path(db_path) if db_path else self.thoughts_dir / INDEX_FILE.name
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=10)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS files (
+                file TEXT PRIMARY KEY, inode INTEGER NOT NULL, offset INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                file TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                ts TEXT NOT NULL,
+                type TEXT,
+                status TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_ts ON entries(ts, id);
+            CREATE INDEX IF NOT EXISTS idx_entries_type ON entries(type, ts);
+            CREATE TABLE IF NOT EXISTS entities (
+                value TEXT NOT NULL, id INTEGER NOT NULL, PRIMARY KEY (value, id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS tags (
+                value TEXT NOT NULL, id INTEGER NOT NULL, PRIMARY KEY (value, id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS tokens (
+                term TEXT NOT NULL, id INTEGER NOT NULL, PRIMARY KEY (term, id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_tokens_id ON tokens(id, term);
+            DROP INDEX IF EXISTS idx_entries_file;
+        ''')
+        try:
+            self.conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_entries_line ON entries(file, offset)')
+        except sqlite3.IntegrityError:
+            # Index written by overlapping syncs before lines were unique: start over
+            self._clear()
+            self.conn.execute('CREATE UNIQUE INDEX idx_entries_line ON entries(file, offset)')
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+            # Tokens used to cover string values only: index again
+            self._clear()
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # === Maintenance ===
+
+    def _drop_file(self, name: str) -> None:
+        for table in ('entities', 'tags', 'tokens'):
+            self.conn.execute(f'DELETE FROM {table} WHERE id IN (SELECT id FROM entries WHERE file = ?)', (name,))
+        self.conn.execute('DELETE FROM entries WHERE file = ?', (name,))
+        self.conn.execute('DELETE FROM files WHERE file = ?', (name,))
+
+    def _add(self, name: str, offset: int, length: int, entry: Dict) -> None:
+        cur = self.conn.execute(
+            'INSERT INTO entries (file, offset, length, ts, type, status) VALUES (?, ?, ?, ?, ?, ?)',
+            (name, offset, length, str(entry.get('ts', '')), entry.get('type'), entry.get('status')))
+        entry_id = cur.lastrowid
+        for table, key in (('entities', 'entities'), ('tags', 'tags')):
+            values = {str(v).lower() for v in entry.get(key) or [] if v}
+            self.conn.executemany(f'INSERT OR IGNORE INTO {table} (value, id) VALUES (?, ?)',
+                                  ((v, entry_id) for v in values))
+        self.conn.executemany('INSERT OR IGNORE INTO tokens (term, id) VALUES (?, ?)',
+                              ((t, entry_id) for t in set(tokenize(entry_text(entry)))))
+
+    def sync(self) -> Dict[str, int]:
+        """Index lines appended to the monthly files since the last sync."""
+        stats = {'files': 0, 'entries': 0, 'reset': 0}
+        cursors = {r[0]: {'inode': r[1], 'offset': r[2]}
+                   for r in self.conn.execute('SELECT file, inode, offset FROM files')}
+        present = set()
+        paths = sorted(self.thoughts_dir.glob('*.jsonl')) if self.thoughts_dir.exists() else []
+        for path in paths:
+            present.add(path.name)
+            offset, reset = start_offset(path, cursors.get(path.name))
+            if path.name in cursors and not reset and path.stat().st_size == offset:
+                continue
+            with self.conn:
+                # Re-read the cursor under the write lock: an overlapping sync()
+                # may already have indexed these lines
+                self.conn.execute('BEGIN IMMEDIATE')
+                row = self.conn.execute('SELECT inode, offset FROM files WHERE file = ?', (path.name,)).fetchone()
+                cursor = {'inode': row[0], 'offset': row[1]} if row else None
+                st = path.stat()
+                offset, reset = start_offset(path, cursor)
+                if cursor and not reset and st.st_size == offset:
+                    continue
+                if reset:
+                    self._drop_file(path.name)
+                    stats['reset'] += 1
+                for line_offset, line in read_lines(path, offset):
+                    offset = line_offset + len(line)
+                    try:
+                        entry = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if isinstance(entry, dict):
+                        self._add(path.name, line_offset, len(line), entry)
+                        stats['entries'] += 1
+                self.conn.execute('INSERT OR REPLACE INTO files (file, inode, offset) VALUES (?, ?, ?)',
+                                  (path.name, st.st_ino, offset))
+            stats['files'] += 1
+        with self.conn:
+            for name in set(cursors) - present:
+                self._drop_file(name)
+        return stats
+
+    def _clear(self) -> None:
+        with self.conn:
+            for table in ('entities', 'tags', 'tokens', 'entries', 'files'):
+                self.conn.execute(f'DELETE FROM {table}')
+
+    def rebuild(self) -> Dict[str, int]:
+        self._clear()
+        return self.sync()
+
+    # === Queries ===
+
+    def _load(self, entry_id: int) -> Optional[Dict]:
+        row = self.conn.execute('SELECT file, offset, length FROM entries WHERE id = ?', (entry_id,)).fetchone()
+        if not row:
+            return None
+        try:
+            with open(self.thoughts_dir / row[0], 'rb') as f:
+                f.seek(row[1])
+                return json.loads(f.read(row[2]))
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+    def plan(self, date: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+             entity: Optional[str] = None, type: Optional[str] = None, tag: Optional[str] = None,
+             search: Optional[str] = None, questions: bool = False) -> List[Tuple[int, Predicate]]:
+        """Predicates with their estimated cardinality, most selective first."""
+        preds = []
+        if date:
+            preds.append(_column('e.ts >= ? AND e.ts < ?', (date, date + '\uffff')))
+        if since:
+            preds.append(_column('e.ts >= ?', (since,)))
+        if until:
+            preds.append(_column('e.ts < ?', (until,)))
+        if type:
+            preds.append(_column('e.type = ?', (type,)))
+        if questions:
+            preds.append(_column("e.type = 'question' AND e.status = 'open'", ()))
+        if entity:
+            preds.append(_member('entities', entity.lower()))
+        if tag:
+            preds.append(_member('tags', tag.lower()))
+        if search:
+            preds.extend(search_predicates(search))
+        ranked = [(p.estimate(self.conn), p) for p in preds]
+        ranked.sort(key=lambda r: r[0])
+        return ranked
+
+    def query(self, recent: Optional[int] = None, **criteria) -> Iterator[Dict]:
+        """Matching entries in ts order (the last `recent` of them when given)."""
+        ranked = self.plan(**criteria)
+        if ranked and ranked[0][0] == 0:
+            return
+        descending = bool(recent)
+        if ranked:
+            driver, probes = ranked[0][1], [p for _, p in ranked[1:]]
+            ids = driver.ids(self.conn, descending)
+        else:
+            probes = []
+            order = 'DESC' if descending else 'ASC'
+            ids = (r[0] for r in self.conn.execute(f'SELECT id FROM entries e ORDER BY e.ts {order}, e.id {order}'))
+
+        search = (criteria.get('search') or '').lower()
+        matched = []
+        for entry_id in ids:
+            if not all(p.matches(self.conn, entry_id) for p in probes):
+                continue
+            entry = self._load(entry_id)
+            if entry is None or (search and search not in entry_text(entry)):
+                continue
+            if not descending:
+                yield entry
+                continue
+            matched.append(entry)
+            if len(matched) >= recent:
+                break
+        yield from reversed(matched)
+
+    def stats(self) -> Dict[str, int]:
+        q = lambda sql: self.conn.execute(sql).fetchone()[0]
+        return {
+            'files': q('SELECT COUNT(*) FROM files'),
+            'entries': q('SELECT COUNT(*) FROM entries'),
+            'entities': q('SELECT COUNT(DISTINCT value) FROM entities'),
+            'tags': q('SELECT COUNT(DISTINCT value) FROM tags'),
+            'terms': q('SELECT COUNT(DISTINCT term) FROM tokens'),
+        }
+
+
+def main():
+    args = sys.argv[1:]
+    store = ThoughtStore()
+    if args and args[0] == '--sync':
+        print(f"💭 {store.sync()}")
+    elif args and args[0] == '--rebuild':
+        print(f"💭 {store.rebuild()}")
+    elif args and args[0] == '--stats':
+        store.sync()
+        print(f"💭 {store.stats()}")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,12 +13,14 @@ Usage:
     python3 scripts/track-feedback.py --recent 10
 """
 
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog
+
 FEEDBACK_FILE = Path.home() / ".openclaw/workspace/memory/feedback-log.jsonl"
 
 def log_feedback(signal_type, context, source="manual"):
@@ -30,28 +32,14 @@ def log_feedback(signal_type, context, source="manual"):
         "source": source  # manual, reaction, reply, silence
     }
     
-    FEEDBACK_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(FEEDBACK_FILE, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    EventLog(FEEDBACK_FILE).append(entry)
     
     emoji = {"positive": "👍", "negative": "👎", "engagement": "💬", "neutral": "😐"}.get(signal_type, "📝")
     print(f"{emoji} Logged {signal_type}: {context[:50]}...")
 
 def load_feedback():
     """Load all feedback entries."""
-    if not FEEDBACK_FILE.exists():
-        return []
-    
-    entries = []
-    with open(FEEDBACK_FILE) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return entries
+    return EventLog(FEEDBACK_FILE).read()
 
 def show_stats():
     """Show feedback statistics."""
@@ -87,14 +75,14 @@ def show_stats():
 
 def show_recent(n=10):
     """Show recent feedback."""
-    entries = load_feedback()
+    entries = EventLog(FEEDBACK_FILE).tail(n)
     
     if not entries:
         print("No feedback recorded yet.")
         return
     
     print(f"📋 Last {n} feedback signals:\n")
-    for entry in entries[-n:]:
+    for entry in entries:
         ts = entry.get("timestamp", "")[:16]
         sig_type = entry.get("type", "?")
         context = entry.get("context", "")[:60]
@@ -14,56 +14,55 @@ Usage:
     python3 trade-journal.py patterns               # Behavioral insights
 """
 
-import json
 import sys
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import EventLog, days_ago
+
 JOURNAL_FILE = Path.home() / '.openclaw/workspace/memory/trade-journal.jsonl'
 PATTERNS_FILE = Path.home() / '.openclaw/workspace/memory/trading-patterns.json'
 
 
-def load_trades():
-    """Load all trades from journal."""
-    trades = []
-    if JOURNAL_FILE.exists():
-        with open(JOURNAL_FILE) as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        trades.append(json.loads(line))
-                    except:
-                        pass
-    return trades
+def journal():
+    return EventLog(JOURNAL_FILE, ts_field='opened')
+
+
+def load_trades(since=None):
+    """Load trades from journal (opened at/after since, if given)."""
+    return journal().read(since=since)
 
 
 def save_trade(trade):
     """Append trade to journal."""
-    JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(JOURNAL_FILE, 'a') as f:
-        f.write(json.dumps(trade) + '\n')
+    journal().append(trade)
 
 
 def update_trade(ticker, updates):
     """Update an existing open trade."""
-    trades = load_trades()
-    updated = False
+    def is_open(t):
+        return t.get('ticker', '').upper() == ticker.upper() and t.get('status') == 'open'
     
     # Find the most recent open trade for this ticker
-    for i in range(len(trades) - 1, -1, -1):
-        if trades[i].get('ticker', '').upper() == ticker.upper() and trades[i].get('status') == 'open':
-            trades[i].update(updates)
-            updated = True
-            break
-    
-    if updated:
-        # Rewrite file
-        with open(JOURNAL_FILE, 'w') as f:
-            for t in trades:
-                f.write(json.dumps(t) + '\n')
-    
-    return updated
+    log = journal()
+    matches = sum(1 for t in log.scan() if is_open(t))
+    if not matches:
+        return False
+    
+    seen = 0
+    
+    def apply(t):
+        nonlocal seen
+        if is_open(t):
+            seen += 1
+            if seen == matches:
+                return dict(t, **updates)
+        return t
+    
+    # Only the segment holding the trade is rewritten
+    return log.rewrite(apply) > 0
 
 
 def add_trade(ticker, trade_type='stock', direction='long', notes=''):
@@ -144,10 +143,7 @@ def list_open():
 
 def show_history(days=30):
     """Show recent trade history."""
-    trades = load_trades()
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-    
-    recent = [t for t in trades if t.get('opened', '') > cutoff]
+    recent = load_trades(since=days_ago(days))
     
     if not recent:
         print(f"📭 No trades in last {days} days")
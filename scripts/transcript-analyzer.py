@@ -23,15 +23,17 @@ Based on research:
 - Q&A section focus per Georgia Tech methodology
 """
 
-import os
 import sys
 import json
 import re
-import urllib.request
 from pathlib import Path
 from collections import Counter
 from typing import Dict, List, Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+import transcript_corpus
+from phrase_scanner import PhraseScanner
+
 # Loughran-McDonald finance-specific word lists (subset - key indicators)
 NEGATIVE_WORDS = {
     'loss', 'losses', 'decline', 'declined', 'declining', 'decrease', 'decreased',
@@ -69,42 +71,24 @@ CERTAINTY_WORDS = {
     'committed', 'commitment', 'confident', 'sure', 'assured', 'certain'
 }
 
+WORD_RE = re.compile(r'\b[a-z]+\b')
 
-def get_api_key() -> str:
-    """Load FMP API key"""
-    key = os.environ.get('FMP_API_KEY')
-    if key:
-        return key
-    env_paths = [
-        Path.home() / '.secure/fmp.env',
-        Path('.secure/fmp.env'),
-    ]
-    for path in env_paths:
-        if path.exists():
-            with open(path) as f:
-                for line in f:
-                    if line.startswith('FMP_API_KEY='):
-                        return line.split('=', 1)[1].strip()
-    raise ValueError("FMP_API_KEY not found")
+# All four word lists matched as whole words in one pass
+SCANNER = PhraseScanner({
+    'positive': POSITIVE_WORDS,
+    'negative': NEGATIVE_WORDS,
+    'hedging': HEDGING_WORDS,
+    'certainty': CERTAINTY_WORDS,
+}, whole_words=True)
 
 
 def fetch_transcript(symbol: str, year: int, quarter: int) -> Optional[Dict]:
-    """Fetch earnings call transcript from FMP"""
-    api_key = get_api_key()
-    url = f"https://financialmodelingprep.com/stable/earning-call-transcript?symbol={symbol}&year={year}&quarter={quarter}&apikey={api_key}"
-    
-    try:
-        with urllib.request.urlopen(url, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
-            if data and len(data) > 0:
-                return data[0]
-    except Exception as e:
-        print(f"Error fetching transcript: {e}", file=sys.stderr)
-    return None
+    """Earnings call transcript from the local corpus (fetched from FMP once)"""
+    return transcript_corpus.get(symbol, year, quarter)
 
 
-def extract_qa_section(content: str) -> str:
-    """Extract Q&A section from transcript (more revealing than prepared remarks)"""
+def find_qa_start(content: str) -> int:
+    """Offset where the Q&A section (more revealing than prepared remarks) begins"""
     # Common Q&A markers
     qa_markers = [
         r'question.and.answer',
@@ -117,22 +101,35 @@ def extract_qa_section(content: str) -> str:
     for marker in qa_markers:
         match = re.search(marker, content, re.IGNORECASE)
         if match:
-            return content[match.start():]
+            return match.start()
     
-    # Fallback: return second half (usually Q&A)
-    return content[len(content)//2:]
+    # Fallback: second half (usually Q&A)
+    return len(content)//2
+
+
+def extract_qa_section(content: str) -> str:
+    """Extract Q&A section from transcript (more revealing than prepared remarks)"""
+    return content[find_qa_start(content):]
+
+
+def count_words(text: str) -> int:
+    return len(WORD_RE.findall(text.lower()))
 
 
-def analyze_sentiment(text: str) -> Dict:
-    """Analyze sentiment using Loughran-McDonald word lists"""
-    words = re.findall(r'\b[a-z]+\b', text.lower())
-    word_count = len(words)
+def analyze_sentiment(text: str, counts: Dict[str, int] = None, word_count: int = None) -> Dict:
+    """Analyze sentiment using Loughran-McDonald word lists
+
+    counts/word_count: precomputed SCANNER counts and word count for text
+    """
+    if word_count is None:
+        word_count = count_words(text)
     
     if word_count == 0:
         return {'positive': 0, 'negative': 0, 'net': 0}
     
-    pos_count = sum(1 for w in words if w in POSITIVE_WORDS)
-    neg_count = sum(1 for w in words if w in NEGATIVE_WORDS)
+    counts = counts or SCANNER.count(text)
+    pos_count = counts['positive']
+    neg_count = counts['negative']
     
     pos_pct = (pos_count / word_count) * 100
     neg_pct = (neg_count / word_count) * 100
@@ -148,16 +145,17 @@ def analyze_sentiment(text: str) -> Dict:
     }
 
 
-def analyze_certainty(text: str) -> Dict:
+def analyze_certainty(text: str, counts: Dict[str, int] = None, word_count: int = None) -> Dict:
     """Analyze hedging vs certainty language"""
-    words = re.findall(r'\b[a-z]+\b', text.lower())
-    word_count = len(words)
+    if word_count is None:
+        word_count = count_words(text)
     
     if word_count == 0:
         return {'hedging': 0, 'certainty': 0, 'ratio': 0}
     
-    hedge_count = sum(1 for w in words if w in HEDGING_WORDS)
-    cert_count = sum(1 for w in words if w in CERTAINTY_WORDS)
+    counts = counts or SCANNER.count(text)
+    hedge_count = counts['hedging']
+    cert_count = counts['certainty']
     
     hedge_pct = (hedge_count / word_count) * 100
     cert_pct = (cert_count / word_count) * 100
@@ -197,22 +195,26 @@ def analyze_transcript(symbol: str, year: int, quarter: int) -> Dict:
         return {'error': f'No transcript found for {symbol} {year} Q{quarter}'}
     
     content = transcript.get('content', '')
-    qa_section = extract_qa_section(content)
+    qa_start = find_qa_start(content)
+    
+    # One pass for every word list, counted per section
+    scan = SCANNER.scan(content, sections={'prepared': (0, qa_start), 'qa': (qa_start, len(content))})
+    prepared_words = count_words(content[:qa_start])
+    qa_words = count_words(content[qa_start:])
     
     # Analyze full transcript
-    full_sentiment = analyze_sentiment(content)
-    full_certainty = analyze_certainty(content)
+    full_sentiment = analyze_sentiment(content, scan.counts, prepared_words + qa_words)
+    full_certainty = analyze_certainty(content, scan.counts, prepared_words + qa_words)
     
     # Analyze Q&A section separately
-    qa_sentiment = analyze_sentiment(qa_section)
-    qa_certainty = analyze_certainty(qa_section)
+    qa_sentiment = analyze_sentiment(content[qa_start:], scan.section('qa'), qa_words)
+    qa_certainty = analyze_certainty(content[qa_start:], scan.section('qa'), qa_words)
     
     # Key phrases
     key_phrases = extract_key_phrases(content)
     
     # Management vs Q&A gap (prepared remarks tend to be more positive)
-    prepared = content[:len(content) - len(qa_section)]
-    prepared_sentiment = analyze_sentiment(prepared)
+    prepared_sentiment = analyze_sentiment(content[:qa_start], scan.section('prepared'), prepared_words)
     sentiment_gap = prepared_sentiment['net'] - qa_sentiment['net']
     
     return {
@@ -264,19 +266,11 @@ def generate_signals(full: Dict, qa: Dict, certainty: Dict, gap: float) -> List[
 
 def compare_quarters(symbol: str, quarters: int = 4) -> List[Dict]:
     """Compare sentiment across multiple quarters"""
-    import datetime
-    
     results = []
-    current_year = datetime.datetime.now().year
-    current_quarter = (datetime.datetime.now().month - 1) // 3 + 1
+    periods = transcript_corpus.recent_quarters(quarters)
+    transcript_corpus.prefetch(symbol, periods)
     
-    for i in range(quarters):
-        q = current_quarter - i
-        y = current_year
-        while q <= 0:
-            q += 4
-            y -= 1
-        
+    for y, q in periods:
         analysis = analyze_transcript(symbol, y, q)
         if 'error' not in analysis:
             results.append({
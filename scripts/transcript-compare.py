@@ -20,11 +20,14 @@ import os
 import sys
 import json
 import re
-import urllib.request
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+import transcript_corpus
+import phrase_scanner
+from phrase_scanner import PhraseScanner
+
 # Word lists
 HEDGING_PHRASES = [
     'we believe', 'we think', 'we expect', 'we hope', 'we anticipate',
@@ -50,39 +53,33 @@ DEFLECTION_PHRASES = [
     "we're not going to provide", "can't comment on", "we don't disclose"
 ]
 
-
-def get_api_key() -> str:
-    env = Path.home() / '.secure/fmp.env'
-    with open(env) as f:
-        for line in f:
-            if line.startswith('FMP_API_KEY='):
-                return line.split('=', 1)[1].strip()
-    raise ValueError("FMP_API_KEY not found")
+SCANNER = PhraseScanner({
+    'hedging': HEDGING_PHRASES,
+    'conviction': CONVICTION_PHRASES,
+    'excuse': EXCUSE_PHRASES,
+    'deflection': DEFLECTION_PHRASES,
+})
 
 
 def fetch_transcript(symbol: str, year: int, quarter: int) -> Optional[Dict]:
-    api_key = get_api_key()
-    url = f"https://financialmodelingprep.com/stable/earning-call-transcript?symbol={symbol}&year={year}&quarter={quarter}&apikey={api_key}"
-    try:
-        with urllib.request.urlopen(url, timeout=20) as r:
-            data = json.loads(r.read())
-            return data[0] if data else None
-    except:
-        return None
+    return transcript_corpus.get(symbol, year, quarter)
 
 
 def count_phrases(text: str, phrases: List[str]) -> int:
-    text_lower = text.lower()
-    return sum(text_lower.count(p) for p in phrases)
+    return phrase_scanner.count_phrases(text, phrases)
 
 
-def extract_qa(content: str) -> str:
+def find_qa_start(content: str) -> int:
     markers = [r'question.and.answer', r'q\s*&\s*a', r'your first question']
     for m in markers:
         match = re.search(m, content, re.IGNORECASE)
         if match:
-            return content[match.start():]
-    return content[len(content)//2:]
+            return match.start()
+    return len(content)//2
+
+
+def extract_qa(content: str) -> str:
+    return content[find_qa_start(content):]
 
 
 def analyze_quarter(symbol: str, year: int, quarter: int) -> Optional[Dict]:
@@ -91,14 +88,16 @@ def analyze_quarter(symbol: str, year: int, quarter: int) -> Optional[Dict]:
         return None
     
     content = t.get('content', '')
-    qa = extract_qa(content)
+    qa_start = find_qa_start(content)
     words = len(content.split())
     
-    hedging = count_phrases(content, HEDGING_PHRASES)
-    conviction = count_phrases(content, CONVICTION_PHRASES)
-    excuses = count_phrases(content, EXCUSE_PHRASES)
-    deflections = count_phrases(qa, DEFLECTION_PHRASES)
-    questions = qa.count('?')
+    # One pass over the transcript for every lexicon
+    scan = SCANNER.scan(content, sections={'qa': (qa_start, len(content))})
+    hedging = scan.counts['hedging']
+    conviction = scan.counts['conviction']
+    excuses = scan.counts['excuse']
+    deflections = scan.section('qa')['deflection']
+    questions = content.count('?', qa_start)
     
     return {
         'period': f"{year} Q{quarter}",
@@ -115,18 +114,18 @@ def analyze_quarter(symbol: str, year: int, quarter: int) -> Optional[Dict]:
 def compare_quarters(symbol: str, num_quarters: int = 4) -> Dict:
     print(f"📊 Analyzing {symbol} last {num_quarters} quarters...\n")
     
-    now = datetime.now()
     results = []
     
-    # Generate quarter list (going backwards)
-    q = (now.month - 1) // 3 + 1
-    y = now.year
+    # Quarter list going backwards, extra in case some are missing;
+    # anything not in the local corpus is fetched concurrently up front
+    periods = transcript_corpus.recent_quarters(num_quarters + 2)
+    transcript_corpus.prefetch(symbol, periods)
     
-    for _ in range(num_quarters + 2):  # Try extra in case some missing
+    for y, q in periods:
         if len(results) >= num_quarters:
             break
         
-        print(f"  Fetching {y} Q{q}...", end=" ")
+        print(f"  Loading {y} Q{q}...", end=" ")
         analysis = analyze_quarter(symbol, y, q)
         
         if analysis:
@@ -134,11 +133,6 @@ def compare_quarters(symbol: str, num_quarters: int = 4) -> Dict:
             results.append(analysis)
         else:
             print("❌ not found")
-        
-        q -= 1
-        if q <= 0:
-            q = 4
-            y -= 1
     
     if len(results) < 2:
         return {'error': 'Not enough transcripts found', 'symbol': symbol}
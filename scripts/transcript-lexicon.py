@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Transcript Lexicon Table
+========================
+
+Runs the deep-analyzer lexicons (hedging, conviction, excuses, ownership,
+deflection, guidance specificity) over every transcript in the local corpus
+(transcript_corpus) and keeps a compact symbol x quarter x metric table.
+
+- Scoring is CPU-bound, so transcripts are scored in a process pool
+- Incremental: only transcripts that are new or changed since the last run
+  (or every transcript, when the lexicons change) are rescored
+- Cross-company questions ("which watchlist names hedged more this
+  quarter?") become a lookup instead of a re-analysis
+
+Table: ~/.openclaw/workspace/memory/transcripts/lexicon-table.json
+
+Usage:
+    python3 scripts/transcript-lexicon.py update [--workers N] [--full]
+    python3 scripts/transcript-lexicon.py changes [METRIC] [--watchlist | --symbols NVDA,AMD] [--top N]
+    python3 scripts/transcript-lexicon.py show NVDA
+    python3 scripts/transcript-lexicon.py export table.csv [--watchlist | --symbols ...]
+    python3 scripts/transcript-lexicon.py export table.json
+"""
+
+import os
+import sys
+import csv
+import gzip
+import json
+import time
+import hashlib
+import importlib.util
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+import transcript_corpus
+import batch_runner
+
+SCRIPTS_DIR = Path(__file__).parent
+TABLE_FILE = transcript_corpus.CORPUS_DIR / 'lexicon-table.json'
+DEFAULT_METRIC = 'hedging_per_1k'
+MAX_WORKERS = os.cpu_count() or 2
+
+_modules = {}
+
+
+def load_script(name: str):
+    """Import a hyphenated sibling script as a module."""
+    if name not in _modules:
+        spec = importlib.util.spec_from_file_location(name.replace('-', '_'), SCRIPTS_DIR / f'{name}.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+
+def lexicon_version() -> str:
+    """Changes whenever a deep-analyzer lexicon or the metric set changes."""
+    analyzer = load_script('deep-analyzer')
+    spec = {'lexicons': {k: list(v) for k, v in analyzer.LEXICONS.items()},
+            'metrics': list(analyzer.transcript_metrics('').keys())}
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:12]
+
+
+# === Table storage ===
+
+def row_key(symbol: str, year: int, quarter: int) -> str:
+    return f"{symbol}|{year}Q{quarter}"
+
+
+def load_table() -> Dict:
+    try:
+        return json.loads(TABLE_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {'version': None, 'rows': {}}
+
+
+def save_table(table: Dict) -> None:
+    TABLE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = TABLE_FILE.with_suffix(f'.tmp{os.getpid()}')
+    tmp.write_text(json.dumps(table, separators=(',', ':')))
+    os.replace(tmp, TABLE_FILE)
+
+
+# === Scoring ===
+
+def _score(job: Tuple[str, int, int, str]) -> Tuple[str, Optional[Dict]]:
+    """Worker: score one stored transcript. Runs in a pool process."""
+    symbol, year, quarter, path = job
+    try:
+        with gzip.open(path, 'rt') as f:
+            transcript = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return row_key(symbol, year, quarter), None
+    metrics = load_script('deep-analyzer').transcript_metrics(transcript.get('content', ''))
+    return row_key(symbol, year, quarter), {
+        'symbol': symbol,
+        'period': f"{year}Q{quarter}",
+        'date': (transcript.get('date') or '')[:10],
+        'metrics': metrics,
+    }
+
+
+def update(workers: int = MAX_WORKERS, full: bool = False) -> Dict:
+    """Score new/changed transcripts into the table. Returns run stats."""
+    table = load_table()
+    version = lexicon_version()
+    if full or table.get('version') != version:
+        table = {'version': version, 'rows': {}}
+    rows = table['rows']
+
+    jobs, stamps, seen = [], {}, set()
+    for symbol, year, quarter, path in transcript_corpus.iter_corpus():
+        key = row_key(symbol, year, quarter)
+        seen.add(key)
+        st = path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        if rows.get(key, {}).get('stamp') != stamp:
+            jobs.append((symbol, year, quarter, str(path)))
+            stamps[key] = stamp
+
+    removed = [key for key in rows if key not in seen]
+    for key in removed:
+        del rows[key]
+
+    failed = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as pool:
+            for key, row in pool.map(_score, jobs, chunksize=8):
+                if row is None:
+                    failed += 1
+                    continue
+                row['stamp'] = stamps[key]
+                rows[key] = row
+
+    if jobs or removed:
+        save_table(table)
+    return {'scored': len(jobs) - failed, 'failed': failed, 'removed': len(removed), 'rows': len(rows)}
+
+
+# === Queries ===
+
+def select(table: Dict, symbols: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+    """symbol -> rows sorted oldest quarter first."""
+    wanted = set(symbols) if symbols else None
+    out: Dict[str, List[Dict]] = {}
+    for row in table.get('rows', {}).values():
+        if wanted is None or row['symbol'] in wanted:
+            out.setdefault(row['symbol'], []).append(row)
+    for rows in out.values():
+        rows.sort(key=lambda r: r['period'])
+    return out
+
+
+def quarter_changes(table: Dict, metric: str = DEFAULT_METRIC,
+                    symbols: Optional[List[str]] = None) -> List[Dict]:
+    """Latest vs prior quarter for each symbol, biggest increase first."""
+    changes = []
+    for symbol, rows in select(table, symbols).items():
+        if len(rows) < 2:
+            continue
+        prev, last = rows[-2], rows[-1]
+        if metric not in last['metrics'] or metric not in prev['metrics']:
+            continue
+        changes.append({
+            'symbol': symbol,
+            'from': prev['period'],
+            'to': last['period'],
+            'prev': prev['metrics'][metric],
+            'last': last['metrics'][metric],
+            'change': round(last['metrics'][metric] - prev['metrics'][metric], 2),
+        })
+    changes.sort(key=lambda c: c['change'], reverse=True)
+    return changes
+
+
+def export(table: Dict, path: Path, symbols: Optional[List[str]] = None) -> int:
+    """Write the table as CSV (one row per symbol-quarter) or nested JSON. Returns row count."""
+    selected = select(table, symbols)
+    rows = [r for sym in sorted(selected) for r in selected[sym]]
+    metrics = list(rows[0]['metrics']) if rows else []
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.csv':
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['symbol', 'period', 'date'] + metrics)
+            for r in rows:
+                writer.writerow([r['symbol'], r['period'], r['date']] + [r['metrics'].get(m) for m in metrics])
+    else:
+        nested = {sym: {r['period']: dict(r['metrics'], date=r['date']) for r in rs}
+                  for sym, rs in selected.items()}
+        path.write_text(json.dumps({'version': table.get('version'), 'metrics': metrics,
+                                    'symbols': nested}, indent=2))
+    return len(rows)
+
+
+def symbol_filter(argv: List[str]) -> Optional[List[str]]:
+    if '--watchlist' in argv:
+        return [t.upper() for t in load_script('watchlist-tracker').load_watchlist().get('tickers', [])]
+    spec = batch_runner.option(argv, '--symbols')
+    return batch_runner.parse_symbols(spec) if spec else None
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    cmd = args[0]
+
+    if cmd == 'update':
+        t0 = time.perf_counter()
+        workers = int(batch_runner.option(args, '--workers', MAX_WORKERS))
+        stats = update(workers, full='--full' in args)
+        print(f"📚 {stats['rows']} transcripts in table: {stats['scored']} scored, "
+              f"{stats['removed']} removed, {stats['failed']} unreadable "
+              f"({time.perf_counter() - t0:.2f}s)")
+
+    elif cmd == 'changes':
+        metric = args[1] if len(args) > 1 and not args[1].startswith('--') else DEFAULT_METRIC
+        top = int(batch_runner.option(args, '--top', 20))
+        changes = quarter_changes(load_table(), metric, symbol_filter(args))
+        if not changes:
+            print("No symbols with two scored quarters (run: transcript-lexicon.py update)")
+            return
+        print(f"📈 {metric}: latest vs prior quarter\n")
+        print(f"{'Symbol':<8} {'From':<8} {'To':<8} {'Prev':>8} {'Last':>8} {'Change':>8}")
+        print("-" * 54)
+        for c in changes[:top]:
+            print(f"{c['symbol']:<8} {c['from']:<8} {c['to']:<8} {c['prev']:>8.2f} {c['last']:>8.2f} {c['change']:>+8.2f}")
+
+    elif cmd == 'show' and len(args) > 1:
+        rows = select(load_table(), [args[1].upper()]).get(args[1].upper(), [])
+        if not rows:
+            print(f"No scored transcripts for {args[1].upper()}")
+            return
+        metrics = list(rows[0]['metrics'])
+        print(f"{'Metric':<26}" + ''.join(f"{r['period']:>10}" for r in rows))
+        for m in metrics:
+            print(f"{m:<26}" + ''.join(f"{r['metrics'][m]:>10}" for r in rows))
+
+    elif cmd == 'export' and len(args) > 1:
+        path = Path(args[1]).expanduser()
+        n = export(load_table(), path, symbol_filter(args))
+        print(f"✅ {n} rows → {path}")
+
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Transcript Corpus
+=================
+
+Local, permanent store of earnings call transcripts (FMP), shared by
+transcript-compare, transcript-analyzer and deep-analyzer.
+
+    ~/.openclaw/workspace/memory/transcripts/NVDA/2025Q3.json.gz
+
+- Transcripts never change once published, so a stored quarter is never
+  re-fetched
+- Quarters that aren't out yet are remembered as missing for MISSING_TTL,
+  then retried
+- Missing quarters are prefetched concurrently (market_http caps FMP
+  concurrency and rate)
+
+Usage:
+    import transcript_corpus
+    t = transcript_corpus.get('NVDA', 2025, 3)               # dict or None
+    ts = transcript_corpus.latest('NVDA', 4)                  # newest first, fetched in parallel
+    transcript_corpus.prefetch('NVDA', transcript_corpus.recent_quarters(8))
+
+    python3 scripts/transcript_corpus.py prefetch NVDA AMD --quarters 8
+    python3 scripts/transcript_corpus.py --status
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+import market_http
+
+CORPUS_DIR = Path.home() / '.openclaw/workspace/memory/transcripts'
+TRANSCRIPT_URL = "https://financialmodelingprep.com/stable/earning-call-transcript"
+MISSING_TTL = 24 * 3600     # Re-check an unpublished quarter after a day
+PREFETCH_WORKERS = 6
+
+Period = Tuple[int, int]
+
+_missing_lock = threading.Lock()
+
+
+def load_key() -> Optional[str]:
+    key = os.environ.get('FMP_API_KEY')
+    if key:
+        return key
+    for path in (Path.home() / '.secure/fmp.env', Path('.secure/fmp.env')):
+        if path.exists():
+            for line in path.read_text().splitlines():
+                if line.startswith('FMP_API_KEY='):
+                    return line.split('=', 1)[1].strip().strip('"\'')
+    return None
+
+
+def recent_quarters(n: int, now: Optional[datetime] = None) -> List[Period]:
+    """(year, quarter) for the current quarter and the n-1 before it, newest first."""
+    now = now or datetime.now()
+    y, q = now.year, (now.month - 1) // 3 + 1
+    periods = []
+    for _ in range(n):
+        periods.append((y, q))
+        q -= 1
+        if q <= 0:
+            q, y = 4, y - 1
+    return periods
+
+
+# === Storage ===
+
+def _path(symbol: str, year: int, quarter: int) -> Path:
+    return CORPUS_DIR / symbol.upper() / f"{year}Q{quarter}.json.gz"
+
+
+def _missing_path(symbol: str) -> Path:
+    return CORPUS_DIR / symbol.upper() / 'missing.json'
+
+
+def read(symbol: str, year: int, quarter: int) -> Optional[Dict]:
+    """Stored transcript or None (no network)."""
+    path = _path(symbol, year, quarter)
+    if not path.exists():
+        return None
+    try:
+        with gzip.open(path, 'rt') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write(symbol: str, year: int, quarter: int, transcript: Dict) -> None:
+    path = _path(symbol, year, quarter)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.tmp{os.getpid()}.{threading.get_ident()}')
+    with gzip.open(tmp, 'wt') as f:
+        json.dump(transcript, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def _known_missing(symbol: str, year: int, quarter: int) -> bool:
+    try:
+        checked = json.loads(_missing_path(symbol).read_text()).get(f"{year}Q{quarter}", 0)
+    except (OSError, json.JSONDecodeError):
+        return False
+    return time.time() - checked < MISSING_TTL
+
+
+def _mark_missing(symbol: str, year: int, quarter: int) -> None:
+    path = _missing_path(symbol)
+    with _missing_lock:
+        try:
+            missing = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            missing = {}
+        missing[f"{year}Q{quarter}"] = time.time()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(missing))
+
+
+# === Fetch ===
+
+def fetch(symbol: str, year: int, quarter: int) -> Optional[Dict]:
+    """Download one transcript from FMP and store it. None if not published."""
+    key = load_key()
+    if not key:
+        raise ValueError("FMP_API_KEY not found")
+    try:
+        data = market_http.get_json(TRANSCRIPT_URL, {'symbol': symbol.upper(), 'year': year,
+                                                     'quarter': quarter, 'apikey': key},
+                                    provider='fmp', timeout=30)
+    except market_http.HttpError as e:
+        if e.status == 404:
+            data = []
+        else:
+            raise
+    if isinstance(data, list) and data and data[0].get('content'):
+        write(symbol, year, quarter, data[0])
+        return data[0]
+    _mark_missing(symbol, year, quarter)
+    return None
+
+
+def get(symbol: str, year: int, quarter: int, refresh_missing: bool = False) -> Optional[Dict]:
+    """Transcript from the corpus, fetching it once if absent."""
+    t = read(symbol, year, quarter)
+    if t is not None:
+        return t
+    if not refresh_missing and _known_missing(symbol, year, quarter):
+        return None
+    try:
+        return fetch(symbol, year, quarter)
+    except Exception as e:
+        print(f"Error fetching transcript {symbol} {year} Q{quarter}: {e}", file=sys.stderr)
+        return None
+
+
+def prefetch(symbol: str, periods: List[Period], workers: int = PREFETCH_WORKERS) -> Dict[Period, Optional[Dict]]:
+    """Transcripts for every period; absent ones fetched concurrently."""
+    out = {p: read(symbol, *p) for p in periods}
+    todo = [p for p, t in out.items() if t is None]
+    if todo:
+        with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            for p, t in zip(todo, pool.map(lambda p: get(symbol, *p), todo)):
+                out[p] = t
+    return out
+
+
+def latest(symbol: str, n: int = 1, lookback: Optional[int] = None) -> List[Tuple[Period, Dict]]:
+    """Up to n most recent available transcripts, newest first.
+
+    Looks back over n + 2 quarters by default (the current quarter's call is
+    often not out yet).
+    """
+    periods = recent_quarters(lookback or n + 2)
+    found = prefetch(symbol, periods)
+    return [(p, found[p]) for p in periods if found[p] is not None][:n]
+
+
+def iter_corpus(symbol: Optional[str] = None) -> Iterator[Tuple[str, int, int, Path]]:
+    """(symbol, year, quarter, path) for every stored transcript."""
+    if not CORPUS_DIR.exists():
+        return
+    dirs = [CORPUS_DIR / symbol.upper()] if symbol else sorted(p for p in CORPUS_DIR.iterdir() if p.is_dir())
+    for d in dirs:
+        for path in sorted(d.glob('*Q*.json.gz')):
+            stem = path.name.split('.')[0]
+            year, quarter = stem.split('Q')
+            yield d.name, int(year), int(quarter), path
+
+
+def status() -> Dict[str, Dict]:
+    out: Dict[str, Dict] = {}
+    for sym, year, quarter, path in iter_corpus():
+        s = out.setdefault(sym, {'quarters': [], 'bytes': 0})
+        s['quarters'].append(f"{year}Q{quarter}")
+        s['bytes'] += path.stat().st_size
+    return out
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    if args[0] == 'prefetch':
+        quarters = 8
+        if '--quarters' in args:
+            i = args.index('--quarters')
+            quarters = int(args[i + 1])
+            args = args[:i] + args[i + 2:]
+        symbols = [s.upper() for a in args[1:] for s in a.split(',') if s]
+        t0 = time.perf_counter()
+        periods = recent_quarters(quarters)
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(symbols)))) as pool:
+            results = dict(zip(symbols, pool.map(lambda s: prefetch(s, periods), symbols)))
+        for sym, found in results.items():
+            have = [f"{y}Q{q}" for (y, q), t in found.items() if t]
+            print(f"✅ {sym:<6} {len(have)}/{len(periods)} quarters  {' '.join(have)}")
+        print(f"⏱️ {time.perf_counter() - t0:.2f}s")
+    elif args[0] == '--status':
+        s = status()
+        total = sum(v['bytes'] for v in s.values())
+        print(f"📚 Transcript corpus: {sum(len(v['quarters']) for v in s.values())} transcripts, "
+              f"{len(s)} symbols, {total / 1024:.0f} KB")
+        for sym, v in sorted(s.items()):
+            print(f"   {sym:<6} {len(v['quarters']):>3}  {' '.join(sorted(v['quarters'])[-8:])}")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
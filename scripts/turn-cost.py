@@ -19,11 +19,16 @@ Usage:
     python3 scripts/turn-cost.py estimate -o 500  # Estimate for 500 char output
 """
 
+import sys
 import argparse
-import json
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+import session_tail
+from session_tail import SessionTail, COST_BUCKETS
+from cost_rollup import CostRollup, BUCKET_COLS
+
 # Opus pricing per 1M tokens (corrected)
 PRICE_INPUT = 15.00
 PRICE_CACHE_READ = 1.50  # 0.1× input (was incorrectly 1.875)
@@ -47,24 +52,12 @@ def get_real_costs(last_n: int = 5) -> list:
     if not session:
         return []
     
-    costs = []
-    with open(session) as f:
-        for line in f:
-            try:
-                d = json.loads(line)
-                if 'message' in d and 'usage' in d['message']:
-                    u = d['message']['usage']
-                    c = u.get('cost', {})
-                    if c.get('total'):
-                        costs.append({
-                            'cost': c['total'],
-                            'input': u.get('input', 0),
-                            'output': u.get('output', 0),
-                            'cache_read': u.get('cacheRead', 0),
-                            'cache_write': u.get('cacheWrite', 0),
-                        })
-            except:
-                pass
+    agg = SessionTail().update([session])[session.name]
+    costs = agg['recent']
+    if last_n > len(costs) and agg['turns'] > len(costs):
+        # Older than the kept per-turn window: full read
+        costs = [{k: t[k] for k in ('cost', 'input', 'output', 'cache_read', 'cache_write')}
+                 for t in session_tail.iter_usage(session)]
     
     return costs[-last_n:] if costs else []
 
@@ -74,34 +67,19 @@ def get_session_stats() -> dict:
     if not session:
         return {}
     
-    costs = []
-    with open(session) as f:
-        for line in f:
-            try:
-                d = json.loads(line)
-                if 'message' in d and 'usage' in d['message']:
-                    c = d['message']['usage'].get('cost', {}).get('total', 0)
-                    if c > 0:
-                        costs.append(c)
-            except:
-                pass
-    
-    if not costs:
+    db = CostRollup()
+    db.update()
+    row = db.session(session.stem)
+    if not row or not row['turns']:
         return {}
     
     return {
-        'turns': len(costs),
-        'total': sum(costs),
-        'avg': sum(costs) / len(costs),
-        'min': min(costs),
-        'max': max(costs),
-        'distribution': {
-            '<$0.10': sum(1 for c in costs if c < 0.10),
-            '$0.10-0.20': sum(1 for c in costs if 0.10 <= c < 0.20),
-            '$0.20-0.50': sum(1 for c in costs if 0.20 <= c < 0.50),
-            '$0.50-1.00': sum(1 for c in costs if 0.50 <= c < 1.00),
-            '>$1.00': sum(1 for c in costs if c >= 1.00),
-        }
+        'turns': row['turns'],
+        'total': row['cost'],
+        'avg': row['cost'] / row['turns'],
+        'min': row['min_cost'],
+        'max': row['max_cost'],
+        'distribution': {label: row[col] for (label, _), col in zip(COST_BUCKETS, BUCKET_COLS)}
     }
 
 def estimate_cost(output_chars: int, input_chars: int = 100, 
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Vector Search
+=============
+
+Exact top-k cosine search over a pre-normalized embedding matrix.
+
+All chunks are scored with a single matrix product and the top-k are picked
+with np.argpartition (O(n)) instead of sorting every score. Several queries
+can be scored in one call — useful for heartbeat jobs that run a batch of
+recall queries.
+
+Usage:
+    from vector_search import VectorIndex
+    index = VectorIndex(matrix, normalized=True)
+    hits = index.search(query_vec, top_k=5, min_score=0.3)        # [(score, row), ...]
+    batch = index.search_batch(query_matrix, top_k=5)              # one hit list per query
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+def normalize_rows(matrix) -> np.ndarray:
+    """L2-normalize each row (float32). Zero rows stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest scores, best first, via partial selection."""
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind='stable')]
+
+
+class VectorIndex:
+    """Brute-force exact index. Rows are unit vectors, so dot product = cosine."""
+
+    def __init__(self, matrix, normalized: bool = False):
+        matrix = np.asarray(matrix, dtype=np.float32)
+        self.matrix = matrix if normalized else normalize_rows(matrix)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0] if self.matrix.ndim == 2 else 0
+
+    def search(self, query, top_k: int = 5, min_score: float = -1.0) -> List[Tuple[float, int]]:
+        """Top-k (score, row) pairs for a single query vector."""
+        return self.search_batch(np.asarray(query).reshape(1, -1), top_k, min_score)[0]
+
+    def search_batch(self, queries, top_k: int = 5, min_score: float = -1.0) -> List[List[Tuple[float, int]]]:
+        """Top-k (score, row) pairs for each row of a (q, dim) query matrix."""
+        queries = normalize_rows(queries)
+        if len(self) == 0:
+            return [[] for _ in range(queries.shape[0])]
+
+        scores = queries @ self.matrix.T  # (q, n)
+        results = []
+        for row in scores:
+            hits = []
+            for i in top_k_indices(row, top_k):
+                score = float(row[i])
+                if score < min_score:
+                    break  # sorted best first
+                hits.append((score, int(i)))
+            results.append(hits)
+        return results
@@ -26,6 +26,9 @@ import os
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+import quote_engine
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -79,18 +82,9 @@ def fmp_request(endpoint: str, params: dict = None) -> any:
 
 
 def get_quotes(symbols: list) -> dict:
-    """Get batch quotes for multiple symbols."""
-    results = {}
-    
-    # FMP stable API needs individual requests
-    for symbol in symbols:
-        data = fmp_request("quote", {"symbol": symbol})
-        if isinstance(data, list) and data:
-            results[symbol] = data[0]
-        elif isinstance(data, dict) and 'symbol' in data:
-            results[symbol] = data
-    
-    return results
+    """Get batch quotes for multiple symbols (one batch-quote call where supported)."""
+    quotes = quote_engine.get_quotes(symbols, api_key=get_api_key())
+    return {symbol: quotes[symbol.upper()].raw for symbol in symbols if symbol.upper() in quotes}
 
 
 def get_news(symbol: str, limit: int = 2) -> list:
@@ -17,10 +17,13 @@ Usage:
 import os
 import sys
 import json
-import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+import response_cache
+import quote_engine
+
 # Paths
 WORKSPACE = Path.home() / ".openclaw" / "workspace"
 WATCHLIST_FILE = WORKSPACE / "memory" / "watchlist.json"
@@ -68,26 +71,16 @@ def save_watchlist(data):
     WATCHLIST_FILE.write_text(json.dumps(data, indent=2))
 
 def get_quotes(tickers):
-    """Fetch quotes (individual requests for Starter tier compatibility)"""
+    """Fetch quotes (batch-quote where the tier allows, per-ticker fan-out otherwise)"""
     if not API_KEY:
         print("ERROR: FMP_API_KEY not found")
         return {}
     
-    results = {}
+    quotes = quote_engine.get_quotes(tickers, api_key=API_KEY)
     for ticker in tickers:
-        url = f"{BASE_URL}/quote?symbol={ticker}&apikey={API_KEY}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            if isinstance(data, list) and len(data) > 0:
-                results[ticker] = data[0]
-            elif isinstance(data, dict) and "symbol" in data:
-                results[ticker] = data
-        except Exception as e:
-            print(f"ERROR fetching {ticker}: {e}")
-    
-    return results
+        if ticker.upper() not in quotes:
+            print(f"ERROR fetching {ticker}: no quote")
+    return {ticker: quotes[ticker.upper()].raw for ticker in tickers if ticker.upper() in quotes}
 
 def get_earnings_calendar(from_date, to_date):
     """Get earnings calendar"""
@@ -96,40 +89,29 @@ def get_earnings_calendar(from_date, to_date):
     
     # Try stable endpoint first, fall back to v3
     urls = [
-        f"{BASE_URL}/earning-calendar?from={from_date}&to={to_date}&apikey={API_KEY}",
-        f"https://financialmodelingprep.com/api/v3/earning_calendar?from={from_date}&to={to_date}&apikey={API_KEY}",
+        f"{BASE_URL}/earning-calendar",
+        "https://financialmodelingprep.com/api/v3/earning_calendar",
     ]
+    params = {'from': from_date, 'to': to_date, 'apikey': API_KEY}
     
     for url in urls:
         try:
-            resp = requests.get(url, timeout=10)
-            if resp.status_code == 200:
-                return resp.json()
+            return response_cache.get_json(url, params, provider='fmp')
         except Exception:
             continue
     
     print("ERROR: Could not fetch earnings calendar")
     return []
 
-def check_prices(quiet=False, as_json=False):
-    """Check prices and alert on significant moves.
+def evaluate_prices(wl, quotes):
+    """Apply the daily-move rule to a quote snapshot.
     
-    Args:
-        quiet: Only return alerts (for cron jobs)
-        as_json: Return JSON output
+    Updates wl["last_prices"] in place (caller saves).
     
     Returns:
-        dict with 'alerts', 'summary', and 'quotes'
+        (alerts, summary, threshold)
     """
-    wl = load_watchlist()
     tickers = wl.get("tickers", [])
-    if not tickers:
-        return {"error": "No tickers in watchlist", "alerts": [], "summary": None}
-    
-    quotes = get_quotes(tickers)
-    if not quotes:
-        return {"error": "Failed to fetch quotes", "alerts": [], "summary": None}
-    
     threshold = wl.get("thresholds", {}).get("daily_move_pct", 3.0)
     last_prices = wl.get("last_prices", {})
     alerts = []
@@ -176,6 +158,28 @@ def check_prices(quiet=False, as_json=False):
     summary["losers"].sort(key=lambda x: x["change_pct"])
     
     wl["last_prices"] = last_prices
+    return alerts, summary, threshold
+
+def check_prices(quiet=False, as_json=False):
+    """Check prices and alert on significant moves.
+    
+    Args:
+        quiet: Only return alerts (for cron jobs)
+        as_json: Return JSON output
+    
+    Returns:
+        dict with 'alerts', 'summary', and 'quotes'
+    """
+    wl = load_watchlist()
+    tickers = wl.get("tickers", [])
+    if not tickers:
+        return {"error": "No tickers in watchlist", "alerts": [], "summary": None}
+    
+    quotes = get_quotes(tickers)
+    if not quotes:
+        return {"error": "Failed to fetch quotes", "alerts": [], "summary": None}
+    
+    alerts, summary, threshold = evaluate_prices(wl, quotes)
     save_watchlist(wl)
     
     # Log alerts
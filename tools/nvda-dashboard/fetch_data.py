@@ -12,6 +12,8 @@ import sys
 
 # Add workspace to path for imports
 sys.path.insert(0, os.path.expanduser('~/.openclaw/workspace'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+import price_store
 
 OUTPUT_FILE = os.path.join(os.path.dirname(__file__), 'data.json')
 
@@ -24,8 +26,8 @@ def fetch_nvda_data():
     # Current price and info
     info = nvda.info
     
-    # Historical data (6 months)
-    hist = nvda.history(period="6mo")
+    # Historical data (~6 months of trading days, from the local price store)
+    bars = price_store.history('NVDA', 126)
     
     # Get earnings dates
     try:
@@ -60,11 +62,11 @@ def fetch_nvda_data():
     
     # Build price history for chart
     price_history = []
-    for date, row in hist.iterrows():
+    for day, close, volume in zip(bars['date'], bars['close'], bars['volume']):
         price_history.append({
-            'date': str(date.date()),
-            'close': round(row['Close'], 2),
-            'volume': int(row['Volume'])
+            'date': price_store.to_iso(day),
+            'close': round(float(close), 2),
+            'volume': int(volume) if volume == volume else None  # NaN when the source had none
         })
     
     # Compile dashboard data